@@ -14,52 +14,64 @@
 import flet as ft
 import datetime
 
+# 「昨日」判定に使用する1日分の差分
+_ONE_DAY = datetime.timedelta(days=1)
+
+# タグチップの先頭に表示するアイコン名
+_TAG_ICON_NAME = ft.icons.TAG
+
+# カードに表示するタグの最大数
+_MAX_VISIBLE_TAGS = 3
+
+# 本文プレビューの最大文字数
+_PREVIEW_LENGTH = 100
+
 class DiaryCard(ft.Card):
     """
     日記エントリーを表示するカードコンポーネント。
     ホーム画面やカレンダービューでエントリーのプレビューを表示します。
     """
     
-    def __init__(self, entry, on_click=None):
+    # 気分スコア（1-5）に対応する絵文字（インデックスは mood - 1）
+    _MOOD_EMOJIS = ("😞", "😕", "😐", "🙂", "😄")
+    
+    def __init__(self, entry, on_click=None, today=None):
         """
         DiaryCardクラスのコンストラクタ。
         
         Args:
             entry: 表示する日記エントリーオブジェクト
             on_click: カードがクリックされたときのコールバック関数
+            today (datetime.date, optional): 「今日」「昨日」の判定に使う日付。
+                複数のカードをまとめて構築する場合は呼び出し側で一度だけ計算して渡します。
         """
         super().__init__()
         
         self.entry = entry
         self.on_click = on_click
         
-        # 気分に対応する絵文字
-        self.mood_emojis = {
-            1: "😞",
-            2: "😕",
-            3: "😐",
-            4: "🙂",
-            5: "😄"
-        }
-        
         # カードの内容を構築
-        self._build_card()
+        self._build_card(today)
     
-    def _build_card(self):
+    def _build_card(self, today=None):
         """
         カードのコンテンツを構築します。
+        
+        Args:
+            today (datetime.date, optional): 基準となる今日の日付
         """
         # タイトルと日付
         title_text = self.entry.title if self.entry.title else "無題の日記"
         
         # 日付の表示形式
         date_obj = self.entry.created_at
-        today = datetime.datetime.now().date()
-        yesterday = today - datetime.timedelta(days=1)
+        today = today or datetime.date.today()
+        yesterday = today - _ONE_DAY
+        entry_date = date_obj.date()
         
-        if date_obj.date() == today:
+        if entry_date == today:
             date_str = "今日"
-        elif date_obj.date() == yesterday:
+        elif entry_date == yesterday:
             date_str = "昨日"
         else:
             date_str = f"{date_obj.year}年{date_obj.month}月{date_obj.day}日"
@@ -67,27 +79,30 @@ class DiaryCard(ft.Card):
         time_str = f"{date_obj.hour:02d}:{date_obj.minute:02d}"
         
         # 本文のプレビュー
-        # 最大100文字まで表示し、それ以上は「...」で省略
-        content_preview = self.entry.content[:100] + ("..." if len(self.entry.content) > 100 else "")
+        # 最大100文字まで表示し、それ以上は「…」で省略
+        content = self.entry.content
+        content_preview = content if len(content) <= _PREVIEW_LENGTH else f"{content[:_PREVIEW_LENGTH]}…"
         
         # 気分の絵文字
-        mood_emoji = self.mood_emojis.get(self.entry.mood, "😐")
+        mood = self.entry.mood
+        mood_emoji = self._MOOD_EMOJIS[mood - 1] if mood in (1, 2, 3, 4, 5) else "😐"
         
-        # タグのチップ
-        tag_chips = []
-        for tag in self.entry.tags[:3]:  # 最初の3つのタグのみ表示
-            tag_chips.append(
-                ft.Chip(
-                    label=ft.Text(tag),
-                    leading=ft.Icon(ft.icons.TAG),
-                )
+        # タグのチップ（最初の3つのタグのみ表示）
+        tags = self.entry.tags
+        tag_chips = [
+            ft.Chip(
+                label=ft.Text(tag),
+                leading=ft.Icon(_TAG_ICON_NAME),
             )
+            for tag in tags[:_MAX_VISIBLE_TAGS]
+        ]
         
         # タグが3つ以上ある場合は「+n」を表示
-        if len(self.entry.tags) > 3:
+        extra_tags = len(tags) - _MAX_VISIBLE_TAGS
+        if extra_tags > 0:
             tag_chips.append(
                 ft.Chip(
-                    label=ft.Text(f"+{len(self.entry.tags) - 3}"),
+                    label=ft.Text(f"+{extra_tags}"),
                 )
             )
         
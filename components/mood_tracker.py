@@ -12,6 +12,7 @@
 """
 
 import flet as ft
+from functools import partial
 
 class MoodTracker(ft.Container):
     """
@@ -19,6 +20,15 @@ class MoodTracker(ft.Container):
     5段階の気分スコアをボタンで選択できます。
     """
     
+    # 気分スコア（1-5）に対応する絵文字と説明（インデックスは mood - 1）
+    _MOOD_DATA = (
+        ("😞", "最悪"),
+        ("😕", "イマイチ"),
+        ("😐", "普通"),
+        ("🙂", "良い"),
+        ("😄", "最高"),
+    )
+    
     def __init__(self, on_mood_selected=None, initial_mood=None):
         """
         MoodTrackerクラスのコンストラクタ。
@@ -32,14 +42,9 @@ class MoodTracker(ft.Container):
         self.on_mood_selected = on_mood_selected
         self.selected_mood = initial_mood
         
-        # 気分スコアと絵文字・説明のマッピング
-        self.mood_data = {
-            1: {"emoji": "😞", "label": "最悪"},
-            2: {"emoji": "😕", "label": "イマイチ"},
-            3: {"emoji": "😐", "label": "普通"},
-            4: {"emoji": "🙂", "label": "良い"},
-            5: {"emoji": "😄", "label": "最高"}
-        }
+        # 気分ボタンとラベルの参照（選択状態の切り替えに使用）
+        self._buttons = {}
+        self._labels = {}
         
         # コンポーネントを構築
         self._build_tracker()
@@ -51,13 +56,17 @@ class MoodTracker(ft.Container):
         mood_buttons = []
         
         # 各気分スコアのボタンを作成
-        for mood_score, mood_info in self.mood_data.items():
-            emoji = mood_info["emoji"]
-            label = mood_info["label"]
-            
+        for mood_score, (emoji, label) in enumerate(self._MOOD_DATA, start=1):
             # 選択中かどうかで見た目を変える
             is_selected = self.selected_mood == mood_score
             
+            label_text = ft.Text(
+                label,
+                size=12,
+                text_align=ft.TextAlign.CENTER,
+                weight=ft.FontWeight.BOLD if is_selected else ft.FontWeight.NORMAL,
+            )
+            
             mood_button = ft.Container(
                 content=ft.Column([
                     ft.Text(
@@ -65,23 +74,20 @@ class MoodTracker(ft.Container):
                         size=30,
                         text_align=ft.TextAlign.CENTER,
                     ),
-                    ft.Text(
-                        label,
-                        size=12,
-                        text_align=ft.TextAlign.CENTER,
-                        weight=ft.FontWeight.BOLD if is_selected else ft.FontWeight.NORMAL,
-                    )
+                    label_text,
                 ], spacing=5, alignment=ft.MainAxisAlignment.CENTER, horizontal_alignment=ft.CrossAxisAlignment.CENTER),
                 width=50,
                 height=70,
                 border_radius=10,
                 bgcolor=ft.colors.PRIMARY_CONTAINER if is_selected else None,
                 border=ft.border.all(2, ft.colors.PRIMARY) if is_selected else None,
-                on_click=lambda e, score=mood_score: self._on_mood_button_click(score),
+                on_click=partial(self._on_mood_button_click, mood_score),
                 ink=True,
                 padding=5,
             )
             
+            self._buttons[mood_score] = mood_button
+            self._labels[mood_score] = label_text
             mood_buttons.append(mood_button)
         
         # 気分ボタンを水平に並べる
@@ -95,17 +101,38 @@ class MoodTracker(ft.Container):
             border=ft.border.all(1, ft.colors.OUTLINE_VARIANT),
         )
     
-    def _on_mood_button_click(self, mood_score):
+    def _set_button_selected(self, mood_score, is_selected):
+        """
+        指定された気分ボタンの選択状態の見た目を切り替えます。
+        
+        Args:
+            mood_score: 対象の気分スコア（1-5）
+            is_selected: 選択状態にするかどうか
+        """
+        button = self._buttons.get(mood_score)
+        if button is None:
+            return
+        
+        button.bgcolor = ft.colors.PRIMARY_CONTAINER if is_selected else None
+        button.border = ft.border.all(2, ft.colors.PRIMARY) if is_selected else None
+        self._labels[mood_score].weight = ft.FontWeight.BOLD if is_selected else ft.FontWeight.NORMAL
+    
+    def _on_mood_button_click(self, mood_score, e=None):
         """
         気分ボタンがクリックされたときのイベントハンドラ。
+        ウィジェットを再構築せず、前後の選択ボタンのプロパティのみを更新します。
         
         Args:
             mood_score: 選択された気分スコア（1-5）
+            e: イベントデータ
         """
+        if self.selected_mood is not None:
+            self._set_button_selected(self.selected_mood, False)
+        
         self.selected_mood = mood_score
+        self._set_button_selected(mood_score, True)
         
         # UIを更新
-        self._build_tracker()
         self.update()
         
         # コールバック関数があれば呼び出す
@@ -14,6 +14,25 @@
 import flet as ft
 import random
 
+# デフォルトのプロンプト（全カードで共有する不変のタプル）
+_DEFAULT_PROMPTS = (
+    "今日一番印象に残った出来事は何ですか？",
+    "最近感謝していることを3つ書いてみましょう",
+    "今週達成したい目標を書き出してみてください",
+    "今日の気分を色で表すと何色ですか？その理由は？",
+    "今日出会った人で印象に残った人について書いてみましょう",
+    "最近読んだ本や観た映画から得た気づきは？",
+    "今日の天気はあなたの気分にどう影響しましたか？",
+    "今週末にやりたいことを考えてみましょう",
+    "今日の自分を褒めたいところはどこですか？",
+    "明日の自分への応援メッセージを書いてみましょう",
+)
+
+# 「このお題で書く」ボタンのスタイル（全カードで共有）
+_WRITE_BUTTON_STYLE = ft.ButtonStyle(
+    shape=ft.RoundedRectangleBorder(radius=10),
+)
+
 class PromptCard(ft.Card):
     """
     日記のインスピレーションを提供するプロンプトカードコンポーネント。
@@ -31,27 +50,11 @@ class PromptCard(ft.Card):
         """
         super().__init__()
         
-        self.prompt = prompt
         self.on_write = on_write
         self.on_refresh = on_refresh
         
-        # デフォルトのプロンプトリスト
-        self.default_prompts = [
-            "今日一番印象に残った出来事は何ですか？",
-            "最近感謝していることを3つ書いてみましょう",
-            "今週達成したい目標を書き出してみてください",
-            "今日の気分を色で表すと何色ですか？その理由は？",
-            "今日出会った人で印象に残った人について書いてみましょう",
-            "最近読んだ本や観た映画から得た気づきは？",
-            "今日の天気はあなたの気分にどう影響しましたか？",
-            "今週末にやりたいことを考えてみましょう",
-            "今日の自分を褒めたいところはどこですか？",
-            "明日の自分への応援メッセージを書いてみましょう"
-        ]
-        
         # プロンプトが指定されていない場合はランダムに選択
-        if self.prompt is None:
-            self.prompt = random.choice(self.default_prompts)
+        self.prompt = prompt if prompt is not None else random.choice(_DEFAULT_PROMPTS)
         
         # カードの内容を構築
         self._build_card()
@@ -60,16 +63,19 @@ class PromptCard(ft.Card):
         """
         カードのコンテンツを構築します。
         """
+        # プロンプトテキスト（更新時は値のみ差し替える）
+        self._prompt_text = ft.Text(
+            self.prompt,
+            size=16,
+            italic=True,
+            text_align=ft.TextAlign.CENTER,
+        )
+        
         # カードのコンテンツ
         self.content = ft.Container(
             content=ft.Column([
                 # プロンプトテキスト
-                ft.Text(
-                    self.prompt,
-                    size=16,
-                    italic=True,
-                    text_align=ft.TextAlign.CENTER,
-                ),
+                self._prompt_text,
                 
                 # ボタンのコンテナ
                 ft.Container(
@@ -89,9 +95,7 @@ class PromptCard(ft.Card):
                             "このお題で書く",
                             icon=ft.icons.EDIT,
                             on_click=self._on_write_click,
-                            style=ft.ButtonStyle(
-                                shape=ft.RoundedRectangleBorder(radius=10),
-                            ),
+                            style=_WRITE_BUTTON_STYLE,
                         ),
                     ], alignment=ft.MainAxisAlignment.END),
                     margin=ft.margin.only(top=10),
@@ -112,13 +116,23 @@ class PromptCard(ft.Card):
             e: イベントデータ
         """
         # 新しいプロンプトをランダムに選択（前回と異なるもの）
-        old_prompt = self.prompt
-        while self.prompt == old_prompt and len(self.default_prompts) > 1:
-            self.prompt = random.choice(self.default_prompts)
+        # 現在のプロンプトを除いた範囲から1回の乱数で選ぶ
+        try:
+            current_index = _DEFAULT_PROMPTS.index(self.prompt)
+        except ValueError:
+            current_index = -1
         
-        # UIを更新
-        self._build_card()
-        self.update()
+        if current_index < 0:
+            self.prompt = random.choice(_DEFAULT_PROMPTS)
+        elif len(_DEFAULT_PROMPTS) > 1:
+            new_index = random.randrange(len(_DEFAULT_PROMPTS) - 1)
+            if new_index >= current_index:
+                new_index += 1
+            self.prompt = _DEFAULT_PROMPTS[new_index]
+        
+        # UIを更新（プロンプトテキストのみ）
+        self._prompt_text.value = self.prompt
+        self._prompt_text.update()
         
         # コールバック関数があれば呼び出す
         if self.on_refresh:
@@ -23,6 +23,7 @@ import flet as ft
 import os
 import sys
 import logging
+import logging.handlers
 from datetime import datetime
 
 # 内部モジュールのインポート
@@ -35,22 +36,45 @@ from models.diary_entry import DiaryEntryManager
 from utils.theme_manager import ThemeManager
 
 # ロギングの設定
+# ファイル出力はメモリ上でバッファリングし、UIスレッドでの同期的なディスク書き込みを減らす
+# （ERROR以上のログ、またはバッファが一杯になった時点でまとめて書き出す）
+_log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_file_handler = logging.FileHandler("diario.log")
+_file_handler.setFormatter(_log_formatter)
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.FileHandler("diario.log"),
+        logging.handlers.MemoryHandler(
+            capacity=100,
+            flushLevel=logging.ERROR,
+            target=_file_handler,
+        ),
         logging.StreamHandler()
     ]
 )
 logger = logging.getLogger(__name__)
 
+# ナビゲーションバーの並び順に対応するビュー名とその逆引き
+_VIEW_ORDER = ("home", "editor", "calendar", "analytics")
+_VIEW_INDEX = {name: index for index, name in enumerate(_VIEW_ORDER)}
+
+# 表示のたびに再構築が必要なビュー（アプリの状態から編集対象を読み込むため）
+_ALWAYS_REBUILD_VIEWS = frozenset({"editor"})
+
+# 今日の日付を表示に使うため、日付が変わったら再構築が必要なビュー
+_DATE_DEPENDENT_VIEWS = frozenset({"home", "calendar"})
+
 class DiarioApp:
     """
     Diarioアプリケーションのメインクラス。
     アプリケーションの状態管理とビュー間のナビゲーションを担当します。
     """
     
+    # テーマ切替ボタンのアイコン
+    _LIGHT_ICON = ft.icons.WB_SUNNY_OUTLINED
+    _DARK_ICON = ft.icons.NIGHTLIGHT_ROUND
+    
     def __init__(self):
         """
         DiarioAppクラスのコンストラクタ。
@@ -61,6 +85,16 @@ class DiarioApp:
         self.current_view = "home"
         self.views = {}
         
+        # ビュー間で受け渡す状態（編集対象のエントリーIDと選択中の気分）
+        self.current_entry_id = None
+        self.current_mood = None
+        
+        # 構築済みのビューのルートコントロール {ビュー名: (コントロール, (構築時のデータバージョン, 構築時の日付))}
+        self._view_roots = {}
+        
+        # ナビゲーションバーで最後に選択状態にした位置（設定画面など、対応する項目がないビューでは変わらない）
+        self._nav_index = 0
+        
     def initialize(self, page: ft.Page):
         """
         アプリケーションの初期化とページの設定を行います。
@@ -83,7 +117,7 @@ class DiarioApp:
         # スクロール設定
         self.page.scroll = ft.ScrollMode.AUTO
         
-        # ビューの初期化
+        # ビューの初期化（UIの構築は初回表示時に遅延して行う）
         self.views = {
             "home": HomeView(self),
             "editor": EditorView(self),
@@ -98,7 +132,7 @@ class DiarioApp:
             bgcolor=ft.colors.SURFACE_VARIANT,
             actions=[
                 ft.IconButton(
-                    icon=ft.icons.WB_SUNNY_OUTLINED if self.theme_manager.get_theme_mode() == ft.ThemeMode.LIGHT else ft.icons.NIGHTLIGHT_ROUND,
+                    icon=self._theme_icon(self.theme_manager.get_theme_mode()),
                     tooltip="テーマ切替",
                     on_click=self.toggle_theme
                 ),
@@ -147,13 +181,20 @@ class DiarioApp:
         Args:
             e: イベントデータ
         """
-        index_to_view = {
-            0: "home",
-            1: "editor",
-            2: "calendar",
-            3: "analytics"
-        }
-        self.navigate(index_to_view.get(e.control.selected_index, "home"))
+        selected_index = e.control.selected_index
+        if 0 <= selected_index < len(_VIEW_ORDER):
+            view_name = _VIEW_ORDER[selected_index]
+        else:
+            view_name = "home"
+        
+        # 未実装のビュー（分析など）が選択された場合は直前の選択状態に戻す
+        if view_name not in self.views:
+            logger.info("ビュー '%s' はまだ利用できません", view_name)
+            e.control.selected_index = self._nav_index
+            e.control.update()
+            return
+        
+        self.navigate(view_name)
         
     def navigate(self, view_name):
         """
@@ -162,27 +203,52 @@ class DiarioApp:
         Args:
             view_name (str): 移動先のビュー名
         """
-        logger.info(f"ビュー切替: {self.current_view} -> {view_name}")
+        logger.info("ビュー切替: %s -> %s", self.current_view, view_name)
         self.current_view = view_name
         
         # ビューが存在するか確認
         if view_name in self.views:
-            self.page.clean()
-            self.page.add(self.views[view_name].build())
+            # 構築済みのルートを再利用し、ページのコントロールを差し替える
+            self.page.controls.clear()
+            self.page.controls.append(self._get_view_root(view_name))
             
             # ナビゲーションバーの選択状態を更新
-            view_to_index = {
-                "home": 0,
-                "editor": 1,
-                "calendar": 2,
-                "analytics": 3
-            }
-            if view_name in view_to_index:
-                self.page.navigation_bar.selected_index = view_to_index[view_name]
+            selected_index = _VIEW_INDEX.get(view_name)
+            if selected_index is not None:
+                self._nav_index = selected_index
+                if self.page.navigation_bar.selected_index != selected_index:
+                    self.page.navigation_bar.selected_index = selected_index
                 
             self.page.update()
         else:
-            logger.error(f"ビュー '{view_name}' が見つかりません")
+            logger.error("ビュー '%s' が見つかりません", view_name)
+    
+    def _get_view_root(self, view_name):
+        """
+        指定されたビューのルートコントロールを取得します。
+        初回表示時、日記データが更新された後、日付を表示に使うビューで日付が変わった後、
+        または常に再構築が必要なビューの場合のみbuild()を呼び出し、
+        それ以外は構築済みのコントロールを再利用します。
+        
+        Args:
+            view_name (str): ビュー名
+            
+        Returns:
+            ft.Control: ビューのルートコントロール
+        """
+        # 日付に依存しないビューは日付をキーに含めず、日付が変わっても再利用する
+        today = datetime.now().date() if view_name in _DATE_DEPENDENT_VIEWS else None
+        cache_key = (self.diary_manager.version, today)
+        cached = self._view_roots.get(view_name)
+        
+        if (cached is None
+                or view_name in _ALWAYS_REBUILD_VIEWS
+                or cached[1] != cache_key):
+            root = self.views[view_name].build()
+            self._view_roots[view_name] = (root, cache_key)
+            return root
+        
+        return cached[0]
             
     def toggle_theme(self, e):
         """
@@ -192,17 +258,32 @@ class DiarioApp:
             e: イベントデータ
         """
         self.theme_manager.toggle_theme_mode()
-        self.page.theme_mode = self.theme_manager.get_theme_mode()
+        theme_mode = self.theme_manager.get_theme_mode()
         
         # アイコンの更新
-        self.page.appbar.actions[0].icon = (
-            ft.icons.WB_SUNNY_OUTLINED 
-            if self.theme_manager.get_theme_mode() == ft.ThemeMode.LIGHT 
-            else ft.icons.NIGHTLIGHT_ROUND
-        )
+        theme_button = self.page.appbar.actions[0]
+        theme_button.icon = self._theme_icon(theme_mode)
         
-        self.page.update()
-        logger.info(f"テーマモード変更: {self.theme_manager.get_theme_mode()}")
+        if self.page.theme_mode != theme_mode:
+            # テーマモードが変わった場合のみページ全体を更新（アイコンの変更も含まれる）
+            self.page.theme_mode = theme_mode
+            self.page.update()
+        else:
+            theme_button.update()
+        
+        logger.info("テーマモード変更: %s", theme_mode)
+    
+    def _theme_icon(self, theme_mode):
+        """
+        テーマモードに対応するテーマ切替ボタンのアイコンを取得します。
+        
+        Args:
+            theme_mode (ft.ThemeMode): テーマモード
+            
+        Returns:
+            str: アイコン名
+        """
+        return self._LIGHT_ICON if theme_mode == ft.ThemeMode.LIGHT else self._DARK_ICON
 
 def main(page: ft.Page):
     """
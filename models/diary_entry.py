@@ -12,19 +12,205 @@
 """
 
 import os
-import json
-import uuid
+import re
+import pickle
+import sys
+import atexit
 import datetime
 import base64
+import hashlib
+import hmac
 import logging
+import sqlite3
+import threading
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+import orjson
 from sqlitedict import SqliteDict
 from Crypto.Cipher import AES
 from Crypto.Random import get_random_bytes
-from Crypto.Util.Padding import pad, unpad
+from Crypto.Util.Padding import unpad
 
 logger = logging.getLogger(__name__)
 
+# 保存形式として一般的なISO形式（YYYY-MM-DDTHH:MM:SS[.ffffff]）
+_ISO_RE = re.compile(r'^(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2}):(\d{2})(?:\.(\d{1,6}))?$')
+
+def _parse_iso_fast(value):
+    """
+    一般的な形式のISO日時文字列を正規表現で解析します。
+    それ以外の形式はfromisoformatで解析します。
+    
+    Args:
+        value (str): ISO形式の日時文字列
+        
+    Returns:
+        datetime: 日時オブジェクト
+    """
+    m = _ISO_RE.match(value)
+    if not m:
+        return datetime.datetime.fromisoformat(value)
+    year, month, day, hour, minute, second, fraction = m.groups()
+    return datetime.datetime(
+        int(year), int(month), int(day), int(hour), int(minute), int(second),
+        int((fraction or '0').ljust(6, '0'))
+    )
+
+# ISO形式の日時文字列の解析関数（3.11以降はfromisoformatが高速なためそのまま使用）
+if sys.version_info >= (3, 11):
+    _parse_iso = datetime.datetime.fromisoformat
+else:
+    try:
+        from ciso8601 import parse_datetime as _parse_iso
+    except ImportError:
+        _parse_iso = _parse_iso_fast
+
+# 暗号化データの形式バージョン（AES-GCM: バージョン(1) + nonce(12) + タグ(16) + 暗号文）
+_GCM_FORMAT_VERSION = b"\x01"
+_GCM_NONCE_SIZE = 12
+_GCM_TAG_SIZE = 16
+
+# 復号化済みエントリーのキャッシュに保持する最大件数
+_ENTRY_CACHE_SIZE = 256
+
+# 復元などでデータベースを閉じている間に、開き直されるのを待つ最大秒数
+_DB_REOPEN_TIMEOUT = 30
+
+# 暗号化されたメディアファイルの先頭に付けるマジックバイト
+_MEDIA_MAGIC = b"DIARIO-MEDIA\x01"
+
+# 検索用のメタデータテーブル（暗号化しない索引情報のみを保持）
+_INDEX_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS entry_meta (id TEXT PRIMARY KEY, created_at TEXT, mood INTEGER)",
+    "CREATE TABLE IF NOT EXISTS entry_tags (id TEXT, tag TEXT, PRIMARY KEY (id, tag))",
+    # 期間指定の気分集計を索引のみで処理できるよう、作成日時と気分の複合索引を使用
+    "DROP INDEX IF EXISTS idx_entry_meta_created_at",
+    "CREATE INDEX IF NOT EXISTS idx_entry_meta_created_at_mood ON entry_meta (created_at, mood)",
+    "CREATE INDEX IF NOT EXISTS idx_entry_meta_mood ON entry_meta (mood)",
+    "CREATE INDEX IF NOT EXISTS idx_entry_tags_tag ON entry_tags (tag)",
+)
+
+# AES-NIの利用可否を確認済みかどうか
+_aes_ni_checked = False
+
+def _check_aes_ni():
+    """
+    pycryptodomeがAES-NI（ハードウェアAES命令）を利用できるかを一度だけ確認します。
+    利用できない環境では暗号化・復号化が大幅に遅くなるため警告を出力します。
+    """
+    global _aes_ni_checked
+    if _aes_ni_checked:
+        return
+    _aes_ni_checked = True
+    
+    try:
+        from Crypto.Util import _cpu_features
+        if not _cpu_features.have_aes_ni():
+            logger.warning("AES-NIが利用できません。暗号化処理が低速になる可能性があります")
+    except Exception as e:
+        logger.debug(f"AES-NIの確認に失敗しました: {e}")
+
+# ID生成用の乱数プール（システムコールを複数のIDでまとめて行う）
+_ID_SIZE = 16
+_ID_POOL_COUNT = 64
+_id_pool = bytearray()
+_id_pool_lock = threading.Lock()
+
+def _new_id():
+    """
+    ランダムな128ビットのIDを16進文字列で生成します。
+    
+    Returns:
+        str: 新しいID
+    """
+    global _id_pool
+    with _id_pool_lock:
+        if len(_id_pool) < _ID_SIZE:
+            _id_pool = bytearray(os.urandom(_ID_SIZE * _ID_POOL_COUNT))
+        out = bytes(_id_pool[:_ID_SIZE])
+        del _id_pool[:_ID_SIZE]
+    return out.hex()
+
+def _to_datetime(value):
+    """
+    ISO形式の日時文字列またはdatetimeをdatetimeオブジェクトに変換します。
+    
+    Args:
+        value (str or datetime): 変換する値
+        
+    Returns:
+        datetime: 日時オブジェクト
+    """
+    if isinstance(value, str):
+        return _parse_iso(value)
+    return value
+
+def _encode_value(value):
+    """
+    データベースに格納する値を変換します。値はすでにバイト列のため、そのまま格納します。
+    
+    Args:
+        value (bytes): 格納する値
+        
+    Returns:
+        bytes: 格納するBLOB
+    """
+    return value
+
+def _decode_value(value):
+    """
+    データベースから読み込んだ値を変換します。
+    旧形式のpickleされた値（先頭が0x80）はpickleで復元します。
+    
+    Args:
+        value (bytes): 読み込んだBLOB
+        
+    Returns:
+        bytes or str: 格納されていた値
+    """
+    if value[:1] == b"\x80":
+        return pickle.loads(value)
+    return value
+
+# 直近に導出したキー（saltを付けたパスワードのハッシュ, salt, キー）。パスワード自体や以前のキーは保持しない
+_last_derived_key = None
+_derived_key_lock = threading.Lock()
+
+def _derive_key(password, salt):
+    """
+    パスワードとsaltからAES-256用のキーを導出します。
+    同じプロセス内では、直近に導出したものと同じ組み合わせであれば導出結果を再利用します。
+    
+    Args:
+        password (str): パスワード
+        salt (bytes): salt
+        
+    Returns:
+        bytes: 32バイトのキー
+    """
+    global _last_derived_key
+    password_hash = hashlib.sha256(salt + password.encode()).digest()
+    with _derived_key_lock:
+        cached = _last_derived_key
+        if cached is not None and cached[1] == salt and hmac.compare_digest(cached[0], password_hash):
+            return cached[2]
+    
+    # パスワードからキーを生成（単純な方法、実際はより強固な方法を使うべき）
+    dk = hashlib.pbkdf2_hmac('sha256', password.encode(), salt, 100000)
+    key = dk[:32]  # AES-256用に32バイトを使用
+    with _derived_key_lock:
+        _last_derived_key = (password_hash, salt, key)
+    return key
+
+def _forget_derived_key():
+    """
+    再利用のために保持している導出済みのキーを破棄します。
+    """
+    global _last_derived_key
+    with _derived_key_lock:
+        _last_derived_key = None
+
 class DiaryEntry:
     """
     日記エントリーのデータモデルクラス。
@@ -46,7 +232,7 @@ class DiaryEntry:
             created_at (datetime): 作成日時
             updated_at (datetime): 更新日時
         """
-        self.id = str(uuid.uuid4())
+        self.id = _new_id()
         self.title = title
         self.content = content
         self.mood = mood
@@ -55,6 +241,21 @@ class DiaryEntry:
         self.media = media or []
         self.created_at = created_at or datetime.datetime.now()
         self.updated_at = updated_at or datetime.datetime.now()
+        
+        # カンマ区切りのタグ文字列（初回参照時に生成し、タグ変更時に破棄する）
+        self._tags_csv = None
+    
+    @property
+    def tags_csv(self):
+        """
+        タグをカンマ区切りで連結した文字列を取得します。
+        
+        Returns:
+            str: 「タグ1, タグ2」形式の文字列
+        """
+        if self._tags_csv is None:
+            self._tags_csv = ", ".join(self.tags)
+        return self._tags_csv
     
     def to_dict(self):
         """
@@ -71,8 +272,9 @@ class DiaryEntry:
             "tags": self.tags,
             "location": self.location,
             "media": self.media,
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat()
+            # datetimeはorjsonがISO形式で直接シリアライズする
+            "created_at": self.created_at,
+            "updated_at": self.updated_at
         }
     
     @classmethod
@@ -97,11 +299,11 @@ class DiaryEntry:
         
         entry.id = data.get("id", entry.id)
         
-        # 日時文字列をdatetimeオブジェクトに変換
+        # 日時文字列をdatetimeオブジェクトに変換（datetimeのまま渡された場合はそのまま使用）
         if "created_at" in data:
-            entry.created_at = datetime.datetime.fromisoformat(data["created_at"])
+            entry.created_at = _to_datetime(data["created_at"])
         if "updated_at" in data:
-            entry.updated_at = datetime.datetime.fromisoformat(data["updated_at"])
+            entry.updated_at = _to_datetime(data["updated_at"])
             
         return entry
     
@@ -128,6 +330,7 @@ class DiaryEntry:
             self.mood = mood
         if tags is not None:
             self.tags = tags
+            self._tags_csv = None
         if location is not None:
             self.location = location
         if media is not None:
@@ -148,7 +351,7 @@ class DiaryEntry:
         Returns:
             str: 追加されたメディアのID
         """
-        media_id = str(uuid.uuid4())
+        media_id = _new_id()
         self.media.append({
             "id": media_id,
             "type": media_type,
@@ -189,6 +392,7 @@ class DiaryEntry:
         """
         if tag not in self.tags:
             self.tags.append(tag)
+            self._tags_csv = None
             self.updated_at = datetime.datetime.now()
             return True
         return False
@@ -205,6 +409,7 @@ class DiaryEntry:
         """
         if tag in self.tags:
             self.tags.remove(tag)
+            self._tags_csv = None
             self.updated_at = datetime.datetime.now()
             return True
         return False
@@ -224,24 +429,307 @@ class DiaryEntryManager:
         """
         self.data_dir = Path.home() / ".diario" / "data"
         self.db_file = self.data_dir / "diary.sqlite"
+        self.media_dir = self.data_dir / "media"
         self.password = password
-        self.entries_cache = {}
+        # 復号化済みJSONバイト列のLRUキャッシュ（エントリーID → bytes）
+        self._blob_cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+        
+        # タグの転置インデックス（タグ → エントリーIDの集合）と、エントリーごとのタグ。初回使用時に読み込む
+        self._tag_index = None
+        self._tags_by_entry = None
+        
+        # 日記データのバージョン（保存・削除のたびに増加し、ビューの再構築判定に使用）
+        self.version = 0
         
-        # データディレクトリの作成
-        if not self.data_dir.exists():
-            os.makedirs(self.data_dir, exist_ok=True)
+        # 月ごとのエントリーがある日のキャッシュ {(年, 月): frozenset}（バージョンが変わったら破棄する）
+        self._month_days_cache = {}
+        self._month_days_version = self.version
+        
+        # データディレクトリの作成（存在確認は行わず、作成済みの場合の例外で判定する）
+        try:
+            self.data_dir.mkdir(parents=True)
             logger.info(f"データディレクトリを作成しました: {self.data_dir}")
+        except FileExistsError:
+            pass
+        
+        # データベースは1つの接続を使い回し、トランザクション単位でコミットする
+        # （データディレクトリを置き換える前にはclose()で閉じ、reopen()で開き直す）
+        self._db_handle = self._open_db()
+        self._db_ready = threading.Event()
+        self._db_ready.set()
+        atexit.register(self.close)
         
         # 必要な場合は暗号化キーを初期化
         self.key = None
         if self.password:
             self._init_encryption()
+        
+        # 検索用の索引テーブルを準備
+        self._init_index()
+    
+    def _open_db(self):
+        """
+        日記データベースをWALモードで開きます。
+        
+        Returns:
+            SqliteDict: 開いたデータベース
+        """
+        db = SqliteDict(
+            str(self.db_file), tablename='entries', autocommit=False, journal_mode='WAL',
+            encode=_encode_value, decode=_decode_value
+        )
+        
+        # ロック待ちのタイムアウトと、WALで十分な同期レベルを設定
+        db.conn.execute('PRAGMA busy_timeout=5000')
+        db.conn.execute('PRAGMA synchronous=NORMAL')
+        return db
+    
+    @property
+    def _db(self):
+        """
+        開いているデータベースを取得します。
+        close()で閉じている間は、reopen()で開き直されるまで待ちます。
+        
+        Returns:
+            SqliteDict: 開いているデータベース
+        """
+        if not self._db_ready.wait(_DB_REOPEN_TIMEOUT):
+            raise RuntimeError("データベースが閉じられています")
+        return self._db_handle
+    
+    def checkpoint(self):
+        """
+        未コミットの変更をコミットし、WALの内容をデータベース本体に書き戻します。
+        実行後はデータベースファイルだけで最新の状態になります。
+        """
+        if self._db_handle is None:
+            return
+        self._db_handle.commit()
+        self._db_handle.conn.select_one("PRAGMA wal_checkpoint(TRUNCATE)")
+    
+    def copy_database(self, dest):
+        """
+        データベースを閉じずに、現在の内容を別のファイルに書き出します。
+        SQLiteのバックアップ機能を使うため、書き出し中に保存があっても一貫した状態になります。
+        
+        Args:
+            dest (Path): 書き出し先のファイルのパス
+        """
+        self.checkpoint()
+        
+        src = sqlite3.connect(str(self.db_file))
+        try:
+            dst = sqlite3.connect(str(dest))
+            try:
+                src.backup(dst)
+            finally:
+                dst.close()
+        finally:
+            src.close()
+    
+    def _rollback(self):
+        """
+        コミットしていないデータベースへの書き込みを取り消します。
+        """
+        try:
+            self._db.conn.select_one("ROLLBACK")
+        except Exception as e:
+            logger.error(f"書き込みの取り消しに失敗しました: {e}")
+    
+    def close(self):
+        """
+        データベースを閉じます。
+        バックアップや復元でデータディレクトリのファイルを直接扱う前に呼び出します。
+        閉じた後にデータを扱う場合はreopen()で開き直します。
+        """
+        if self._db_handle is None:
+            return
+        
+        # 以降のデータベースの操作は、開き直されるまで待たせる
+        self._db_ready.clear()
+        try:
+            self.checkpoint()
+        except Exception as e:
+            logger.error(f"データベースのチェックポイントに失敗しました: {e}")
+        self._db_handle.close()
+        self._db_handle = None
+        atexit.unregister(self.close)
+        logger.info("データベースを閉じました")
+    
+    def reopen(self):
+        """
+        データベースを開き直し、メモリ上のキャッシュと索引を読み込み直します。
+        復元などでデータディレクトリの内容が変わった後に呼び出します。
+        """
+        self.close()
+        
+        # 復元でディレクトリごと置き換わっている場合に備えて作り直す
+        self.data_dir.mkdir(parents=True, exist_ok=True)
+        self._db_handle = self._open_db()
+        atexit.register(self.close)
+        
+        # 以前のデータに基づくキャッシュを破棄
+        with self._cache_lock:
+            self._blob_cache.clear()
+        self._tag_index = None
+        self._tags_by_entry = None
+        self._month_days_cache = {}
+        
+        # saltが置き換わっている可能性があるため、キーを導出し直す
+        if self.password:
+            self._init_encryption()
+        
+        # 待っている操作を再開させてから索引を確認する
+        self._db_ready.set()
+        self._init_index()
+        
+        # ビューのキャッシュを作り直させる
+        self.version += 1
+        logger.info("データベースを開き直しました")
+    
+    def _init_index(self):
+        """
+        検索用の索引テーブルを作成し、日記データと件数が一致しない場合は再構築します。
+        """
+        try:
+            for statement in _INDEX_SCHEMA:
+                self._db.conn.execute(statement)
+            self._db.commit()
+            
+            indexed_count = self._db.conn.select_one("SELECT COUNT(*) FROM entry_meta")[0]
+            if indexed_count != len(self._db):
+                self._rebuild_index()
+        except Exception as e:
+            logger.error(f"索引テーブルの初期化に失敗しました: {e}")
+    
+    def _rebuild_index(self):
+        """
+        すべての日記エントリーから索引テーブルを作り直します。
+        """
+        self._db.conn.execute("DELETE FROM entry_meta")
+        self._db.conn.execute("DELETE FROM entry_tags")
+        self._tag_index = None
+        self._tags_by_entry = None
+        for entry_id in list(self._db.keys()):
+            entry = self.get_entry(entry_id)
+            if entry:
+                self._index_entry(entry)
+        self._db.commit()
+        logger.info("索引テーブルを再構築しました")
+    
+    def _index_entry(self, entry):
+        """
+        日記エントリーのメタデータを索引テーブルに書き込みます（コミットは呼び出し側で行います）。
+        
+        Args:
+            entry (DiaryEntry): 索引に登録する日記エントリー
+        """
+        conn = self._db.conn
+        conn.execute(
+            "INSERT OR REPLACE INTO entry_meta (id, created_at, mood) VALUES (?, ?, ?)",
+            (entry.id, entry.created_at.isoformat(), entry.mood)
+        )
+        conn.execute("DELETE FROM entry_tags WHERE id = ?", (entry.id,))
+        tags = set(entry.tags)
+        for tag in tags:
+            conn.execute("INSERT OR IGNORE INTO entry_tags (id, tag) VALUES (?, ?)", (entry.id, tag))
+        
+        # 読み込み済みの転置インデックスも更新
+        if self._tag_index is not None:
+            self._remove_from_tag_index(entry.id)
+            for tag in tags:
+                self._tag_index[tag].add(entry.id)
+            self._tags_by_entry[entry.id] = tags
+    
+    def _unindex_entry(self, entry_id):
+        """
+        日記エントリーのメタデータを索引テーブルから削除します（コミットは呼び出し側で行います）。
+        
+        Args:
+            entry_id (str): 削除する日記エントリーのID
+        """
+        self._db.conn.execute("DELETE FROM entry_meta WHERE id = ?", (entry_id,))
+        self._db.conn.execute("DELETE FROM entry_tags WHERE id = ?", (entry_id,))
+        if self._tag_index is not None:
+            self._remove_from_tag_index(entry_id)
+    
+    def _get_tag_index(self):
+        """
+        タグの転置インデックスを取得します。未読み込みの場合は索引テーブルから構築します。
+        
+        Returns:
+            defaultdict: タグ → エントリーIDの集合
+        """
+        if self._tag_index is None:
+            tag_index = defaultdict(set)
+            tags_by_entry = defaultdict(set)
+            for entry_id, tag in self._db.conn.select("SELECT id, tag FROM entry_tags"):
+                tag_index[tag].add(entry_id)
+                tags_by_entry[entry_id].add(tag)
+            self._tag_index = tag_index
+            self._tags_by_entry = dict(tags_by_entry)
+        return self._tag_index
+    
+    def _remove_from_tag_index(self, entry_id):
+        """
+        エントリーを転置インデックスから取り除きます。
+        
+        Args:
+            entry_id (str): 取り除くエントリーのID
+        """
+        for tag in self._tags_by_entry.pop(entry_id, ()):
+            entry_ids = self._tag_index.get(tag)
+            if entry_ids is not None:
+                entry_ids.discard(entry_id)
+                if not entry_ids:
+                    del self._tag_index[tag]
+    
+    def _query_entry_ids(self, where="", args=(), limit=None):
+        """
+        索引テーブルから条件に一致するエントリーIDを作成日時の降順で取得します。
+        
+        Args:
+            where (str): WHERE句（"WHERE"を除く）
+            args (tuple): WHERE句のパラメータ
+            limit (int, optional): 取得する最大件数
+            
+        Returns:
+            list: エントリーIDのリスト
+        """
+        sql = "SELECT id FROM entry_meta"
+        if where:
+            sql += f" WHERE {where}"
+        sql += " ORDER BY created_at DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            args = tuple(args) + (limit,)
+        return [row[0] for row in self._db.conn.select(sql, args)]
+    
+    def _get_entries_by_ids(self, entry_ids):
+        """
+        指定されたIDの日記エントリーを順番通りに取得します。
+        
+        Args:
+            entry_ids (list): エントリーIDのリスト
+            
+        Returns:
+            list: DiaryEntryオブジェクトのリスト
+        """
+        entries = []
+        for entry_id in entry_ids:
+            entry = self.get_entry(entry_id)
+            if entry:
+                entries.append(entry)
+        return entries
     
     def _init_encryption(self):
         """
         暗号化に必要なキーを初期化します。
         パスワードからキーを生成し、必要であれば新しいキーを生成して保存します。
         """
+        _check_aes_ni()
+        
         key_file = self.data_dir / "key.bin"
         salt_file = self.data_dir / "salt.bin"
         
@@ -255,51 +743,138 @@ class DiaryEntryManager:
             with open(salt_file, "rb") as f:
                 salt = f.read()
         
-        # パスワードからキーを生成（単純な方法、実際はより強固な方法を使うべき）
-        import hashlib
-        dk = hashlib.pbkdf2_hmac('sha256', self.password.encode(), salt, 100000)
-        self.key = dk[:32]  # AES-256用に32バイトを使用
+        # パスワードからキーを生成
+        self.key = _derive_key(self.password, salt)
     
-    def _encrypt_data(self, data):
+    def _encrypt_data(self, data, nonce=None):
         """
-        JSONデータを暗号化します。
+        JSONデータをAES-GCMで暗号化します。
         
         Args:
             data (dict): 暗号化するデータ
+            nonce (bytes, optional): 使用するnonce（12バイト）。
+                省略した場合は新しく生成します。
+            
+        Returns:
+            bytearray: 暗号化されたデータ
+        """
+        # JSONエンコード
+        return self._encrypt_bytes(orjson.dumps(data), nonce)
+    
+    def _encrypt_bytes(self, json_data, nonce=None):
+        """
+        JSONバイト列をAES-GCMで暗号化します。
+        
+        Args:
+            json_data (bytes): 暗号化するJSONバイト列
+            nonce (bytes, optional): 使用するnonce（12バイト）。
+                省略した場合は新しく生成します。
             
         Returns:
-            bytes: 暗号化されたデータ
+            bytearray: 暗号化されたデータ（キーがない場合は入力のまま）
         """
         if not self.key:
-            return json.dumps(data).encode('utf-8')
+            return json_data
         
-        # JSONエンコード
-        json_data = json.dumps(data).encode('utf-8')
+        if nonce is None:
+            nonce = get_random_bytes(_GCM_NONCE_SIZE)
+        
+        # バージョン、nonce、認証タグ、暗号文を格納する領域を一度に確保
+        nonce_end = 1 + _GCM_NONCE_SIZE
+        tag_end = nonce_end + _GCM_TAG_SIZE
+        buf = bytearray(tag_end + len(json_data))
+        buf[:1] = _GCM_FORMAT_VERSION
+        buf[1:nonce_end] = nonce
+        
+        # 暗号文は確保した領域に直接書き込む
+        cipher = AES.new(self.key, AES.MODE_GCM, nonce=nonce)
+        cipher.encrypt(json_data, output=memoryview(buf)[tag_end:])
+        buf[nonce_end:tag_end] = cipher.digest()
+        return buf
+    
+    def _serialize_entry(self, entry, nonce=None):
+        """
+        日記エントリーをデータベースに格納する形式に変換します。
         
-        # 暗号化
-        cipher = AES.new(self.key, AES.MODE_CBC)
-        ct_bytes = cipher.encrypt(pad(json_data, AES.block_size))
+        Args:
+            entry (DiaryEntry): 変換する日記エントリー
+            nonce (bytes, optional): 暗号化に使用するnonce
+            
+        Returns:
+            bytes or str: データベースに格納するデータ（暗号化時はバイト列）
+        """
+        # エントリーを辞書に変換
+        entry_dict = entry.to_dict()
         
-        # IV（初期化ベクトル）と暗号文を結合
-        result = cipher.iv + ct_bytes
-        return result
+        # 暗号化が有効な場合は暗号化（いずれもバイト列のまま格納）
+        if self.password:
+            return self._encrypt_data(entry_dict, nonce)
+        return orjson.dumps(entry_dict)
     
-    def _decrypt_data(self, encrypted_data):
+    def _decode_blob(self, data, strict=False):
         """
-        暗号化されたデータを復号化します。
+        データベースに格納されたデータを平文のJSONバイト列に変換します。
+        
+        Args:
+            data (bytes or str): データベースから読み込んだデータ
+            strict (bool): Trueの場合、復号化に失敗したら空のJSONを返さずに例外を送出する
+            
+        Returns:
+            bytes: 日記エントリーのJSONバイト列
+        """
+        # 平文のJSON（Base64や暗号化形式は"{"で始まらない）
+        if not self.password or data[:1] in ("{", b"{"):
+            return data.encode('utf-8') if isinstance(data, str) else data
+        
+        # 文字列は旧形式（AES-CBCをBase64エンコードしたもの）
+        if isinstance(data, str):
+            return self._decrypt_legacy_data(base64.b64decode(data), strict)
+        return self._decrypt_data(data, strict)
+    
+    def _decrypt_data(self, encrypted_data, strict=False):
+        """
+        AES-GCMで暗号化されたデータを復号化し、改ざんがないことを検証します。
         
         Args:
             encrypted_data (bytes): 復号化するデータ
+            strict (bool): Trueの場合、復号化に失敗したら例外を送出する
             
         Returns:
-            dict: 復号化されたデータ
+            bytes: 復号化されたJSONバイト列
         """
         if not self.key:
-            try:
-                return json.loads(encrypted_data.decode('utf-8'))
-            except:
-                return {}
+            return encrypted_data
         
+        try:
+            # バージョン、nonce、認証タグ、暗号文を分離
+            if encrypted_data[:1] != _GCM_FORMAT_VERSION:
+                raise ValueError("未対応の暗号化形式です")
+            nonce_end = 1 + _GCM_NONCE_SIZE
+            tag_end = nonce_end + _GCM_TAG_SIZE
+            nonce = encrypted_data[1:nonce_end]
+            tag = encrypted_data[nonce_end:tag_end]
+            ct = encrypted_data[tag_end:]
+            
+            # 復号化と認証タグの検証
+            cipher = AES.new(self.key, AES.MODE_GCM, nonce=nonce)
+            return cipher.decrypt_and_verify(ct, tag)
+        except Exception as e:
+            logger.error(f"データの復号化に失敗しました: {e}")
+            if strict:
+                raise
+            return b"{}"
+    
+    def _decrypt_legacy_data(self, encrypted_data, strict=False):
+        """
+        旧形式（AES-CBC）で暗号化されたデータを復号化します。
+        
+        Args:
+            encrypted_data (bytes): 復号化するデータ
+            strict (bool): Trueの場合、復号化に失敗したら例外を送出する
+            
+        Returns:
+            bytes: 復号化されたJSONバイト列
+        """
         try:
             # IVと暗号文を分離
             iv = encrypted_data[:16]
@@ -307,13 +882,143 @@ class DiaryEntryManager:
             
             # 復号化
             cipher = AES.new(self.key, AES.MODE_CBC, iv)
-            pt = unpad(cipher.decrypt(ct), AES.block_size)
-            
-            # JSONデコード
-            return json.loads(pt.decode('utf-8'))
+            return unpad(cipher.decrypt(ct), AES.block_size)
         except Exception as e:
             logger.error(f"データの復号化に失敗しました: {e}")
-            return {}
+            if strict:
+                raise
+            return b"{}"
+    
+    def _media_path(self, digest):
+        """
+        メディアファイルの保存先パスを取得します。
+        
+        Args:
+            digest (str): メディアの内容のSHA-256ハッシュ
+            
+        Returns:
+            Path: メディアファイルのパス
+        """
+        return self.media_dir / digest[:2] / digest
+    
+    def _write_media_file(self, path, raw):
+        """
+        メディアデータをファイルに書き込みます。暗号化が有効な場合は暗号化します。
+        
+        Args:
+            path (Path): 書き込み先のパス
+            raw (bytes): メディアの生データ
+        """
+        if self.key:
+            nonce = get_random_bytes(_GCM_NONCE_SIZE)
+            cipher = AES.new(self.key, AES.MODE_GCM, nonce=nonce)
+            ct_bytes, tag = cipher.encrypt_and_digest(raw)
+            raw = _MEDIA_MAGIC + nonce + tag + ct_bytes
+        
+        # 一時ファイルに書き込んでから置き換える
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(raw)
+        os.replace(tmp_path, path)
+    
+    def _read_media_file(self, path, key=None):
+        """
+        メディアファイルを読み込みます。暗号化されている場合は復号化します。
+        
+        Args:
+            path (Path): 読み込むファイルのパス
+            key (bytes, optional): 復号化に使用するキー（省略時は現在のキー）
+            
+        Returns:
+            bytes: メディアの生データ
+        """
+        with open(path, "rb") as f:
+            data = f.read()
+        
+        if not data.startswith(_MEDIA_MAGIC):
+            return data
+        
+        nonce_end = len(_MEDIA_MAGIC) + _GCM_NONCE_SIZE
+        tag_end = nonce_end + _GCM_TAG_SIZE
+        cipher = AES.new(key or self.key, AES.MODE_GCM, nonce=data[len(_MEDIA_MAGIC):nonce_end])
+        return cipher.decrypt_and_verify(data[tag_end:], data[nonce_end:tag_end])
+    
+    def _externalize_media(self, entry):
+        """
+        エントリーに埋め込まれたメディアデータを内容アドレス方式のファイルに書き出し、
+        エントリーにはハッシュのみを残します。
+        
+        Args:
+            entry (DiaryEntry): 対象の日記エントリー
+        """
+        for media in entry.media:
+            data = media.get("data")
+            if not data:
+                continue
+            
+            raw = base64.b64decode(data)
+            digest = hashlib.sha256(raw).hexdigest()
+            
+            # 同じ内容のファイルがすでにあれば書き込みを省略
+            path = self._media_path(digest)
+            if not path.exists():
+                self._write_media_file(path, raw)
+            
+            media["hash"] = digest
+            del media["data"]
+    
+    def get_media_bytes(self, entry, media_id):
+        """
+        日記エントリーに添付されたメディアの生データを取得します。
+        
+        Args:
+            entry (DiaryEntry): 日記エントリー
+            media_id (str): メディアのID
+            
+        Returns:
+            bytes: メディアの生データ。存在しない場合はNone
+        """
+        for media in entry.media:
+            if media.get("id") != media_id:
+                continue
+            
+            try:
+                # 保存前のメディアはエントリー内に埋め込まれている
+                if media.get("data"):
+                    return base64.b64decode(media["data"])
+                if media.get("hash"):
+                    return self._read_media_file(self._media_path(media["hash"]))
+            except Exception as e:
+                logger.error(f"メディアの読み込みに失敗しました: ID={media_id}, エラー={e}")
+            return None
+        return None
+    
+    def _reencrypt_media_files(self, old_key):
+        """
+        すべてのメディアファイルを現在のキーで暗号化し直します。
+        
+        Args:
+            old_key (bytes): 変更前のキー（暗号化されていなかった場合はNone）
+            
+        Returns:
+            list: 暗号化し直せなかったメディアファイルのパスのリスト
+        """
+        failed = []
+        if not self.media_dir.exists():
+            return failed
+        
+        # 1つのファイルの失敗で残りのファイルが古いキーのまま残らないよう、ファイルごとに処理する
+        for path in self.media_dir.glob("*/*"):
+            if path.suffix == ".tmp":
+                continue
+            try:
+                raw = self._read_media_file(path, old_key)
+                self._write_media_file(path, raw)
+            except Exception as e:
+                logger.error(f"メディアファイルの再暗号化に失敗しました: {path}: {e}")
+                failed.append(path)
+        return failed
     
     def save_entry(self, entry):
         """
@@ -326,29 +1031,89 @@ class DiaryEntryManager:
             str: 保存されたエントリーのID
         """
         try:
-            with SqliteDict(str(self.db_file), tablename='entries', autocommit=True) as db:
-                # 更新日時を更新
-                entry.updated_at = datetime.datetime.now()
-                
-                # エントリーを辞書に変換
-                entry_dict = entry.to_dict()
-                
-                # 暗号化が有効な場合は暗号化
-                if self.password:
-                    encrypted_data = self._encrypt_data(entry_dict)
-                    db[entry.id] = base64.b64encode(encrypted_data).decode('utf-8')
-                else:
-                    db[entry.id] = json.dumps(entry_dict)
-                
-                # キャッシュを更新
-                self.entries_cache[entry.id] = entry
-                
-                logger.info(f"日記エントリーを保存しました: ID={entry.id}")
-                return entry.id
+            # 更新日時を更新
+            now = datetime.datetime.now()
+            entry.updated_at = now
+            
+            # メディアは別ファイルに書き出してから本文を保存
+            self._externalize_media(entry)
+            self._db[entry.id] = self._serialize_entry(entry)
+            self._index_entry(entry)
+            self._db.commit()
+            
+            # キャッシュを無効化
+            with self._cache_lock:
+                self._blob_cache.pop(entry.id, None)
+            self.version += 1
+            
+            logger.info(f"日記エントリーを保存しました: ID={entry.id}")
+            return entry.id
         except Exception as e:
             logger.error(f"日記エントリーの保存に失敗しました: {e}")
             return None
     
+    def _reencrypt_entries(self, blobs):
+        """
+        復号化済みのJSONバイト列を現在のキーで暗号化し直し、1回のコミットで書き込みます。
+        内容は変わらないため、索引と復号化済みデータのキャッシュはそのまま使用します。
+        
+        Args:
+            blobs (list): (エントリーID, JSONバイト列) のリスト
+        """
+        if not blobs:
+            return
+        
+        # 必要な数のnonceをまとめて生成し、スライスして使用
+        nonce_size = _GCM_NONCE_SIZE
+        nonces = get_random_bytes(nonce_size * len(blobs)) if self.key else None
+        
+        def encrypt(i):
+            nonce = nonces[i * nonce_size:(i + 1) * nonce_size] if nonces else None
+            return self._encrypt_bytes(blobs[i][1], nonce)
+        
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            encrypted = list(executor.map(encrypt, range(len(blobs))))
+        
+        # データベースへの書き込みはまとめて1回のコミットで行う
+        for (entry_id, _), blob in zip(blobs, encrypted):
+            self._db[entry_id] = blob
+        self._db.commit()
+        self.version += 1
+        
+        logger.info(f"{len(blobs)}件の日記エントリーを再暗号化しました")
+    
+    def _load_decrypted_blob(self, entry_id):
+        """
+        指定されたIDの日記エントリーを復号化済みJSONバイト列として取得します。
+        直近に使用したエントリーはキャッシュから返します。
+        
+        Args:
+            entry_id (str): 取得する日記エントリーのID
+            
+        Returns:
+            bytes: 日記エントリーのJSONバイト列。存在しない場合はNone
+        """
+        # キャッシュにあればそれを返す（バックグラウンドでの先読みと競合しないようロックする）
+        with self._cache_lock:
+            blob = self._blob_cache.get(entry_id)
+            if blob is not None:
+                self._blob_cache.move_to_end(entry_id)
+                return blob
+        
+        if entry_id not in self._db:
+            return None
+        
+        # データを取得し、暗号化されている場合は復号化
+        blob = self._decode_blob(self._db[entry_id])
+        
+        # キャッシュに追加し、上限を超えたら古いものから削除
+        with self._cache_lock:
+            self._blob_cache[entry_id] = blob
+            if len(self._blob_cache) > _ENTRY_CACHE_SIZE:
+                self._blob_cache.popitem(last=False)
+        
+        return blob
+    
     def get_entry(self, entry_id):
         """
         指定されたIDの日記エントリーを取得します。
@@ -359,32 +1124,13 @@ class DiaryEntryManager:
         Returns:
             DiaryEntry: 取得した日記エントリー。存在しない場合はNone
         """
-        # キャッシュにあればそれを返す
-        if entry_id in self.entries_cache:
-            return self.entries_cache[entry_id]
-        
         try:
-            with SqliteDict(str(self.db_file), tablename='entries') as db:
-                if entry_id not in db:
-                    return None
-                
-                # データを取得
-                data = db[entry_id]
-                
-                # 暗号化されている場合は復号化
-                if self.password:
-                    encrypted_data = base64.b64decode(data)
-                    entry_dict = self._decrypt_data(encrypted_data)
-                else:
-                    entry_dict = json.loads(data)
-                
-                # DiaryEntryオブジェクトを作成
-                entry = DiaryEntry.from_dict(entry_dict)
-                
-                # キャッシュに追加
-                self.entries_cache[entry_id] = entry
-                
-                return entry
+            blob = self._load_decrypted_blob(entry_id)
+            if blob is None:
+                return None
+            
+            # DiaryEntryオブジェクトを作成
+            return DiaryEntry.from_dict(orjson.loads(blob))
         except Exception as e:
             logger.error(f"日記エントリーの取得に失敗しました: ID={entry_id}, エラー={e}")
             return None
@@ -400,36 +1146,47 @@ class DiaryEntryManager:
             bool: 削除が成功したかどうか
         """
         try:
-            with SqliteDict(str(self.db_file), tablename='entries', autocommit=True) as db:
-                if entry_id in db:
-                    del db[entry_id]
-                    
-                    # キャッシュからも削除
-                    if entry_id in self.entries_cache:
-                        del self.entries_cache[entry_id]
-                    
-                    logger.info(f"日記エントリーを削除しました: ID={entry_id}")
-                    return True
-                return False
+            if entry_id in self._db:
+                del self._db[entry_id]
+                self._unindex_entry(entry_id)
+                self._db.commit()
+                
+                # キャッシュからも削除
+                with self._cache_lock:
+                    self._blob_cache.pop(entry_id, None)
+                self.version += 1
+                
+                logger.info(f"日記エントリーを削除しました: ID={entry_id}")
+                return True
+            return False
         except Exception as e:
             logger.error(f"日記エントリーの削除に失敗しました: ID={entry_id}, エラー={e}")
             return False
     
-    def get_all_entries(self):
+    def get_all_entries(self, limit=None):
         """
         すべての日記エントリーを取得します。
         
+        Args:
+            limit (int, optional): 取得する最大件数（新しい順）
+            
         Returns:
             list: DiaryEntryオブジェクトのリスト
         """
         entries = []
         try:
-            with SqliteDict(str(self.db_file), tablename='entries') as db:
-                for entry_id in db:
-                    entry = self.get_entry(entry_id)
-                    if entry:
-                        entries.append(entry)
-                        
+            # 件数が限られる場合は索引テーブルから新しい順にIDを取得し、必要な分だけ復号化
+            if limit is not None:
+                return self._get_entries_by_ids(self._query_entry_ids(limit=limit))
+            
+            # 1回の走査で全件を復号化（キャッシュを荒らさないよう個別取得は使わない）
+            for entry_id, data in self._db.iteritems():
+                # 読み込めないエントリーがあっても、そのエントリーだけを除いて続ける
+                try:
+                    entries.append(DiaryEntry.from_dict(orjson.loads(self._decode_blob(data))))
+                except Exception as e:
+                    logger.error(f"日記エントリーの取得に失敗しました: ID={entry_id}, エラー={e}")
+            
             # 作成日時の降順でソート
             entries.sort(key=lambda x: x.created_at, reverse=True)
             return entries
@@ -451,34 +1208,40 @@ class DiaryEntryManager:
         Returns:
             list: 検索条件に一致するDiaryEntryオブジェクトのリスト
         """
-        all_entries = self.get_all_entries()
-        filtered_entries = []
+        # 日付・気分は索引テーブルで絞り込む
+        conditions = []
+        args = []
+        if date_from:
+            conditions.append("created_at >= ?")
+            args.append(date_from.isoformat())
+        if date_to:
+            conditions.append("created_at <= ?")
+            args.append(date_to.isoformat())
+        if mood is not None:
+            conditions.append("mood = ?")
+            args.append(mood)
         
-        for entry in all_entries:
-            # テキスト検索
-            if query and not (
-                query.lower() in entry.title.lower() or 
-                query.lower() in entry.content.lower()
-            ):
-                continue
-            
-            # タグ検索
-            if tags and not any(tag in entry.tags for tag in tags):
-                continue
-            
-            # 日付範囲検索
-            if date_from and entry.created_at < date_from:
-                continue
-            if date_to and entry.created_at > date_to:
-                continue
-            
-            # 気分スコア検索
-            if mood is not None and entry.mood != mood:
-                continue
+        try:
+            entry_ids = self._query_entry_ids(" AND ".join(conditions), tuple(args))
             
-            filtered_entries.append(entry)
+            # タグはいずれかを含むエントリー（和集合）に転置インデックスで絞り込む
+            if tags:
+                tag_index = self._get_tag_index()
+                candidate_ids = set().union(*(tag_index.get(tag, ()) for tag in tags))
+                entry_ids = [entry_id for entry_id in entry_ids if entry_id in candidate_ids]
+        except Exception as e:
+            logger.error(f"日記エントリーの検索に失敗しました: {e}")
+            return []
+        
+        # テキスト検索は大文字小文字を区別しない正規表現を一度だけコンパイルして使用
+        if not query:
+            return self._get_entries_by_ids(entry_ids)
+        search = re.compile(re.escape(query), re.IGNORECASE).search
         
-        return filtered_entries
+        return [
+            entry for entry in self._get_entries_by_ids(entry_ids)
+            if search(entry.title) or search(entry.content)
+        ]
     
     def get_entries_by_date(self, year, month=None, day=None):
         """
@@ -492,22 +1255,58 @@ class DiaryEntryManager:
         Returns:
             list: 指定された日付に一致するDiaryEntryオブジェクトのリスト
         """
-        all_entries = self.get_all_entries()
-        filtered_entries = []
+        # ISO形式の作成日時に対する前方一致パターンを組み立てる
+        pattern = f"{year:04d}-"
+        pattern += f"{month:02d}-" if month is not None else "__-"
+        pattern += f"{day:02d}T%" if day is not None else "%"
         
-        for entry in all_entries:
-            if entry.created_at.year != year:
-                continue
-            
-            if month is not None and entry.created_at.month != month:
-                continue
-                
-            if day is not None and entry.created_at.day != day:
-                continue
+        try:
+            entry_ids = self._query_entry_ids("created_at LIKE ?", (pattern,))
+        except Exception as e:
+            logger.error(f"日付による日記エントリーの取得に失敗しました: {e}")
+            return []
+        
+        return self._get_entries_by_ids(entry_ids)
+    
+    def get_entry_days_for_month(self, year, month):
+        """
+        指定された月で日記エントリーがある日の集合を取得します。
+        エントリー本体は復号化せず、索引テーブルのみを参照します。
+        
+        Args:
+            year (int): 年
+            month (int): 月
             
-            filtered_entries.append(entry)
+        Returns:
+            frozenset: エントリーがある日（1-31）の集合
+        """
+        # データが更新された場合はキャッシュを破棄する
+        if self._month_days_version != self.version:
+            self._month_days_cache = {}
+            self._month_days_version = self.version
+        
+        days = self._month_days_cache.get((year, month))
+        if days is not None:
+            return days
         
-        return filtered_entries
+        # 作成日時の範囲で絞り込み、ISO形式の日の部分（9-10文字目）を取り出す
+        next_year, next_month = (year + 1, 1) if month == 12 else (year, month + 1)
+        start = f"{year:04d}-{month:02d}-01"
+        end = f"{next_year:04d}-{next_month:02d}-01"
+        
+        try:
+            rows = self._db.conn.select(
+                "SELECT DISTINCT CAST(substr(created_at, 9, 2) AS INTEGER) FROM entry_meta "
+                "WHERE created_at >= ? AND created_at < ?",
+                (start, end)
+            )
+            days = frozenset(row[0] for row in rows)
+        except Exception as e:
+            logger.error(f"月間のエントリー日の取得に失敗しました: {e}")
+            return frozenset()
+        
+        self._month_days_cache[(year, month)] = days
+        return days
     
     def get_all_tags(self):
         """
@@ -516,13 +1315,11 @@ class DiaryEntryManager:
         Returns:
             list: 使用されているすべてのタグのリスト
         """
-        all_entries = self.get_all_entries()
-        all_tags = set()
-        
-        for entry in all_entries:
-            all_tags.update(entry.tags)
-        
-        return sorted(list(all_tags))
+        try:
+            return sorted(self._get_tag_index())
+        except Exception as e:
+            logger.error(f"タグの取得に失敗しました: {e}")
+            return []
     
     def get_mood_stats(self, date_from=None, date_to=None):
         """
@@ -535,27 +1332,47 @@ class DiaryEntryManager:
         Returns:
             dict: 気分スコアごとのエントリー数
         """
-        entries = self.get_all_entries()
-        
         # 日付でフィルタリング
-        if date_from or date_to:
-            filtered_entries = []
-            for entry in entries:
-                if date_from and entry.created_at < date_from:
-                    continue
-                if date_to and entry.created_at > date_to:
-                    continue
-                filtered_entries.append(entry)
-            entries = filtered_entries
+        conditions = []
+        args = []
+        if date_from:
+            conditions.append("created_at >= ?")
+            args.append(date_from.isoformat())
+        if date_to:
+            conditions.append("created_at <= ?")
+            args.append(date_to.isoformat())
+        
+        sql = "SELECT mood, COUNT(*) FROM entry_meta"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " GROUP BY mood"
         
         # 気分スコアをカウント
         mood_stats = {1: 0, 2: 0, 3: 0, 4: 0, 5: 0}
-        for entry in entries:
-            if entry.mood in mood_stats:
-                mood_stats[entry.mood] += 1
+        try:
+            for mood, count in self._db.conn.select(sql, tuple(args)):
+                if mood in mood_stats:
+                    mood_stats[mood] = count
+        except Exception as e:
+            logger.error(f"気分統計の取得に失敗しました: {e}")
         
         return mood_stats
     
+    def verify_password(self, password):
+        """
+        入力されたパスワードが現在の暗号化パスワードと一致するか確認します。
+        比較は一定時間で行い、パスワード自体を呼び出し側に渡さずに済むようにします。
+        
+        Args:
+            password (str): 確認するパスワード
+            
+        Returns:
+            bool: 一致する場合はTrue
+        """
+        if not self.password or password is None:
+            return False
+        return hmac.compare_digest(password.encode("utf-8"), self.password.encode("utf-8"))
+    
     def change_password(self, new_password):
         """
         暗号化パスワードを変更します。すべてのエントリーを再暗号化します。
@@ -566,26 +1383,47 @@ class DiaryEntryManager:
         Returns:
             bool: パスワード変更が成功したかどうか
         """
+        old_password = self.password
+        old_key = self.key
+        writing = False
         try:
-            # すべてのエントリーを取得
-            all_entries = self.get_all_entries()
+            # すべてのエントリーを現在のキーで復号化（JSONバイト列のまま扱い、オブジェクトには変換しない）
+            # 復号化できないエントリーが1件でもあれば、空のデータで上書きしないよう変更全体を中止する
+            all_blobs = [
+                (entry_id, self._decode_blob(data, strict=True))
+                for entry_id, data in self._db.iteritems()
+            ]
             
             # 新しいパスワードでマネージャーを初期化
-            old_password = self.password
             self.password = new_password
             self._init_encryption()
             
-            # すべてのエントリーを新しいパスワードで再暗号化して保存
-            for entry in all_entries:
-                self.save_entry(entry)
-            
-            logger.info("パスワードが正常に変更されました")
-            return True
+            # すべてのエントリーを新しいパスワードで再暗号化して一括保存
+            writing = True
+            self._reencrypt_entries(all_blobs)
         except Exception as e:
-            # エラーが発生した場合は元のパスワードに戻す
+            # エントリーの保存前にエラーが発生した場合は、書き込み途中のデータを取り消して元のパスワードに戻す
+            if writing:
+                self._rollback()
             self.password = old_password
-            if old_password:
-                self._init_encryption()
+            self.key = old_key
+            
+            # 使われなかった新しいパスワードのキーを保持しない
+            _forget_derived_key()
             
             logger.error(f"パスワードの変更に失敗しました: {e}")
-            return False 
\ No newline at end of file
+            return False
+        
+        # エントリーは新しいキーで保存済みのため、ここから先は失敗しても元のパスワードには戻さない
+        try:
+            failed = self._reencrypt_media_files(old_key)
+        except Exception as e:
+            logger.error(f"メディアファイルの再暗号化に失敗しました: {e}")
+            failed = None
+        
+        if failed is None or failed:
+            count = "一部" if failed is None else f"{len(failed)}件"
+            logger.error(f"パスワードは変更されましたが、{count}のメディアファイルを暗号化し直せませんでした")
+        else:
+            logger.info("パスワードが正常に変更されました")
+        return True 
\ No newline at end of file
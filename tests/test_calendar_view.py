@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+カレンダービューのテスト
+
+カレンダーグリッドが構築できることを確認します。
+"""
+
+import calendar
+import datetime
+import types
+
+import pytest
+
+ft = pytest.importorskip("flet")
+pytest.importorskip("sqlitedict")
+pytest.importorskip("Crypto")
+
+
+@pytest.fixture
+def app(tmp_path, monkeypatch):
+    """
+    一時ディレクトリをホームにした日記マネージャーと、タスクを記録するだけのページを持つアプリを作成します。
+    """
+    monkeypatch.setenv("HOME", str(tmp_path))
+    from models.diary_entry import DiaryEntryManager
+
+    manager = DiaryEntryManager()
+    page = types.SimpleNamespace(tasks=[])
+    page.run_task = lambda *args: page.tasks.append(args)
+    yield types.SimpleNamespace(diary_manager=manager, page=page, selected_date=None)
+    manager.close()
+
+
+def _shift_month(date, delta):
+    """
+    指定された日付の月からdeltaヶ月移動した月の(年, 月)を返します。
+    """
+    index = date.year * 12 + date.month - 1 + delta
+    return index // 12, index % 12 + 1
+
+
+def test_build_calendar_grid(app):
+    """
+    エントリーがある月のカレンダーを構築し、月の日数分の日付セルができることと、
+    エントリーがある日の取得がキャッシュにない月だけバックグラウンドで予約されることを確認します。
+    """
+    from models.diary_entry import DiaryEntry
+    from views.calendar_view import CalendarView
+
+    app.diary_manager.save_entry(DiaryEntry(title="テスト", content="本文"))
+
+    view = CalendarView(app)
+    root = view.build()
+
+    # 前後の月の先読みを完了させてから確認する
+    view._executor.shutdown(wait=True)
+
+    def dot_months():
+        return [task[1:3] for task in app.page.tasks if task[0] == view._apply_entry_dots]
+
+    today = datetime.date.today()
+    assert root is not None
+    assert sorted(view._cells) == list(range(1, calendar.monthrange(today.year, today.month)[1] + 1))
+
+    # 今月はキャッシュにないため、エントリーがある日の取得が予約される
+    assert dot_months() == [(today.year, today.month)]
+
+    # 先読み済みの翌月は、予約せずにグリッドを構築し直せること
+    view.current_year, view.current_month = _shift_month(today, 1)
+    _, cells, _ = view._build_grid_column(view.selected_date, today)
+    assert sorted(cells) == list(range(1, calendar.monthrange(view.current_year, view.current_month)[1] + 1))
+    assert dot_months() == [(today.year, today.month)]
+
+    # 先読みしていない2ヶ月後は、取得が予約されること
+    view.current_year, view.current_month = _shift_month(today, 2)
+    view._build_grid_column(view.selected_date, today)
+    assert dot_months() == [(today.year, today.month), _shift_month(today, 2)]
+
+    # 今月を取得済みにすると、予約せずにエントリーがある日に印が付くこと
+    view._prefetch_month(today.year, today.month)
+    view.current_year, view.current_month = today.year, today.month
+    _, _, entry_days = view._build_grid_column(view.selected_date, today)
+    assert entry_days == {today.day}
+    assert len(dot_months()) == 2
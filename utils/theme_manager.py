@@ -14,12 +14,19 @@
 
 import flet as ft
 import json
-import os
 from pathlib import Path
 import logging
 
 logger = logging.getLogger(__name__)
 
+# テーマモードと設定ファイル上の文字列の対応表
+_MODE_TO_STR = {
+    ft.ThemeMode.LIGHT: "light",
+    ft.ThemeMode.DARK: "dark",
+    ft.ThemeMode.SYSTEM: "system"
+}
+_STR_TO_MODE = {mode_str: mode for mode, mode_str in _MODE_TO_STR.items()}
+
 class ThemeManager:
     """
     アプリケーションのテーマを管理するクラス。
@@ -36,10 +43,15 @@ class ThemeManager:
         self.theme_mode = ft.ThemeMode.SYSTEM
         self.current_theme = "default"
         
-        # 設定ディレクトリの作成
-        if not self.config_dir.exists():
-            os.makedirs(self.config_dir, exist_ok=True)
+        # 生成済みのテーマオブジェクト（ダークモードかどうか → ft.Theme）
+        self._theme_cache = {}
+        
+        # 設定ディレクトリの作成（存在確認は行わず、作成済みの場合の例外で判定する）
+        try:
+            self.config_dir.mkdir(parents=True)
             logger.info(f"設定ディレクトリを作成しました: {self.config_dir}")
+        except FileExistsError:
+            pass
         
         # 設定ファイルの読み込み
         self.load_config()
@@ -102,7 +114,7 @@ class ThemeManager:
         Args:
             mode (ft.ThemeMode): 設定するテーマモード
         """
-        if mode in [ft.ThemeMode.LIGHT, ft.ThemeMode.DARK, ft.ThemeMode.SYSTEM]:
+        if mode in _MODE_TO_STR:
             self.theme_mode = mode
             self.save_config()
             logger.info(f"テーマモードを変更しました: {self._theme_mode_to_string(mode)}")
@@ -126,6 +138,24 @@ class ThemeManager:
         Returns:
             ft.Theme: 現在のテーマオブジェクト
         """
+        # テーマの内容はモードごとに固定のため、一度生成したものを再利用する
+        is_dark = self.theme_mode == ft.ThemeMode.DARK
+        theme = self._theme_cache.get(is_dark)
+        if theme is None:
+            theme = self._build_theme(is_dark)
+            self._theme_cache[is_dark] = theme
+        return theme
+    
+    def _build_theme(self, is_dark):
+        """
+        テーマオブジェクトを生成します。
+        
+        Args:
+            is_dark (bool): ダークモード用のテーマを生成するかどうか
+            
+        Returns:
+            ft.Theme: 生成したテーマオブジェクト
+        """
         # カスタムカラースキーマの定義
         primary_color = ft.colors.BLUE
         secondary_color = ft.colors.TEAL
@@ -162,8 +192,8 @@ class ThemeManager:
             on_background=ft.colors.WHITE,
         )
         
-        # 現在のテーマモードに応じたテーマを返す
-        if self.theme_mode == ft.ThemeMode.DARK:
+        # テーマモードに応じたテーマを返す
+        if is_dark:
             return ft.Theme(
                 color_scheme=dark_scheme,
                 color_scheme_seed=primary_color,
@@ -188,12 +218,7 @@ class ThemeManager:
         Returns:
             str: テーマモードを表す文字列
         """
-        mode_map = {
-            ft.ThemeMode.LIGHT: "light",
-            ft.ThemeMode.DARK: "dark",
-            ft.ThemeMode.SYSTEM: "system"
-        }
-        return mode_map.get(mode, "system")
+        return _MODE_TO_STR.get(mode, "system")
     
     def _string_to_theme_mode(self, mode_str):
         """
@@ -205,9 +230,4 @@ class ThemeManager:
         Returns:
             ft.ThemeMode: 変換されたテーマモード
         """
-        mode_map = {
-            "light": ft.ThemeMode.LIGHT,
-            "dark": ft.ThemeMode.DARK,
-            "system": ft.ThemeMode.SYSTEM
-        }
-        return mode_map.get(mode_str.lower(), ft.ThemeMode.SYSTEM) 
\ No newline at end of file
+        return _STR_TO_MODE.get(mode_str.lower(), ft.ThemeMode.SYSTEM) 
\ No newline at end of file
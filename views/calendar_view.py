@@ -14,18 +14,62 @@
 import flet as ft
 import datetime
 import calendar
-from dateutil.relativedelta import relativedelta
+import asyncio
+import threading
+import functools
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 import logging
 from components.diary_card import DiaryCard
 
 logger = logging.getLogger(__name__)
 
+# 構築済みのカレンダーグリッドを保持する最大数
+_GRID_CACHE_SIZE = 12
+
+# 日付セルの表示文字列（日の数値で添字参照する）
+_DAY_STR = tuple(str(d) for d in range(32))
+
+@functools.lru_cache(maxsize=512)
+def _format_date(date, weekday_ja):
+    """
+    日付を「YYYY年M月D日（曜日）」の形式にフォーマットします。
+    
+    Args:
+        date (datetime.date): フォーマットする日付
+        weekday_ja (str): 曜日の表示文字列
+        
+    Returns:
+        str: フォーマットされた日付文字列
+    """
+    return f"{date.year}年{date.month}月{date.day}日（{weekday_ja}）"
+
+def _group_by_day(entries):
+    """
+    月間の日記エントリーを日ごとにまとめます。
+    
+    Args:
+        entries (list): 同じ月のDiaryEntryオブジェクトのリスト
+        
+    Returns:
+        dict: {日: DiaryEntryオブジェクトのリスト}
+    """
+    entries_by_day = defaultdict(list)
+    for entry in entries:
+        entries_by_day[entry.created_at.day].append(entry)
+    return dict(entries_by_day)
+
 class CalendarView:
     """
     月単位のカレンダーと日記エントリーリストを表示するビュークラス。
     日付選択と過去の日記の閲覧に使用されます。
     """
     
+    # ボタン共通のスタイル
+    _SHARED_BUTTON_STYLE = ft.ButtonStyle(
+        shape=ft.RoundedRectangleBorder(radius=10),
+    )
+    
     def __init__(self, app):
         """
         CalendarViewクラスのコンストラクタ。
@@ -37,21 +81,59 @@ class CalendarView:
         self.diary_manager = app.diary_manager
         
         # 現在表示中の年月
-        self.current_year = datetime.datetime.now().year
-        self.current_month = datetime.datetime.now().month
+        now = datetime.datetime.now()
+        self.current_year = now.year
+        self.current_month = now.month
         
-        # 選択された日付
-        self.selected_date = getattr(app, 'selected_date', None) or datetime.datetime.now().date()
+        # 選択された日付（常にdatetime.dateで保持する）
+        selected_date = getattr(app, 'selected_date', None) or now.date()
+        if isinstance(selected_date, datetime.datetime):
+            selected_date = selected_date.date()
+        self.selected_date = selected_date
         
         # 日本語の曜日と月名
         self.weekdays_ja = ["月", "火", "水", "木", "金", "土", "日"]
         self.months_ja = ["1月", "2月", "3月", "4月", "5月", "6月", 
                          "7月", "8月", "9月", "10月", "11月", "12月"]
         
+        # 年月に依存しない固定のコントロール（曜日のヘッダー行とスペーサー）
+        self._weekday_row = ft.Row([
+            ft.Container(
+                content=ft.Text(day, weight=ft.FontWeight.BOLD),
+                width=40,
+                height=40,
+                alignment=ft.alignment.center,
+            )
+            for day in self.weekdays_ja
+        ], alignment=ft.MainAxisAlignment.SPACE_AROUND)
+        self._header_spacer = ft.Container(width=20)
+        self._grid_spacer = ft.Container(height=20)
+        
+        # 週ごとの日付の並びを計算するカレンダー（月曜始まり）
+        self._cal = calendar.Calendar(firstweekday=0)
+        
         # カレンダーのUIコントロール参照
         self.month_year_text = None
         self.calendar_grid = None
         self.entries_list = None
+        self.entries_header = None
+        
+        # 表示中のエントリーリストの内容（同じ内容なら再構築しない）
+        self._last_entries_signature = None
+        
+        # 月ごとの日記エントリーのキャッシュ（(年, 月) → エントリーリスト）と先読み用の実行器
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._month_cache = {}
+        self._month_cache_version = self.diary_manager.version
+        self._month_cache_lock = threading.Lock()
+        
+        # 構築済みのカレンダーグリッド（(年, 月, 選択日, 今日, データバージョン) → (ft.Column, 日付セル, エントリーがある日)）
+        self._grid_cache = OrderedDict()
+        
+        # 表示中のグリッドの日付セル（日 → ft.Container）とエントリーがある日、キャッシュキー
+        self._cells = {}
+        self._entry_days = set()
+        self._grid_key_current = None
     
     def build(self):
         """
@@ -83,9 +165,7 @@ class CalendarView:
         today_btn = ft.TextButton(
             text="今日",
             on_click=self._on_today_click,
-            style=ft.ButtonStyle(
-                shape=ft.RoundedRectangleBorder(radius=10),
-            ),
+            style=self._SHARED_BUTTON_STYLE,
         )
         
         # カレンダーヘッダー
@@ -93,7 +173,7 @@ class CalendarView:
             prev_month_btn,
             self.month_year_text,
             next_month_btn,
-            ft.Container(width=20),  # スペーサー
+            self._header_spacer,
             today_btn,
         ], alignment=ft.MainAxisAlignment.CENTER)
         
@@ -103,6 +183,7 @@ class CalendarView:
         
         # 選択された日のエントリーリスト
         self.entries_list = ft.Container()
+        self._last_entries_signature = None
         self._build_entries_list()
         
         # 新規作成ボタン
@@ -116,7 +197,7 @@ class CalendarView:
         calendar_container = ft.Container(
             content=ft.Column([
                 calendar_header,
-                ft.Container(height=20),  # スペーサー
+                self._grid_spacer,
                 self.calendar_grid,
             ]),
             padding=20,
@@ -126,7 +207,7 @@ class CalendarView:
         )
         
         # エントリーリストのヘッダー
-        entries_header = ft.Text(
+        self.entries_header = ft.Text(
             self._format_selected_date(),
             size=20,
             weight=ft.FontWeight.BOLD,
@@ -135,7 +216,7 @@ class CalendarView:
         # メインコンテンツを含むスクロール可能なコンテナ
         main_content = ft.Column([
             calendar_container,
-            entries_header,
+            self.entries_header,
             self.entries_list,
         ], scroll=ft.ScrollMode.AUTO, auto_scroll=False)
         
@@ -158,52 +239,78 @@ class CalendarView:
     
     def _build_calendar_grid(self):
         """
-        カレンダーグリッドを構築します。
+        カレンダーグリッドを構築します。同じ表示内容のグリッドは再利用します。
         """
-        # 現在の月の最初の日と最後の日
-        first_day = datetime.date(self.current_year, self.current_month, 1)
-        last_day = (first_day + relativedelta(months=1) - datetime.timedelta(days=1)).day
+        today = datetime.date.today()
+        key = self._grid_key(self.selected_date, today)
+        cached = self._grid_cache.get(key)
+        if cached is None:
+            cached = self._build_grid_column(self.selected_date, today)
+            self._grid_cache[key] = cached
+            if len(self._grid_cache) > _GRID_CACHE_SIZE:
+                self._grid_cache.popitem(last=False)
+        else:
+            self._grid_cache.move_to_end(key)
         
-        # 月の最初の日の曜日（0: 月曜日, 6: 日曜日）
-        first_weekday = first_day.weekday()
+        # カレンダーグリッドを更新（日付セルは選択変更時の部分更新のために保持）
+        grid, self._cells, self._entry_days = cached
+        self._grid_key_current = key
+        self.calendar_grid.content = grid
         
-        # 曜日のヘッダー行
-        weekday_row = ft.Row([
-            ft.Container(
-                content=ft.Text(day, weight=ft.FontWeight.BOLD),
-                width=40,
-                height=40,
-                alignment=ft.alignment.center,
-            )
-            for day in self.weekdays_ja
-        ], alignment=ft.MainAxisAlignment.SPACE_AROUND)
+        # 前後の月のエントリーをバックグラウンドで先読み
+        for delta in (-1, 1):
+            year, month = self._shift_month(self.current_year, self.current_month, delta)
+            self._executor.submit(self._prefetch_month, year, month)
+    
+    def _grid_key(self, selected_date, today):
+        """
+        構築済みグリッドのキャッシュキーを作成します。
         
+        Args:
+            selected_date (datetime.date): 選択された日付
+            today (datetime.date): 今日の日付
+            
+        Returns:
+            tuple: キャッシュキー
+        """
+        # 選択日が別の月にある場合は、表示内容に影響しないためキーに含めない
+        in_month = (selected_date.year, selected_date.month) == (self.current_year, self.current_month)
+        return (
+            self.current_year, self.current_month, selected_date if in_month else None,
+            today, self.diary_manager.version
+        )
+    
+    def _build_grid_column(self, selected_date, today):
+        """
+        現在の年月のカレンダーグリッドのコントロールを生成します。
+        
+        Args:
+            selected_date (datetime.date): 選択された日付
+            today (datetime.date): 今日の日付
+            
+        Returns:
+            tuple: (カレンダーグリッド, 日 → 日付セルの辞書, エントリーがある日の集合)
+        """
         # カレンダーの週ごとの行
         calendar_rows = []
-        day_num = 1
+        cells = {}
         
-        # この月の日記エントリーを取得
-        month_entries = {}
-        try:
-            entries = self.diary_manager.get_entries_by_date(self.current_year, self.current_month)
-            for entry in entries:
-                day = entry.created_at.day
-                if day not in month_entries:
-                    month_entries[day] = []
-                month_entries[day].append(entry)
-        except Exception as e:
-            logger.error(f"月間エントリーの取得中にエラーが発生しました: {e}")
+        # 今日・選択日がこの月にある場合の日（日付オブジェクトをセルごとに作らず日で比較する）
+        current = (self.current_year, self.current_month)
+        today_day = today.day if (today.year, today.month) == current else None
+        selected_day = selected_date.day if (selected_date.year, selected_date.month) == current else None
         
-        # 今日の日付
-        today = datetime.datetime.now().date()
+        # この月の日記エントリーがある日を取得（表示には日の集合のみを使い、エントリー本体は取得しない）
+        entries_by_day = self._peek_month_entries(self.current_year, self.current_month)
+        entry_days = set(entries_by_day) if entries_by_day is not None else set()
         
-        # 週ごとにカレンダー行を作成
-        for week in range(6):  # 最大6週間分
+        # 月に必要な週の数（4〜6週）だけカレンダー行を作成（月の範囲外の日は0）
+        for week in self._cal.monthdayscalendar(self.current_year, self.current_month):
             week_days = []
             
-            for weekday in range(7):  # 各曜日
+            for day_num in week:
                 # 月の開始前または終了後の空白セル
-                if (week == 0 and weekday < first_weekday) or day_num > last_day:
+                if day_num == 0:
                     week_days.append(
                         ft.Container(
                             width=40,
@@ -211,63 +318,33 @@ class CalendarView:
                         )
                     )
                 else:
-                    # 日付を持つセル
-                    day_date = datetime.date(self.current_year, self.current_month, day_num)
-                    
-                    # 今日、選択日、エントリーがある日かをチェック
-                    is_today = day_date == today
-                    # selected_dateがdatetimeオブジェクトかdateオブジェクトかをチェック
-                    if hasattr(self.selected_date, 'date'):
-                        selected_date = self.selected_date.date()
-                    else:
-                        selected_date = self.selected_date
-                    is_selected = day_date == selected_date
-                    has_entries = day_num in month_entries
-                    
-                    # 見た目の設定
-                    bg_color = None
-                    text_color = None
-                    border = None
-                    
-                    if is_selected:
-                        bg_color = ft.colors.PRIMARY
-                        text_color = ft.colors.ON_PRIMARY
-                    elif is_today:
-                        bg_color = ft.colors.PRIMARY_CONTAINER
-                        text_color = ft.colors.ON_PRIMARY_CONTAINER
-                    
-                    if has_entries and not is_selected:
-                        border = ft.border.all(2, ft.colors.SECONDARY)
-                    
                     # 日付セル
                     day_cell = ft.Container(
                         content=ft.Column([
                             ft.Text(
-                                str(day_num),
-                                color=text_color,
-                                weight=ft.FontWeight.BOLD if is_today or is_selected else None,
+                                _DAY_STR[day_num],
                                 text_align=ft.TextAlign.CENTER,
                             ),
-                            ft.Container(
-                                content=ft.Icon(
-                                    ft.icons.CIRCLE,
-                                    size=8,
-                                    color=ft.colors.SECONDARY,
-                                ) if has_entries and not is_selected else None,
-                                height=8,
-                            )
+                            ft.Container(height=8),
                         ], alignment=ft.MainAxisAlignment.CENTER, spacing=2),
                         width=40,
                         height=40,
                         border_radius=20,
-                        bgcolor=bg_color,
-                        border=border,
                         alignment=ft.alignment.center,
-                        on_click=lambda e, d=day_num: self._on_day_click(d),
+                        data=day_num,
+                        on_click=self._on_day_click_event,
                     )
                     
+                    # 今日、選択日、エントリーがある日に応じた見た目を設定
+                    self._style_day_cell(
+                        day_cell,
+                        is_today=day_num == today_day,
+                        is_selected=day_num == selected_day,
+                        has_entries=day_num in entry_days,
+                    )
+                    
+                    cells[day_num] = day_cell
                     week_days.append(day_cell)
-                    day_num += 1
             
             # 週の行を追加
             calendar_rows.append(
@@ -276,32 +353,235 @@ class CalendarView:
                     alignment=ft.MainAxisAlignment.SPACE_AROUND,
                 )
             )
-            
-            # 月の最終日を過ぎたら終了
-            if day_num > last_day:
-                break
         
-        # カレンダーグリッドを更新
-        self.calendar_grid.content = ft.Column(
-            [weekday_row] + calendar_rows,
+        grid = ft.Column(
+            [self._weekday_row] + calendar_rows,
             spacing=10,
         )
+        
+        # 未取得の場合は、エントリーがある日の取得をUIスレッドの外で行い、取得後に印を付ける
+        if entries_by_day is None:
+            self.app.page.run_task(
+                self._apply_entry_dots, self.current_year, self.current_month, cells, entry_days
+            )
+        return grid, cells, entry_days
+    
+    async def _apply_entry_dots(self, year, month, cells, entry_days):
+        """
+        エントリーがある日をバックグラウンドで取得し、該当する日のセルに印を付けます。
+        
+        Args:
+            year (int): 年
+            month (int): 月
+            cells (dict): 日 → 日付セルの辞書
+            entry_days (set): エントリーがある日の集合（取得結果で更新する）
+        """
+        try:
+            days = await asyncio.to_thread(self.diary_manager.get_entry_days_for_month, year, month)
+        except Exception as e:
+            logger.error(f"月間エントリーの取得中にエラーが発生しました: {e}")
+            return
+        
+        entry_days.update(days)
+        
+        # 表示中でないグリッドは選択状態が異なる可能性があるため、キャッシュから外して次回再構築する
+        if cells is not self._cells:
+            for key, (_, cached_cells, _) in list(self._grid_cache.items()):
+                if cached_cells is cells:
+                    del self._grid_cache[key]
+            return
+        
+        today = datetime.date.today()
+        for day in entry_days:
+            cell = cells.get(day)
+            if cell is None:
+                continue
+            day_date = datetime.date(year, month, day)
+            self._style_day_cell(
+                cell,
+                is_today=day_date == today,
+                is_selected=day_date == self.selected_date,
+                has_entries=True,
+            )
+            # まだ画面に追加されていない場合は、追加時に反映される
+            if cell.page:
+                cell.update()
+    
+    def _style_day_cell(self, cell, is_today, is_selected, has_entries):
+        """
+        日付セルの見た目を状態に応じて設定します。
+        
+        Args:
+            cell (ft.Container): 日付セル
+            is_today (bool): 今日かどうか
+            is_selected (bool): 選択日かどうか
+            has_entries (bool): エントリーがある日かどうか
+        """
+        # 見た目の設定
+        bg_color = None
+        text_color = None
+        border = None
+        
+        if is_selected:
+            bg_color = ft.colors.PRIMARY
+            text_color = ft.colors.ON_PRIMARY
+        elif is_today:
+            bg_color = ft.colors.PRIMARY_CONTAINER
+            text_color = ft.colors.ON_PRIMARY_CONTAINER
+        
+        if has_entries and not is_selected:
+            border = ft.border.all(2, ft.colors.SECONDARY)
+        
+        day_text, dot_container = cell.content.controls
+        day_text.color = text_color
+        day_text.weight = ft.FontWeight.BOLD if is_today or is_selected else None
+        dot_container.content = ft.Icon(
+            ft.icons.CIRCLE,
+            size=8,
+            color=ft.colors.SECONDARY,
+        ) if has_entries and not is_selected else None
+        cell.bgcolor = bg_color
+        cell.border = border
+    
+    def _shift_month(self, year, month, delta):
+        """
+        年月を指定した月数だけずらします。
+        
+        Args:
+            year (int): 年
+            month (int): 月
+            delta (int): ずらす月数
+            
+        Returns:
+            tuple: (年, 月)
+        """
+        index = year * 12 + (month - 1) + delta
+        return index // 12, index % 12 + 1
+    
+    def _get_month_entries(self, year, month):
+        """
+        指定された月の日記エントリーを日ごとにまとめて取得します。先読み済みの場合はキャッシュから返します。
+        
+        Args:
+            year (int): 年
+            month (int): 月
+            
+        Returns:
+            dict: {日: DiaryEntryオブジェクトのリスト}
+        """
+        entries_by_day = self._peek_month_entries(year, month)
+        if entries_by_day is not None:
+            return entries_by_day
+        
+        # キャッシュにない場合は同期的に取得
+        version = self.diary_manager.version
+        entries_by_day = _group_by_day(self.diary_manager.get_entries_by_date(year, month))
+        with self._month_cache_lock:
+            if version == self._month_cache_version == self.diary_manager.version:
+                self._month_cache[(year, month)] = entries_by_day
+        return entries_by_day
+    
+    def _peek_month_entries(self, year, month):
+        """
+        指定された月の日記エントリーがキャッシュにあれば返します。データベースには問い合わせません。
+        
+        Args:
+            year (int): 年
+            month (int): 月
+            
+        Returns:
+            dict: {日: DiaryEntryオブジェクトのリスト}。キャッシュにない場合はNone
+        """
+        with self._month_cache_lock:
+            # 日記データが更新されていればキャッシュを破棄
+            if self._month_cache_version != self.diary_manager.version:
+                self._month_cache.clear()
+                self._month_cache_version = self.diary_manager.version
+            
+            return self._month_cache.get((year, month))
+    
+    def _prefetch_month(self, year, month):
+        """
+        指定された月の日記エントリーを取得してキャッシュに格納します（バックグラウンドで実行）。
+        
+        Args:
+            year (int): 年
+            month (int): 月
+        """
+        with self._month_cache_lock:
+            if (year, month) in self._month_cache:
+                return
+            version = self._month_cache_version
+        
+        try:
+            entries_by_day = _group_by_day(self.diary_manager.get_entries_by_date(year, month))
+        except Exception as e:
+            logger.error(f"月間エントリーの先読み中にエラーが発生しました: {e}")
+            return
+        
+        # 取得中に日記データが更新された場合は格納しない
+        with self._month_cache_lock:
+            if version == self._month_cache_version == self.diary_manager.version:
+                self._month_cache[(year, month)] = entries_by_day
     
     def _build_entries_list(self):
         """
         選択された日付の日記エントリーリストを構築します。
         """
-        # 選択された日のエントリーを取得
+        # 選択された日のエントリーを取得（グリッド構築時に取得済みの月間エントリーから絞り込む）
+        selected_date = self.selected_date
+        entries_by_day = self._peek_month_entries(selected_date.year, selected_date.month)
+        if entries_by_day is None:
+            # 未取得の場合は読み込み中の表示にして、UIスレッドの外で取得する
+            self.entries_list.content = ft.Container(
+                content=ft.ProgressRing(),
+                alignment=ft.alignment.center,
+                padding=40,
+            )
+            self._last_entries_signature = None
+            self.app.page.run_task(self._load_entries_list, selected_date)
+            return
+        
+        self._show_entries(entries_by_day.get(selected_date.day, []))
+    
+    async def _load_entries_list(self, selected_date):
+        """
+        選択された日付の日記エントリーをバックグラウンドで取得し、リストを表示します。
+        
+        Args:
+            selected_date (datetime.date): 取得する日付
+        """
         entries = []
         try:
-            entries = self.diary_manager.get_entries_by_date(
-                self.selected_date.year, 
-                self.selected_date.month, 
-                self.selected_date.day
+            entries_by_day = await asyncio.to_thread(
+                self._get_month_entries, selected_date.year, selected_date.month
             )
+            entries = entries_by_day.get(selected_date.day, [])
         except Exception as e:
             logger.error(f"日付のエントリー取得中にエラーが発生しました: {e}")
         
+        # 取得中に別の日が選択された場合は反映しない
+        if selected_date != self.selected_date:
+            return
+        
+        self._show_entries(entries)
+        if self.entries_list.page:
+            self.entries_list.update()
+    
+    def _show_entries(self, entries):
+        """
+        日記エントリーのリストを表示します。
+        
+        Args:
+            entries (list): 表示するDiaryEntryオブジェクトのリスト
+        """
+        # 表示中と同じエントリー（空の場合も含む）であれば再構築しない
+        today = datetime.date.today()
+        signature = (today, self.diary_manager.version, tuple(entry.id for entry in entries))
+        if signature == self._last_entries_signature:
+            return
+        self._last_entries_signature = signature
+        
         # エントリーが無い場合のメッセージ
         if not entries:
             self.entries_list.content = ft.Container(
@@ -318,12 +598,13 @@ class CalendarView:
             )
             return
         
-        # エントリーカードのリスト
+        # エントリーカードのリスト（「今日」は全カードで共通）
         entry_cards = []
         for entry in entries:
             entry_card = DiaryCard(
                 entry=entry,
-                on_click=lambda e, entry_id=entry.id: self._open_entry(entry_id),
+                on_click=functools.partial(self._open_entry, entry.id),
+                today=today,
             )
             entry_cards.append(entry_card)
         
@@ -341,8 +622,7 @@ class CalendarView:
         Returns:
             str: フォーマットされた日付文字列
         """
-        weekday_ja = self.weekdays_ja[self.selected_date.weekday()]
-        return f"{self.selected_date.year}年{self.selected_date.month}月{self.selected_date.day}日（{weekday_ja}）"
+        return _format_date(self.selected_date, self.weekdays_ja[self.selected_date.weekday()])
     
     def _on_prev_month(self, e):
         """
@@ -361,8 +641,7 @@ class CalendarView:
         # UIを更新
         self.month_year_text.value = f"{self.current_year}年 {self.months_ja[self.current_month-1]}"
         self._build_calendar_grid()
-        self.month_year_text.update()
-        self.calendar_grid.update()
+        self.app.page.update(self.month_year_text, self.calendar_grid)
     
     def _on_next_month(self, e):
         """
@@ -381,8 +660,7 @@ class CalendarView:
         # UIを更新
         self.month_year_text.value = f"{self.current_year}年 {self.months_ja[self.current_month-1]}"
         self._build_calendar_grid()
-        self.month_year_text.update()
-        self.calendar_grid.update()
+        self.app.page.update(self.month_year_text, self.calendar_grid)
     
     def _on_today_click(self, e):
         """
@@ -392,7 +670,7 @@ class CalendarView:
             e: イベントデータ
         """
         # 今日の日付に設定
-        today = datetime.datetime.now()
+        today = datetime.date.today()
         self.current_year = today.year
         self.current_month = today.month
         self.selected_date = today
@@ -403,13 +681,21 @@ class CalendarView:
         self._build_entries_list()
         
         # 選択日表示を更新
-        self.app.page.controls[0].content.controls[2].value = self._format_selected_date()
+        self.entries_header.value = self._format_selected_date()
+        
+        # 全てまとめて更新
+        self.app.page.update(
+            self.month_year_text, self.calendar_grid, self.entries_list, self.entries_header
+        )
+    
+    def _on_day_click_event(self, e):
+        """
+        日付セルのクリックイベントを受け取り、セルに保持した日で処理します。
         
-        # 全て更新
-        self.month_year_text.update()
-        self.calendar_grid.update()
-        self.entries_list.update()
-        self.app.page.controls[0].content.controls[2].update()
+        Args:
+            e: イベントデータ
+        """
+        self._on_day_click(e.control.data)
     
     def _on_day_click(self, day):
         """
@@ -419,26 +705,78 @@ class CalendarView:
             day: クリックされた日
         """
         # 選択された日付を更新
-        self.selected_date = datetime.datetime(self.current_year, self.current_month, day)
+        previous_date = self.selected_date
+        self.selected_date = datetime.date(self.current_year, self.current_month, day)
+        
+        # 表示中のグリッドが同じ月・同じデータのものなら、選択が変わった2つのセルだけを更新
+        today = datetime.date.today()
+        previous_key = self._grid_key_current
+        if previous_key is not None and previous_key == self._grid_key(previous_date, today):
+            changed_controls = self._select_day_cell(previous_date, today, previous_key)
+        else:
+            self._build_calendar_grid()
+            changed_controls = [self.calendar_grid]
         
         # UIを更新
-        self._build_calendar_grid()
         self._build_entries_list()
         
         # 選択日表示を更新
-        self.app.page.controls[0].content.controls[2].value = self._format_selected_date()
+        self.entries_header.value = self._format_selected_date()
+        
+        # まとめて更新
+        self.app.page.update(*changed_controls, self.entries_list, self.entries_header)
+    
+    def _select_day_cell(self, previous_date, today, previous_key):
+        """
+        表示中のグリッドで、選択状態が変わった日付セルの見た目だけを更新します。
+        
+        Args:
+            previous_date (datetime.date): 以前の選択日
+            today (datetime.date): 今日の日付
+            previous_key (tuple): 表示中のグリッドのキャッシュキー
+            
+        Returns:
+            list: 見た目を変更した日付セルのリスト
+        """
+        current = (self.current_year, self.current_month)
+        changed_cells = []
+        
+        # 以前の選択日を元の見た目に戻す
+        if (previous_date.year, previous_date.month) == current and previous_date.day in self._cells:
+            cell = self._cells[previous_date.day]
+            self._style_day_cell(
+                cell,
+                is_today=previous_date == today,
+                is_selected=False,
+                has_entries=previous_date.day in self._entry_days,
+            )
+            changed_cells.append(cell)
+        
+        # 新しい選択日を選択状態にする
+        cell = self._cells[self.selected_date.day]
+        self._style_day_cell(
+            cell,
+            is_today=self.selected_date == today,
+            is_selected=True,
+            has_entries=self.selected_date.day in self._entry_days,
+        )
+        changed_cells.append(cell)
+        
+        # グリッドの内容が変わったため、キャッシュキーを付け替える
+        cached = self._grid_cache.pop(previous_key)
+        key = self._grid_key(self.selected_date, today)
+        self._grid_cache[key] = cached
+        self._grid_key_current = key
         
-        # 更新
-        self.calendar_grid.update()
-        self.entries_list.update()
-        self.app.page.controls[0].content.controls[2].update()
+        return changed_cells
     
-    def _open_entry(self, entry_id):
+    def _open_entry(self, entry_id, e=None):
         """
         エントリーを開くためのイベントハンドラ。
         
         Args:
             entry_id: 開くエントリーのID
+            e: イベントデータ（未使用）
         """
         # エントリーIDをアプリの状態に保存
         self.app.current_entry_id = entry_id
@@ -451,8 +789,7 @@ class CalendarView:
         新規エントリー作成ボタンがクリックされたときのイベントハンドラ。
         """
         # 選択された日付をアプリの状態に保存
-        if hasattr(self.app, 'current_entry_id'):
-            delattr(self.app, 'current_entry_id')
+        self.app.current_entry_id = None
             
         # エディター画面に移動
         self.app.navigate("editor") 
\ No newline at end of file
@@ -12,21 +12,255 @@
 """
 
 import flet as ft
+import asyncio
 import datetime
 import logging
 import os
 import re
+import functools
 from components.mood_tracker import MoodTracker
 from models.diary_entry import DiaryEntry
 
 logger = logging.getLogger(__name__)
 
+# build()で毎回参照するアイコン名と色
+_ICON_TITLE = ft.icons.TITLE
+_ICON_TAG = ft.icons.TAG
+_ICON_SAVE = ft.icons.SAVE
+_ICON_VISIBILITY = ft.icons.VISIBILITY
+_ICON_CODE = ft.icons.CODE
+_ICON_EDIT = ft.icons.EDIT
+_ICON_ARTICLE = ft.icons.ARTICLE_OUTLINED
+_COLOR_ON_SURFACE_VARIANT = ft.colors.ON_SURFACE_VARIANT
+_COLOR_SURFACE = ft.colors.SURFACE
+
+# プレビュー用に処理済みの本文を保持する件数（メモリ使用量は件数×本文サイズが上限）
+_PREVIEW_CACHE_SIZE = 32
+
+# ブロック単位の処理結果を保持する件数
+_PREVIEW_BLOCK_CACHE_SIZE = 256
+
+# マークダウンの画像パターン: ![alt](path)（パス部分は括弧を含まない範囲に限定する）
+_IMG_PATTERN = re.compile(r'!\[.*?\]\(([^)]*?)\)')
+
+# 変換不要な画像参照の接頭辞
+_URI_PREFIXES = ('http://', 'https://', 'data:', 'file://')
+
+# 実行環境がWindowsかどうか
+_IS_WINDOWS = os.name == 'nt'
+
+# 囲み型書式の (前, 後ろ) からフォーマットタイプへの対応（リンクは後ろが可変のため別扱い）
+_PREFIX_SUFFIX_TO_FORMAT = {
+    ("**", "**"): "bold",
+    ("*", "*"): "italic",
+    ("<u>", "</u>"): "underline",
+    ("~~", "~~"): "strikethrough",
+    ("```", "```"): "code",
+}
+
+# 直接挿入時のフォーマットタイプごとのプレースホルダー
+_PLACEHOLDERS = {
+    "bold": "太字テキスト",
+    "italic": "斜体テキスト",
+    "underline": "下線テキスト",
+    "strikethrough": "取り消し線テキスト",
+    "code": "コードブロック",
+    "link": "リンクテキスト",
+}
+
+# 単語の末尾から切り離す句読点
+_TRAILING_PUNCTUATION = frozenset('.,!?)]}')
+
+# 入力されるとアクティブなフォーマットを適用する文字
+_FORMAT_FLUSH_CHARS = frozenset(' \n\t') | _TRAILING_PUNCTUATION
+
+# 入力中に適用するフォーマットの {フォーマットタイプ: (前に付ける記号, 後ろに付ける記号)}
+_ACTIVE_FORMAT_MARKERS = {
+    "bold": ("**", "**"),
+    "italic": ("*", "*"),
+    "underline": ("<u>", "</u>"),
+    "strikethrough": ("~~", "~~"),
+    "code": ("`", "`"),
+    "link": ("[", "](https://example.com)"),
+}
+
+# タグの区切り（前後の空白も含めて分割する）
+_TAG_SPLIT = re.compile(r'\s*,\s*')
+
+# マークダウンのブロック区切り（空行）。区切り自体も保持するためキャプチャする
+_BLOCK_SPLIT_RE = re.compile(r'(\n\s*\n)')
+
+# 入力イベントをまとめるまでの待ち時間（秒）
+_FIELD_CHANGE_DEBOUNCE = 0.3
+
+@functools.lru_cache(maxsize=64)
+def _format_created_at(year, month, day, hour, minute):
+    """
+    作成日時を「作成日時: YYYY年MM月DD日 HH:MM」の形式にフォーマットします。
+    
+    Args:
+        year (int): 年
+        month (int): 月
+        day (int): 日
+        hour (int): 時
+        minute (int): 分
+        
+    Returns:
+        str: フォーマットされた作成日時の文字列
+    """
+    return f"作成日時: {year:04d}年{month:02d}月{day:02d}日 {hour:02d}:{minute:02d}"
+
+@functools.lru_cache(maxsize=256)
+def _image_path_to_uri(img_path):
+    """
+    ローカルの画像パスを表示用のfile:// URIに変換します。
+    
+    Args:
+        img_path (str): 画像ファイルのパス
+        
+    Returns:
+        str: 変換後のURI（ファイルが存在しない場合はNone）
+    """
+    if not os.path.exists(img_path):
+        # ファイルが存在しない場合は警告ログを出力
+        logger.warning(f"画像ファイルが見つかりません: {img_path}")
+        return None
+    
+    # 絶対パスに変換
+    abs_path = os.path.abspath(img_path)
+    
+    # パスを変換
+    if _IS_WINDOWS:
+        # バックスラッシュをスラッシュに変換し、file:///C:/path 形式のURIを作成
+        img_uri = "file:///" + abs_path.replace('\\', '/')
+    else:  # Unix系
+        img_uri = "file://" + abs_path
+    
+    logger.info(f"画像パス変換: {img_path} -> {img_uri}")
+    return img_uri
+
+def _process_markdown_image_paths(md_text):
+    """
+    マークダウン内の画像パスを表示用に処理します。
+    Base64エンコードを使わず、file:// プロトコルを使用します。
+    
+    Args:
+        md_text (str): 処理するマークダウンテキスト
+        
+    Returns:
+        str: 画像パスが処理されたマークダウンテキスト
+    """
+    # 画像参照を含まないテキストは正規表現を走らせずにそのまま返す
+    if not md_text or "![" not in md_text:
+        return md_text or ""
+    
+    try:
+        def replace_img_path(match):
+            img_path = match.group(1)
+            
+            # 既にURLや埋め込み画像、file:// URIの場合はそのまま
+            if img_path.startswith(_URI_PREFIXES):
+                return match.group(0)
+            
+            # ローカルパスの場合は適切なURIに変換（変換結果はパスごとにキャッシュ）
+            img_uri = _image_path_to_uri(img_path)
+            if img_uri is None:
+                return match.group(0)
+            return match.group(0).replace(img_path, img_uri)
+        
+        return _IMG_PATTERN.sub(replace_img_path, md_text)
+    except Exception as e:
+        logger.error(f"画像パス処理エラー: {e}", exc_info=True)
+        return md_text
+
+@functools.lru_cache(maxsize=_PREVIEW_BLOCK_CACHE_SIZE)
+def _process_preview_block(block):
+    """
+    マークダウンの1ブロック分の画像パスを表示用に処理します。
+    
+    Args:
+        block (str): 空行で区切られたマークダウンのブロック
+        
+    Returns:
+        str: 画像パスが処理されたブロック
+    """
+    return _process_markdown_image_paths(block)
+
+@functools.lru_cache(maxsize=_PREVIEW_CACHE_SIZE)
+def _render_preview_markdown(md_text):
+    """
+    プレビュー用に処理したマークダウンを取得します。
+    本文全体とブロック単位の両方で処理結果を再利用します。
+    
+    Args:
+        md_text (str): 処理するマークダウンテキスト
+        
+    Returns:
+        str: プレビュー用に処理されたマークダウンテキスト
+    """
+    parts = _BLOCK_SPLIT_RE.split(md_text)
+    # 偶数番目がブロック、奇数番目が区切り
+    parts[::2] = [_process_preview_block(block) for block in parts[::2]]
+    return "".join(parts)
+
 class EditorView:
     """
     日記の作成と編集のためのエディタービュークラス。
     リッチテキスト編集機能と各種メタデータ入力フォームを提供します。
     """
     
+    # ボタン共通のスタイル
+    _SHARED_BUTTON_STYLE = ft.ButtonStyle(
+        shape=ft.RoundedRectangleBorder(radius=10),
+    )
+    
+    # ツールバーの囲み型書式 {ボタン名: (前に挿入するテキスト, 後ろに挿入するテキスト)}
+    _SYNTAX_ACTIONS = {
+        "bold": ("**", "**"),
+        "italic": ("*", "*"),
+        "underline": ("<u>", "</u>"),
+        "strikethrough": ("~~", "~~"),
+        "code": ("```", "```"),
+        "link": ("[", "](https://example.com)"),
+    }
+    
+    # ツールバーの行頭型書式 {ボタン名: 行頭に挿入するテキスト}
+    _PREFIX_ACTIONS = {
+        "bullet": "- ",
+        "numbered": "1. ",
+        "quote": "> ",
+        "heading1": "# ",
+        "heading2": "## ",
+        "heading3": "### ",
+    }
+    
+    # 書式設定ツールバーのボタン配置 ((書式の種類, ボタン名, アイコン, ツールチップ), ...) のグループ
+    _TOOLBAR_GROUPS = (
+        (
+            ("syntax", "bold", ft.icons.FORMAT_BOLD, "太字"),
+            ("syntax", "italic", ft.icons.FORMAT_ITALIC, "斜体"),
+            ("syntax", "underline", ft.icons.FORMAT_UNDERLINED, "下線"),
+            ("syntax", "strikethrough", ft.icons.FORMAT_STRIKETHROUGH, "取り消し線"),
+        ),
+        (
+            ("prefix", "bullet", ft.icons.FORMAT_LIST_BULLETED, "箇条書き"),
+            ("prefix", "numbered", ft.icons.FORMAT_LIST_NUMBERED, "番号付きリスト"),
+            ("prefix", "quote", ft.icons.FORMAT_QUOTE, "引用"),
+        ),
+        (
+            ("heading", None, ft.icons.TITLE, "見出し"),
+            ("syntax", "code", ft.icons.CODE, "コード"),
+            ("syntax", "link", ft.icons.LINK, "リンク"),
+        ),
+    )
+    
+    # 見出しメニューの項目 ((ボタン名, 表示名), ...)
+    _HEADING_ITEMS = (
+        ("heading1", "見出し 1"),
+        ("heading2", "見出し 2"),
+        ("heading3", "見出し 3"),
+    )
+    
     def __init__(self, app):
         """
         EditorViewクラスのコンストラクタ。
@@ -45,10 +279,31 @@ class EditorView:
         self.tag_field = None
         self.mood_tracker = None
         
+        # リアルタイムプレビューの表示状態とコンテナ（初回のbuild()で作成）
+        self.is_realtime_preview = False
+        self.preview_container = None
+        
         # リアルタイムプレビュー用の参照
         self.preview_title_ref = ft.Ref[ft.Text]()
         self.preview_content_ref = ft.Ref[ft.Markdown]()
         
+        # 古い処理結果で上書きしないための通し番号
+        self._preview_seq = 0
+        # 最後にプレビューへ反映した本文
+        self._last_rendered_text = None
+        
+        # デバウンス中のプレビュー更新タスク
+        self._preview_task = None
+        
+        # 内容に依存しないツールバーとボタンは一度だけ構築して再利用する
+        self._formatting_toolbar = None
+        self._media_toolbar = None
+        self._action_buttons = None
+        self._format_toggle_button = None
+        
+        # 画像選択用のファイルピッカー（初回クリック時に生成）
+        self._file_picker = None
+        
         # フォーマットモード管理
         self.active_format = None
         self.format_modes = {
@@ -72,150 +327,179 @@ class EditorView:
             # 既存のエントリーを編集するか、新規作成するかを判断
             self._load_entry()
             
-            # タイトル入力フィールド
-            self.title_field = ft.TextField(
-                label="タイトル",
-                value=self.current_entry.title if self.current_entry else "",
-                border_radius=10,
-                text_size=18,
-                autofocus=True,
-                prefix_icon=ft.icons.TITLE,
-                on_change=self._on_field_change,
-            )
-            
-            # 日付表示
-            created_date = self.current_entry.created_at if self.current_entry else datetime.datetime.now()
-            date_str = created_date.strftime("%Y年%m月%d日 %H:%M")
-            date_display = ft.Text(f"作成日時: {date_str}", size=14, color=ft.colors.ON_SURFACE_VARIANT)
-            
-            # タグ入力フィールド
-            current_tags = ", ".join(self.current_entry.tags) if self.current_entry and self.current_entry.tags else ""
-            self.tag_field = ft.TextField(
-                label="タグ（カンマ区切り）",
-                value=current_tags,
-                border_radius=10,
-                prefix_icon=ft.icons.TAG,
-                on_change=self._on_field_change,
-                helper_text="例: 仕事, 家族, 旅行",
-            )
-            
-            # 気分トラッカー
-            initial_mood = None
-            if self.current_entry:
-                initial_mood = self.current_entry.mood
-            elif hasattr(self.app, 'current_mood') and self.app.current_mood:
-                initial_mood = self.app.current_mood
-            
-            self.mood_tracker = MoodTracker(
-                on_mood_selected=self._on_mood_selected,
-                initial_mood=initial_mood
-            )
-            
-            # メディアボタン
-            media_button = ft.ElevatedButton(
-                "画像を追加",
-                icon=ft.icons.IMAGE,
-                style=ft.ButtonStyle(
-                    shape=ft.RoundedRectangleBorder(radius=10),
-                ),
-                on_click=self._on_add_media_click,
-            )
-            
-            # フォーマットツールバー
-            formatting_toolbar = self._build_formatting_toolbar()
-            
-            # コンテンツ入力フィールド
-            self.content_field = ft.TextField(
-                value=self.current_entry.content if self.current_entry else "",
-                multiline=True,
-                min_lines=10,
-                max_lines=30,
-                text_size=16,
-                border_radius=10,
-                on_change=self._on_field_change,
+            if self.is_new_entry:
+                return self._build_new()
+            return self._build_edit(self.current_entry)
+        except Exception as e:
+            logger.error(f"エディター画面の構築中にエラーが発生しました: {e}", exc_info=True)
+            return ft.Container(
+                content=ft.Column([
+                    ft.Text("エラーが発生しました。後でもう一度お試しください。", style=ft.TextStyle(color=ft.colors.ERROR)),
+                    ft.ElevatedButton("ホームに戻る", on_click=lambda _: self.app.navigate("home")),
+                ]),
+                padding=20,
+                expand=True,
             )
+    
+    def _build_new(self):
+        """
+        新規エントリー用のエディター画面を構築します。
+        
+        Returns:
+            ft.Container: エディター画面のUIコンテナ
+        """
+        return self._build_editor(
+            title="",
+            content="",
+            tags="",
+            created_date=datetime.datetime.now(),
+            initial_mood=self.app.current_mood or None,
+            is_markdown=False,
+        )
+    
+    def _build_edit(self, entry):
+        """
+        既存エントリー編集用のエディター画面を構築します。
+        
+        Args:
+            entry (DiaryEntry): 編集するエントリー
             
-            # メディアツールバー
-            media_toolbar = self._build_media_toolbar()
+        Returns:
+            ft.Container: エディター画面のUIコンテナ
+        """
+        return self._build_editor(
+            title=entry.title,
+            content=entry.content,
+            tags=entry.tags_csv,
+            created_date=entry.created_at,
+            initial_mood=entry.mood,
+            is_markdown=getattr(entry, 'is_markdown', False),
+        )
+    
+    def _build_editor(self, title, content, tags, created_date, initial_mood, is_markdown):
+        """
+        エディター画面の共通部分を、与えられた初期値で構築します。
+        
+        Args:
+            title (str): タイトルの初期値
+            content (str): 本文の初期値
+            tags (str): カンマ区切りのタグの初期値
+            created_date (datetime.datetime): 表示する作成日時
+            initial_mood (int): 気分スコアの初期値
+            is_markdown (bool): マークダウン形式で保存するかどうか
             
-            # 保存ボタンとその他のアクションボタン
-            action_buttons = ft.Row([
-                ft.FilledButton(
-                    text="保存",
-                    icon=ft.icons.SAVE,
-                    on_click=self._on_save_click,
-                ),
-                ft.OutlinedButton(
-                    text="記事表示モード",
-                    icon=ft.icons.VISIBILITY,
-                    on_click=self._on_preview_click,
-                ),
-                ft.OutlinedButton(
-                    text=f"{'マークダウン' if self.current_entry and getattr(self.current_entry, 'is_markdown', False) else 'リッチテキスト'}として保存",
-                    icon=ft.icons.CODE,
-                    on_click=self._on_format_toggle,
-                    tooltip="マークダウンとリッチテキスト形式を切り替えます",
-                )
-            ])
+        Returns:
+            ft.Container: エディター画面のUIコンテナ
+        """
+        # タイトル入力フィールド
+        self.title_field = ft.TextField(
+            label="タイトル",
+            value=title,
+            border_radius=10,
+            text_size=18,
+            autofocus=True,
+            prefix_icon=_ICON_TITLE,
+            on_change=self._on_field_change,
+        )
+        
+        # 日付表示
+        date_display = ft.Text(
+            _format_created_at(
+                created_date.year, created_date.month, created_date.day,
+                created_date.hour, created_date.minute,
+            ),
+            size=14,
+            color=_COLOR_ON_SURFACE_VARIANT,
+        )
+        
+        # タグ入力フィールド
+        self.tag_field = ft.TextField(
+            label="タグ（カンマ区切り）",
+            value=tags,
+            border_radius=10,
+            prefix_icon=_ICON_TAG,
+            on_change=self._on_field_change,
+            helper_text="例: 仕事, 家族, 旅行",
+        )
+        
+        # 気分トラッカー
+        self.mood_tracker = MoodTracker(
+            on_mood_selected=self._on_mood_selected,
+            initial_mood=initial_mood
+        )
+        
+        # フォーマットツールバー
+        formatting_toolbar = self._build_formatting_toolbar()
+        
+        # コンテンツ入力フィールド
+        self.content_field = ft.TextField(
+            value=content,
+            multiline=True,
+            min_lines=10,
+            max_lines=30,
+            text_size=16,
+            border_radius=10,
+            on_change=self._on_field_change,
+        )
+        
+        # メディアツールバー
+        media_toolbar = self._build_media_toolbar()
+        
+        # 保存ボタンとその他のアクションボタン
+        action_buttons = self._build_action_buttons(is_markdown)
 
-            # エディター部分
-            editor_section = ft.Column([
-                self.title_field,
-                # 日付表示とタグフィールドを水平に配置し、間にスペースを挿入
-                ft.Row([date_display, ft.Container(expand=True), self.tag_field], alignment=ft.MainAxisAlignment.SPACE_BETWEEN),
-                ft.Divider(),
-                formatting_toolbar,
-                self.content_field,
-                media_toolbar,
-                action_buttons,
-            ], spacing=15)
+        # エディター部分
+        editor_section = ft.Column([
+            self.title_field,
+            # 日付表示とタグフィールドを水平に配置し、間にスペースを挿入
+            ft.Row([date_display, ft.Container(expand=True), self.tag_field], alignment=ft.MainAxisAlignment.SPACE_BETWEEN),
+            ft.Divider(),
+            formatting_toolbar,
+            self.content_field,
+            media_toolbar,
+            action_buttons,
+        ], spacing=15)
 
-            # プレビューコンテナ（初期状態では表示しない）
+        # プレビューコンテナ（初期状態では表示しない）
+        # 一度だけ作成して再利用し、中身は初めてプレビューを開いたときに構築する
+        if self.preview_container is None:
             self.preview_container = ft.Container(
                 visible=False,
-                content=self._build_preview(),
-                bgcolor=ft.colors.SURFACE,
+                content=None,
+                bgcolor=_COLOR_SURFACE,
                 border_radius=10,
                 padding=20,
                 margin=ft.margin.only(top=20),
             )
-            
-            # メインのスクロール可能なコンテンツ領域
-            main_content = ft.Column(
-                [
-                    editor_section,
-                    self.preview_container
-                ],
-                scroll=ft.ScrollMode.AUTO,
-                auto_scroll=False,
-                spacing=20
-            )
-            
-            # 全体のコンテナ
-            return ft.Container(
-                content=main_content,
-                padding=20,
-                width=float('inf'),
-                height=float('inf'),
-            )
-        except Exception as e:
-            logger.error(f"エディター画面の構築中にエラーが発生しました: {e}", exc_info=True)
-            return ft.Container(
-                content=ft.Column([
-                    ft.Text("エラーが発生しました。後でもう一度お試しください。", style=ft.TextStyle(color=ft.colors.ERROR)),
-                    ft.ElevatedButton("ホームに戻る", on_click=lambda _: self.app.navigate("home")),
-                ]),
-                padding=20,
-                width=float('inf'),
-                height=float('inf'),
-            )
+        else:
+            # 編集モードの状態から始める
+            self.preview_container.visible = False
+        self.is_realtime_preview = False
+        
+        # メインのスクロール可能なコンテンツ領域
+        main_content = ft.Column(
+            [
+                editor_section,
+                self.preview_container
+            ],
+            scroll=ft.ScrollMode.AUTO,
+            auto_scroll=False,
+            spacing=20
+        )
+        
+        # 全体のコンテナ
+        return ft.Container(
+            content=main_content,
+            padding=20,
+            expand=True,
+        )
     
     def _load_entry(self):
         """
         編集するエントリーを読み込みます。
         """
         # アプリの状態から編集するエントリーIDを取得
-        entry_id = getattr(self.app, 'current_entry_id', None)
+        entry_id = self.app.current_entry_id
         
         if entry_id:
             # 既存のエントリーを読み込む
@@ -233,8 +517,7 @@ class EditorView:
             self.is_new_entry = True
         
         # 編集後はIDをクリア
-        if hasattr(self.app, 'current_entry_id'):
-            delattr(self.app, 'current_entry_id')
+        self.app.current_entry_id = None
     
     def _on_field_change(self, e):
         """
@@ -247,22 +530,51 @@ class EditorView:
         # アクティブなフォーマットモードがある場合の処理
         if e.control == self.content_field and self.active_format:
             # 最後に入力された文字を取得（簡易的）
-            current_value = self.content_field.value or ""
-            last_char = current_value[-1:] if current_value else ""
+            current_value = self.content_field.value
             
             # スペースや改行が入力された場合はフォーマットを適用
-            if last_char in [' ', '\n', '\t', '.', ',', '!', '?', ')', ']', '}']:
+            if current_value and current_value[-1] in _FORMAT_FLUSH_CHARS:
                 self._apply_active_format()
         
-        # リアルタイムプレビューモードの場合も更新
-        if hasattr(self, 'is_realtime_preview') and self.is_realtime_preview:
+        # リアルタイムプレビュー中のみ、入力が落ち着いてからプレビューを更新する
+        if self.is_realtime_preview:
+            self._schedule_preview_update(e.control)
+    
+    def _schedule_preview_update(self, control):
+        """
+        プレビューの更新を、最後の入力から一定時間経過後に予約します。
+        入力が続く間は予約済みの更新を取り消して予約し直します。
+        
+        Args:
+            control: 変更されたコントロール
+        """
+        if self._preview_task is not None:
+            self._preview_task.cancel()
+        self._preview_task = self.app.page.run_task(self._refresh_preview_debounced, control)
+    
+    async def _refresh_preview_debounced(self, control):
+        """
+        一定時間待ってから、フィールドの変更内容をプレビューに反映します。
+        
+        Args:
+            control: 変更されたコントロール
+        """
+        await asyncio.sleep(_FIELD_CHANGE_DEBOUNCE)
+        self._preview_task = None
+        try:
+            # プレビューが閉じられていれば何もしない
+            if not self.is_realtime_preview:
+                return
+            
             # コンテンツの更新
-            if e.control == self.content_field:
+            if control == self.content_field:
                 self._update_realtime_preview_content()
             
             # タイトルの更新
-            if e.control == self.title_field:
+            if control == self.title_field:
                 self._update_realtime_preview_title()
+        except Exception as e:
+            logger.error(f"入力内容の反映中にエラーが発生しました: {e}", exc_info=True)
     
     def _on_mood_selected(self, mood):
         """
@@ -272,8 +584,7 @@ class EditorView:
             mood: 選択された気分スコア（1-5）
         """
         # 現在の気分を更新
-        if hasattr(self.app, 'current_mood'):
-            delattr(self.app, 'current_mood')
+        self.app.current_mood = mood
     
     def _on_add_media_click(self, e):
         """
@@ -282,35 +593,41 @@ class EditorView:
         Args:
             e: イベントデータ
         """
-        # ファイル選択ダイアログを表示
-        def pick_files_result(e: ft.FilePickerResultEvent):
-            if e.files:
-                for f in e.files:
-                    logger.info(f"選択されたファイル: {f.name}, {f.path}")
-                    
-                    # ファイルパスを取得
-                    file_path = f.path
-                    
-                    # 画像のマークダウン構文を挿入
-                    if file_path:
-                        self._insert_markdown_syntax(f"![{f.name}](", f"{file_path})")
-                    else:
-                        # パスが取得できない場合はエラーメッセージを表示
-                        self.app.page.show_snack_bar(
-                            ft.SnackBar(ft.Text("画像パスの取得に失敗しました"))
-                        )
-        
-        # ファイルピッカーを作成
-        file_picker = ft.FilePicker(on_result=pick_files_result)
-        self.app.page.overlay.append(file_picker)
-        self.app.page.update()
+        # ファイルピッカーは一度だけ作成してオーバーレイに登録する
+        if self._file_picker is None:
+            self._file_picker = ft.FilePicker(on_result=self._on_pick_files_result)
+            self.app.page.overlay.append(self._file_picker)
+            self.app.page.update()
         
         # 画像ファイルのみ選択可能に
-        file_picker.pick_files(
+        self._file_picker.pick_files(
             allowed_extensions=["png", "jpg", "jpeg", "gif"],
             allow_multiple=False,
         )
     
+    def _on_pick_files_result(self, e: ft.FilePickerResultEvent):
+        """
+        ファイル選択ダイアログの結果を処理します。
+        
+        Args:
+            e (ft.FilePickerResultEvent): ファイル選択結果
+        """
+        if e.files:
+            for f in e.files:
+                logger.info(f"選択されたファイル: {f.name}, {f.path}")
+                
+                # ファイルパスを取得
+                file_path = f.path
+                
+                # 画像のマークダウン構文を挿入
+                if file_path:
+                    self._insert_markdown_syntax(f"![{f.name}](", f"{file_path})")
+                else:
+                    # パスが取得できない場合はエラーメッセージを表示
+                    self.app.page.show_snack_bar(
+                        ft.SnackBar(ft.Text("画像パスの取得に失敗しました"))
+                    )
+    
     def _insert_markdown_syntax(self, prefix, suffix):
         """
         マークダウン構文を挿入または、フォーマットモードを切り替えます。
@@ -319,35 +636,25 @@ class EditorView:
             prefix: 選択範囲の前に挿入するテキスト
             suffix: 選択範囲の後に挿入するテキスト
         """
-        # フォーマットタイプを特定
-        format_type = None
-        if prefix == "**" and suffix == "**":
-            format_type = "bold"
-        elif prefix == "*" and suffix == "*":
-            format_type = "italic"
-        elif prefix == "<u>" and suffix == "</u>":
-            format_type = "underline"
-        elif prefix == "~~" and suffix == "~~":
-            format_type = "strikethrough"
-        elif prefix == "```" and suffix == "```":
-            format_type = "code"
-        elif prefix == "[" and suffix.startswith("]("):
-            format_type = "link"
-        
         # 画像挿入の場合は特別処理
         if prefix.startswith("![") and suffix.endswith(")"):
             # 現在の値を取得
             current_value = self.content_field.value or ""
             # 挿入 (suffixにはすでにパスが含まれている)
-            new_value = current_value + prefix + suffix
+            new_value = "".join((current_value, prefix, suffix))
             self.content_field.value = new_value
             self.content_field.update()
             
             # リアルタイムプレビューの更新
-            if hasattr(self, 'is_realtime_preview') and self.is_realtime_preview:
+            if self.is_realtime_preview:
                 self._update_realtime_preview_content()
             return
         
+        # フォーマットタイプを特定
+        format_type = _PREFIX_SUFFIX_TO_FORMAT.get((prefix, suffix))
+        if format_type is None and prefix == "[" and suffix.startswith("]("):
+            format_type = "link"
+        
         # フォーマットモード切替え
         if format_type and format_type in self.format_modes:
             # 現在のモードを反転
@@ -376,29 +683,15 @@ class EditorView:
             current_value = self.content_field.value or ""
             
             # 選択テキストがない場合は、プレースホルダーを表示
-            placeholder = ""
-            if prefix == "**" and suffix == "**":
-                placeholder = "太字テキスト"
-            elif prefix == "*" and suffix == "*":
-                placeholder = "斜体テキスト"
-            elif prefix == "<u>" and suffix == "</u>":
-                placeholder = "下線テキスト"
-            elif prefix == "~~" and suffix == "~~":
-                placeholder = "取り消し線テキスト"
-            elif prefix == "```" and suffix == "```":
-                placeholder = "コードブロック"
-            elif prefix == "[" and suffix.startswith("]("):
-                placeholder = "リンクテキスト"
-            else:
-                placeholder = "テキスト"
+            placeholder = _PLACEHOLDERS.get(format_type, "テキスト")
             
             # 挿入
-            new_value = current_value + prefix + placeholder + suffix
+            new_value = "".join((current_value, prefix, placeholder, suffix))
             self.content_field.value = new_value
             self.content_field.update()
         
         # リアルタイムプレビューの更新
-        if hasattr(self, 'is_realtime_preview') and self.is_realtime_preview:
+        if self.is_realtime_preview:
             self._update_realtime_preview_content()
     
     def _get_format_name(self, format_type):
@@ -455,86 +748,58 @@ class EditorView:
             placeholder = "引用テキスト"
         
         # カーソル位置に応じて挿入（簡易的な実装）
-        lines = current_value.split("\n")
-        if lines:
-            lines[0] = prefix + placeholder
-            self.content_field.value = "\n".join(lines)
-            self.content_field.update()
+        # 全行を分割せず、先頭行だけを置き換える
+        first_break = current_value.find("\n")
+        rest = current_value[first_break:] if first_break != -1 else ""
+        self.content_field.value = prefix + placeholder + rest
+        self.content_field.update()
             
         # リアルタイムプレビューの更新
-        if hasattr(self, 'is_realtime_preview') and self.is_realtime_preview:
+        if self.is_realtime_preview:
             self._update_realtime_preview_content()
             
     def _update_realtime_preview_content(self):
         """
         リアルタイムプレビューのコンテンツを更新します。
-        マークダウンを直接コンポーネントに設定します。
+        画像パスの処理はワーカースレッドで行い、UIスレッドを塞がないようにします。
+        反映はワーカー処理後にMarkdownウィジェット単位で行います。
         """
-        if self.preview_content_ref.current:
-            # コンテンツをそのままMarkdownウィジェットに設定
-            md_content = self.content_field.value or ""
-            
-            # 画像パスをフルパスに変換
-            md_content = self._process_markdown_image_paths(md_content)
-            
-            # マークダウンに設定
-            self.preview_content_ref.current.value = md_content
-            self.preview_content_ref.current.update()
+        if not self.preview_content_ref.current:
+            return
         
-        self.preview_container.update()
+        self._preview_seq += 1
+        md_content = self.content_field.value or ""
+        
+        # 前回反映した本文から変わっていなければ処理も画面更新も行わない
+        if md_content == self._last_rendered_text:
+            return
         
-    def _process_markdown_image_paths(self, md_text):
+        self.app.page.run_task(self._render_preview_content, md_content, self._preview_seq)
+    
+    async def _render_preview_content(self, md_content, seq):
         """
-        マークダウン内の画像パスを表示用に処理します。
-        Base64エンコードを使わず、file:// プロトコルを使用します。
+        プレビュー用のマークダウンを処理してMarkdownウィジェットに設定します。
         
         Args:
-            md_text (str): 処理するマークダウンテキスト
-            
-        Returns:
-            str: 画像パスが処理されたマークダウンテキスト
+            md_content (str): 本文のマークダウンテキスト
+            seq (int): 更新要求の通し番号
         """
         try:
-            # マークダウンの画像パターン: ![alt](path)
-            img_pattern = r'!\[.*?\]\((.*?)\)'
+            # 画像パスをフルパスに変換（本文が変わっていなければキャッシュを使用）
+            processed = await asyncio.to_thread(_render_preview_markdown, md_content)
             
-            def replace_img_path(match):
-                img_path = match.group(1)
-                
-                # 既にURLや埋め込み画像の場合はそのまま
-                if img_path.startswith(('http://', 'https://', 'data:')):
-                    return match.group(0)
-                    
-                # 既にfile://で始まる場合は そのまま返す
-                if img_path.startswith('file://'):
-                    return match.group(0)
-                
-                # ローカルパスの場合は適切なURIに変換
-                if os.path.exists(img_path):
-                    # 絶対パスに変換
-                    abs_path = os.path.abspath(img_path)
-                    
-                    # パスを変換
-                    if os.name == 'nt':  # Windows
-                        # バックスラッシュをスラッシュに変換
-                        abs_path = abs_path.replace('\\', '/')
-                        # file:///C:/path 形式のURIを作成
-                        img_uri = f"file:///{abs_path}"
-                    else:  # Unix系
-                        img_uri = f"file://{abs_path}"
-                    
-                    logger.info(f"画像パス変換: {img_path} -> {img_uri}")
-                    return match.group(0).replace(img_path, img_uri)
-                
-                # ファイルが存在しない場合は警告ログを出力
-                logger.warning(f"画像ファイルが見つかりません: {img_path}")
-                return match.group(0)
+            # 処理中に新しい更新要求があれば破棄する
+            preview = self.preview_content_ref.current
+            if seq != self._preview_seq or preview is None:
+                return
             
-            return re.sub(img_pattern, replace_img_path, md_text)
+            # マークダウンに設定
+            preview.value = processed
+            preview.update()
+            self._last_rendered_text = md_content
         except Exception as e:
-            logger.error(f"画像パス処理エラー: {e}", exc_info=True)
-            return md_text
-    
+            logger.error(f"プレビューの更新中にエラーが発生しました: {e}", exc_info=True)
+        
     def _toggle_realtime_preview(self, e):
         """
         リアルタイムプレビューモードの切り替えを行います。
@@ -542,20 +807,20 @@ class EditorView:
         Args:
             e: イベントデータ
         """
-        # 初期化
-        if not hasattr(self, 'is_realtime_preview'):
-            self.is_realtime_preview = False
-            
         self.is_realtime_preview = not self.is_realtime_preview
         
+        # プレビューの中身が未構築なら構築する
+        if self.is_realtime_preview and self.preview_container.content is None:
+            self.preview_container.content = self._build_preview()
+        
         # フィールドとプレビューの表示切り替え
         self.content_field.visible = not self.is_realtime_preview
         self.preview_container.visible = self.is_realtime_preview
         
         # プレビューモードなら、マークダウンをHTMLに変換して表示
         if self.is_realtime_preview:
-            # プレビューコンテンツを更新
-            self._update_realtime_preview_title()
+            # プレビューコンテンツを更新（画面への反映は最後にまとめて行う）
+            self._update_realtime_preview_title(update=False)
             self._update_realtime_preview_content()
             
         # ボタンのテキスト更新
@@ -567,26 +832,34 @@ class EditorView:
             
             if self.is_realtime_preview:
                 button.text = "編集モードに戻る"
-                button.icon = ft.icons.EDIT
+                button.icon = _ICON_EDIT
             else:
                 button.text = "記事表示モード"
-                button.icon = ft.icons.ARTICLE_OUTLINED
-                
-            button.update()
+                button.icon = _ICON_ARTICLE
         except Exception as e:
             logger.error(f"プレビューボタンの更新中にエラーが発生しました: {e}", exc_info=True)
         
-        self.preview_container.update()
-        self.content_field.update()
-        self.preview_container.content.update()
+        # 変更をまとめて一度だけ送信する
+        self.app.page.update()
         
-    def _update_realtime_preview_title(self):
+    def _update_realtime_preview_title(self, update=True):
         """
         リアルタイムプレビューのタイトルを更新します。
+        
+        Args:
+            update (bool): 画面へすぐに反映するかどうか
         """
-        if self.preview_title_ref.current:
-            self.preview_title_ref.current.value = self.title_field.value
-            self.app.page.update()
+        preview_title = self.preview_title_ref.current
+        if not preview_title:
+            return
+        
+        # タイトルが変わっていなければ画面更新を行わない
+        if preview_title.value == self.title_field.value:
+            return
+        
+        preview_title.value = self.title_field.value
+        if update:
+            preview_title.update()
             
     def _on_preview_title_change(self, e):
         """
@@ -615,8 +888,13 @@ class EditorView:
             # 画像パスを保存可能な形式に処理
             content = self._prepare_markdown_for_save(content)
             
+            # 保存を区切りに画像パスの存在確認結果を破棄する
+            _image_path_to_uri.cache_clear()
+            _process_preview_block.cache_clear()
+            _render_preview_markdown.cache_clear()
+            
             # タグを分割
-            tags = [tag.strip() for tag in self.tag_field.value.split(",") if tag.strip()]
+            tags = [tag for tag in _TAG_SPLIT.split((self.tag_field.value or "").strip()) if tag]
             
             # 気分スコア
             mood = self.mood_tracker.selected_mood or 3
@@ -629,9 +907,7 @@ class EditorView:
                     mood=mood,
                     tags=tags,
                 )
-                self.diary_manager.save_entry(entry)
-                entry_id = entry.id
-                logger.info(f"新しい日記エントリーを作成しました: ID={entry_id}")
+                message = "新しい日記エントリーを作成しました"
             else:
                 # 既存エントリーの更新
                 self.current_entry.update(
@@ -640,16 +916,18 @@ class EditorView:
                     mood=mood,
                     tags=tags,
                 )
-                self.diary_manager.save_entry(self.current_entry)
-                entry_id = self.current_entry.id
-                logger.info(f"日記エントリーを更新しました: ID={entry_id}")
+                entry = self.current_entry
+                message = "日記エントリーを更新しました"
             
-            # 成功メッセージを表示
-            self.app.page.show_snack_bar(
-                ft.SnackBar(ft.Text("日記を保存しました！"))
-            )
+            # 保存できなかった場合は成功メッセージを表示せず、エラーとして扱う
+            if self.diary_manager.save_entry(entry) is None:
+                raise RuntimeError("日記エントリーを保存できませんでした")
+            logger.info(f"{message}: ID={entry.id}")
+            
+            # 成功メッセージを設定
+            self.app.page.snack_bar = ft.SnackBar(ft.Text("日記を保存しました！"), open=True)
             
-            # ホーム画面に戻る
+            # ホーム画面に戻る（ここでページが更新される）
             self.app.navigate("home")
             
         except Exception as e:
@@ -672,9 +950,6 @@ class EditorView:
             str: 保存用に処理されたマークダウンテキスト
         """
         try:
-            # 画像参照パターン: ![alt](path)
-            img_pattern = r'!\[.*?\]\((.*?)\)'
-            
             def process_image_path(match):
                 img_path = match.group(1)
                 
@@ -695,7 +970,7 @@ class EditorView:
                 # その他の場合（既に相対パスなど）
                 return match.group(0)
             
-            return re.sub(img_pattern, process_image_path, md_text)
+            return _IMG_PATTERN.sub(process_image_path, md_text)
         
         except Exception as e:
             logger.error(f"マークダウン保存前処理エラー: {e}", exc_info=True)
@@ -716,32 +991,33 @@ class EditorView:
         
         # 確認ダイアログを表示
         def close_dialog(e):
-            # ダイアログを閉じる
+            # ダイアログを閉じる（画面への反映は各分岐の最後に一度だけ行う）
             dialog.open = False
-            self.app.page.update()
             
-            # 削除ボタンが押された場合
-            if e.control.text == "削除":
-                try:
-                    # エントリーを削除
-                    self.diary_manager.delete_entry(self.current_entry.id)
-                    logger.info(f"日記エントリーを削除しました: ID={self.current_entry.id}")
-                    
-                    # 成功メッセージを表示
-                    self.app.page.show_snack_bar(
-                        ft.SnackBar(ft.Text("日記を削除しました"))
-                    )
-                    
-                    # ホーム画面に戻る
-                    self.app.navigate("home")
-                    
-                except Exception as ex:
-                    logger.error(f"日記の削除中にエラーが発生しました: {ex}")
-                    
-                    # エラーメッセージを表示
-                    self.app.page.show_snack_bar(
-                        ft.SnackBar(ft.Text(f"エラー: 日記の削除に失敗しました"))
-                    )
+            # キャンセルの場合は閉じるだけ
+            if e.control.text != "削除":
+                self.app.page.update()
+                return
+            
+            try:
+                # エントリーを削除
+                self.diary_manager.delete_entry(self.current_entry.id)
+                logger.info(f"日記エントリーを削除しました: ID={self.current_entry.id}")
+                
+                # 成功メッセージを設定
+                self.app.page.snack_bar = ft.SnackBar(ft.Text("日記を削除しました"), open=True)
+                
+                # ホーム画面に戻る（ここでページが更新される）
+                self.app.navigate("home")
+                
+            except Exception as ex:
+                logger.error(f"日記の削除中にエラーが発生しました: {ex}")
+                
+                # エラーメッセージを表示
+                self.app.page.snack_bar = ft.SnackBar(
+                    ft.Text(f"エラー: 日記の削除に失敗しました"), open=True
+                )
+                self.app.page.update()
         
         # 確認ダイアログ
         dialog = ft.AlertDialog(
@@ -768,150 +1044,169 @@ class EditorView:
         # 現在のテキストを取得
         current_value = self.content_field.value or ""
         
-        # 最後の単語を抽出（簡易的な実装）
-        words = current_value.split()
-        if not words:
+        # 最後の単語の範囲を末尾から求める（文書全体を分割しない）
+        end = len(current_value.rstrip())
+        if not end:
             return
+        start = end
+        while start > 0 and not current_value[start - 1].isspace():
+            start -= 1
             
-        last_word = words[-1]
+        raw_word = current_value[start:end]
+        last_word = raw_word
         # 句読点などを分離
         punctuation = ''
-        if last_word and last_word[-1] in ['.', ',', '!', '?', ')', ']', '}']:
+        if last_word and last_word[-1] in _TRAILING_PUNCTUATION:
             punctuation = last_word[-1]
             last_word = last_word[:-1]
             
         if not last_word:
             return
+        
+        markers = _ACTIVE_FORMAT_MARKERS.get(self.active_format)
+        if markers is None:
+            return
+        opening, closing = markers
+        
+        # 既にフォーマット済みの単語には再適用しない（句読点込みでも判定する）
+        for word in (raw_word, last_word):
+            if len(word) > len(opening) + len(closing) and word.startswith(opening) and word.endswith(closing):
+                return
             
         # フォーマットを適用
-        formatted_word = last_word
-        if self.active_format == "bold":
-            formatted_word = f"**{last_word}**"
-        elif self.active_format == "italic":
-            formatted_word = f"*{last_word}*"
-        elif self.active_format == "underline":
-            formatted_word = f"<u>{last_word}</u>"
-        elif self.active_format == "strikethrough":
-            formatted_word = f"~~{last_word}~~"
-        elif self.active_format == "code":
-            formatted_word = f"`{last_word}`"
-        elif self.active_format == "link":
-            formatted_word = f"[{last_word}](https://example.com)"
+        formatted_word = "".join((opening, last_word, closing))
             
         # 句読点を戻す
         formatted_word += punctuation
             
-        # テキストを置換
-        words[-1] = formatted_word
-        self.content_field.value = ' '.join(words)
+        # テキストを置換（単語以外の空白や改行はそのまま残す）
+        self.content_field.value = "".join((current_value[:start], formatted_word, current_value[end:]))
         self.content_field.update()
         
         # リアルタイムプレビューの更新
-        if hasattr(self, 'is_realtime_preview') and self.is_realtime_preview:
+        if self.is_realtime_preview:
             self._update_realtime_preview_content() 
     
+    def _build_action_buttons(self, is_markdown):
+        """
+        保存ボタンなどのアクションボタンを構築します。
+        構築済みの場合は保存形式ボタンの表示だけを更新して再利用します。
+        
+        Args:
+            is_markdown (bool): マークダウン形式で保存するかどうか
+            
+        Returns:
+            ft.Row: アクションボタンのUI
+        """
+        if self._action_buttons is None:
+            self._format_toggle_button = ft.OutlinedButton(
+                icon=_ICON_CODE,
+                on_click=self._on_format_toggle,
+                tooltip="マークダウンとリッチテキスト形式を切り替えます",
+            )
+            self._action_buttons = ft.Row([
+                ft.FilledButton(
+                    text="保存",
+                    icon=_ICON_SAVE,
+                    on_click=self._on_save_click,
+                ),
+                ft.OutlinedButton(
+                    text="記事表示モード",
+                    icon=_ICON_VISIBILITY,
+                    on_click=self._on_preview_click,
+                ),
+                self._format_toggle_button,
+            ])
+        
+        self._format_toggle_button.text = f"{'マークダウン' if is_markdown else 'リッチテキスト'}として保存"
+        return self._action_buttons
+    
+    def _on_toolbar_syntax_click(self, name, e):
+        """
+        囲み型の書式ボタンがクリックされたときのイベントハンドラ。
+        
+        Args:
+            name (str): _SYNTAX_ACTIONSのキー
+            e: イベントデータ
+        """
+        prefix, suffix = self._SYNTAX_ACTIONS[name]
+        self._insert_markdown_syntax(prefix, suffix)
+    
+    def _on_toolbar_prefix_click(self, name, e):
+        """
+        行頭型の書式ボタンがクリックされたときのイベントハンドラ。
+        
+        Args:
+            name (str): _PREFIX_ACTIONSのキー
+            e: イベントデータ
+        """
+        self._insert_markdown_prefix(self._PREFIX_ACTIONS[name])
+    
     def _build_formatting_toolbar(self):
         """
         テキスト書式設定用のツールバーを構築します。
+        構築済みの場合はそれを再利用します。
         
         Returns:
             ft.Row: 書式設定ツールバーのUI
         """
-        return ft.Row([
-            ft.IconButton(
-                icon=ft.icons.FORMAT_BOLD,
-                icon_color=ft.colors.PRIMARY,
-                tooltip="太字",
-                on_click=lambda e: self._insert_markdown_syntax("**", "**"),
-            ),
-            ft.IconButton(
-                icon=ft.icons.FORMAT_ITALIC,
-                icon_color=ft.colors.PRIMARY,
-                tooltip="斜体",
-                on_click=lambda e: self._insert_markdown_syntax("*", "*"),
-            ),
-            ft.IconButton(
-                icon=ft.icons.FORMAT_UNDERLINED,
-                icon_color=ft.colors.PRIMARY,
-                tooltip="下線",
-                on_click=lambda e: self._insert_markdown_syntax("<u>", "</u>"),
-            ),
-            ft.IconButton(
-                icon=ft.icons.FORMAT_STRIKETHROUGH,
-                icon_color=ft.colors.PRIMARY,
-                tooltip="取り消し線",
-                on_click=lambda e: self._insert_markdown_syntax("~~", "~~"),
-            ),
-            ft.VerticalDivider(width=1),
-            ft.IconButton(
-                icon=ft.icons.FORMAT_LIST_BULLETED,
-                icon_color=ft.colors.PRIMARY,
-                tooltip="箇条書き",
-                on_click=lambda e: self._insert_markdown_prefix("- "),
-            ),
-            ft.IconButton(
-                icon=ft.icons.FORMAT_LIST_NUMBERED,
-                icon_color=ft.colors.PRIMARY,
-                tooltip="番号付きリスト",
-                on_click=lambda e: self._insert_markdown_prefix("1. "),
-            ),
-            ft.IconButton(
-                icon=ft.icons.FORMAT_QUOTE,
-                icon_color=ft.colors.PRIMARY,
-                tooltip="引用",
-                on_click=lambda e: self._insert_markdown_prefix("> "),
-            ),
-            ft.VerticalDivider(width=1),
-            # 見出しドロップダウン
-            ft.PopupMenuButton(
-                icon=ft.icons.TITLE,
-                tooltip="見出し",
-                items=[
-                    ft.PopupMenuItem(
-                        text="見出し 1",
-                        on_click=lambda e: self._insert_markdown_prefix("# "),
-                    ),
-                    ft.PopupMenuItem(
-                        text="見出し 2",
-                        on_click=lambda e: self._insert_markdown_prefix("## "),
-                    ),
-                    ft.PopupMenuItem(
-                        text="見出し 3",
-                        on_click=lambda e: self._insert_markdown_prefix("### "),
-                    ),
-                ],
-            ),
-            ft.IconButton(
-                icon=ft.icons.CODE,
-                icon_color=ft.colors.PRIMARY,
-                tooltip="コード",
-                on_click=lambda e: self._insert_markdown_syntax("```", "```"),
-            ),
-            ft.IconButton(
-                icon=ft.icons.LINK,
-                icon_color=ft.colors.PRIMARY,
-                tooltip="リンク",
-                on_click=lambda e: self._insert_markdown_syntax("[", "](https://example.com)"),
-            ),
-        ], scroll=ft.ScrollMode.AUTO)
+        if self._formatting_toolbar is not None:
+            return self._formatting_toolbar
+        
+        # 配置表からボタンを生成し、グループの間に区切り線を入れる
+        handlers = {
+            "syntax": self._on_toolbar_syntax_click,
+            "prefix": self._on_toolbar_prefix_click,
+        }
+        controls = []
+        for group in self._TOOLBAR_GROUPS:
+            if controls:
+                controls.append(ft.VerticalDivider(width=1))
+            for kind, name, icon, tooltip in group:
+                if kind == "heading":
+                    # 見出しドロップダウン
+                    controls.append(ft.PopupMenuButton(
+                        icon=icon,
+                        tooltip=tooltip,
+                        items=[
+                            ft.PopupMenuItem(
+                                text=text,
+                                on_click=functools.partial(self._on_toolbar_prefix_click, item),
+                            )
+                            for item, text in self._HEADING_ITEMS
+                        ],
+                    ))
+                else:
+                    controls.append(ft.IconButton(
+                        icon=icon,
+                        icon_color=ft.colors.PRIMARY,
+                        tooltip=tooltip,
+                        on_click=functools.partial(handlers[kind], name),
+                    ))
+        
+        self._formatting_toolbar = ft.Row(controls, scroll=ft.ScrollMode.AUTO)
+        return self._formatting_toolbar
         
     def _build_media_toolbar(self):
         """
         メディア挿入用のツールバーを構築します。
+        構築済みの場合はそれを再利用します。
         
         Returns:
             ft.Row: メディアツールバーのUI
         """
-        return ft.Row([
+        if self._media_toolbar is not None:
+            return self._media_toolbar
+        
+        self._media_toolbar = ft.Row([
             ft.ElevatedButton(
                 "画像を追加",
                 icon=ft.icons.IMAGE,
-                style=ft.ButtonStyle(
-                    shape=ft.RoundedRectangleBorder(radius=10),
-                ),
+                style=self._SHARED_BUTTON_STYLE,
                 on_click=self._on_add_media_click,
             ),
         ], alignment=ft.MainAxisAlignment.END)
+        return self._media_toolbar
     
     def _build_preview(self):
         """
@@ -1006,13 +1301,13 @@ class EditorView:
             # ボタンテキストを更新
             new_text = "リッチテキスト" if self.current_entry.is_markdown else "マークダウン"
             e.control.text = f"{new_text}として保存"
-            e.control.update()
             
-            # ユーザーに通知
+            # ユーザーに通知（ボタンの変更と合わせて一度の更新で送信する）
             format_name = "マークダウン" if self.current_entry.is_markdown else "リッチテキスト"
-            self.app.page.show_snack_bar(
-                ft.SnackBar(ft.Text(f"保存形式を{format_name}に変更しました"))
+            self.app.page.snack_bar = ft.SnackBar(
+                ft.Text(f"保存形式を{format_name}に変更しました"), open=True
             )
+            self.app.page.update()
         else:
             # 新規エントリーの場合
             self.app.page.show_snack_bar(
@@ -13,20 +13,34 @@
 
 import flet as ft
 import datetime
-from dateutil.relativedelta import relativedelta
+import calendar
 import logging
+import random
+import functools
+from itertools import zip_longest
 from components.diary_card import DiaryCard
 from components.mood_tracker import MoodTracker
 from components.prompt_card import PromptCard
 
 logger = logging.getLogger(__name__)
 
+# ミニカレンダーのセルで毎回参照する色と配置
+_COLOR_TODAY = ft.colors.PRIMARY_CONTAINER
+_COLOR_ENTRY_DAY = ft.colors.SECONDARY_CONTAINER
+_ALIGN_CENTER = ft.alignment.center
+_TEXT_ALIGN_CENTER = ft.TextAlign.CENTER
+
 class HomeView:
     """
     アプリケーションのホーム画面を構築するクラス。
     ユーザーの最近の日記エントリーと概要情報を表示します。
     """
     
+    # ボタン共通のスタイル
+    _SHARED_BUTTON_STYLE = ft.ButtonStyle(
+        shape=ft.RoundedRectangleBorder(radius=10),
+    )
+    
     def __init__(self, app):
         """
         HomeViewクラスのコンストラクタ。
@@ -37,11 +51,38 @@ class HomeView:
         self.app = app
         self.diary_manager = app.diary_manager
         
+        # 月間カレンダーの表のキャッシュ {(年, 月, 今日): 表}（データ更新時に破棄する）
+        self._month_table_cache = {}
+        self._month_table_version = self.diary_manager.version
+        
+        # 「最近の日記」に表示する件数
+        self.recent_limit = 5
+        
+        # 今日の日付の表示のキャッシュ (日付, 日付表示のコンテナ)
+        self._date_cache = None
+        
+        # クイックアクセスボタンの行（内容が変わらないので一度だけ作成する）
+        self._quick_access = None
+        
+        # 今日のエントリーのキャッシュ (日付, データのバージョン, エントリーのリスト)
+        self._today_entries_cache = None
+        
         # 日本語の曜日
         self.weekdays_ja = ["月曜日", "火曜日", "水曜日", "木曜日", "金曜日", "土曜日", "日曜日"]
         
-        # プロンプトのリスト
-        self.prompts = [
+        # 月に依存しない固定のコントロール（ミニカレンダーの曜日のヘッダー行）
+        self._weekday_header = ft.Row([
+            ft.Container(
+                ft.Text(day, size=12, weight=ft.FontWeight.BOLD, text_align=ft.TextAlign.CENTER),
+                width=30,
+                height=30,
+                alignment=ft.alignment.center,
+            )
+            for day in ("月", "火", "水", "木", "金", "土", "日")
+        ], alignment=ft.MainAxisAlignment.SPACE_BETWEEN)
+        
+        # プロンプトのリスト（変更しないのでタプルで保持）
+        self.prompts = (
             "今日の最高の瞬間は何でしたか？",
             "誰かに感謝したいことはありますか？",
             "今日学んだことを書き留めましょう",
@@ -49,7 +90,10 @@ class HomeView:
             "今週のハイライトを振り返りましょう",
             "今の気持ちを言葉にしてみましょう",
             "自分を褒めたいことは何ですか？"
-        ]
+        )
+        
+        # 今日表示するプロンプトのキャッシュ (日付, プロンプト)
+        self._prompt_cache = None
     
     def build(self):
         """
@@ -58,55 +102,40 @@ class HomeView:
         Returns:
             ft.Container: ホーム画面のUIコンテナ
         """
-        # 今日の日付と曜日
-        today = datetime.datetime.now()
-        weekday_index = today.weekday()
-        weekday_ja = self.weekdays_ja[weekday_index]
-        
-        # 日付と曜日の表示
-        date_display = ft.Container(
-            content=ft.Column([
-                ft.Text(
-                    f"{today.year}年{today.month}月{today.day}日",
-                    size=28,
-                    weight=ft.FontWeight.BOLD,
-                ),
-                ft.Text(
-                    weekday_ja,
-                    size=18,
-                    weight=ft.FontWeight.W_300,
-                    italic=True,
-                )
-            ]),
-            margin=ft.margin.only(bottom=20)
-        )
+        # 日付と曜日の表示（日付が変わるまでは前回のコンテナを再利用）
+        today = datetime.date.today()
+        if self._date_cache is None or self._date_cache[0] != today:
+            self._date_cache = (today, self._build_date_display(today))
+        date_display = self._date_cache[1]
         
         # クイックアクセスボタン
-        quick_access = ft.Row([
-            ft.ElevatedButton(
-                "新規作成",
-                icon=ft.icons.ADD,
-                style=ft.ButtonStyle(
-                    shape=ft.RoundedRectangleBorder(radius=10),
+        if self._quick_access is None:
+            self._quick_access = ft.Row([
+                ft.ElevatedButton(
+                    "新規作成",
+                    icon=ft.icons.ADD,
+                    style=self._SHARED_BUTTON_STYLE,
+                    on_click=lambda _: self.app.navigate("editor")
                 ),
-                on_click=lambda _: self.app.navigate("editor")
-            ),
-            ft.ElevatedButton(
-                "カレンダー",
-                icon=ft.icons.CALENDAR_TODAY,
-                style=ft.ButtonStyle(
-                    shape=ft.RoundedRectangleBorder(radius=10),
+                ft.ElevatedButton(
+                    "カレンダー",
+                    icon=ft.icons.CALENDAR_TODAY,
+                    style=self._SHARED_BUTTON_STYLE,
+                    on_click=lambda _: self.app.navigate("calendar")
                 ),
-                on_click=lambda _: self.app.navigate("calendar")
-            ),
-        ], wrap=True, spacing=10)
+            ], wrap=True, spacing=10)
+        quick_access = self._quick_access
         
         # 最近の日記
         recent_entries = self._build_recent_entries()
         
-        # プロンプトカード
-        import random
-        random_prompts = random.sample(self.prompts, min(3, len(self.prompts)))
+        # プロンプトカード（お題は1日ごとに選び直す）
+        if self._prompt_cache is None or self._prompt_cache[0] != today:
+            self._prompt_cache = (
+                today,
+                random.sample(self.prompts, min(3, len(self.prompts))),
+            )
+        random_prompts = self._prompt_cache[1]
         prompt_cards = ft.Column([
             PromptCard(
                 prompt=prompt,
@@ -171,11 +200,11 @@ class HomeView:
         最近の日記エントリーのリストを構築します。
         
         Returns:
-            ft.Column: 最近の日記エントリーを表示するカラム
+            ft.ListView: 最近の日記エントリーを表示するリスト
         """
         try:
-            # 最近の日記エントリーを取得（最大5件）
-            entries = self.diary_manager.get_all_entries()[:5]
+            # 最近の日記エントリーを取得（最大recent_limit件）
+            entries = self.diary_manager.get_all_entries(limit=self.recent_limit)
             
             if not entries:
                 return ft.Container(
@@ -184,26 +213,56 @@ class HomeView:
                     alignment=ft.alignment.center
                 )
             
+            # 全カードで共通の「今日」を一度だけ計算
+            today = datetime.date.today()
+            
             entry_cards = []
             for entry in entries:
                 entry_card = DiaryCard(
                     entry=entry,
-                    on_click=lambda e, entry_id=entry.id: self._open_entry(entry_id)
+                    on_click=functools.partial(self._open_entry, entry.id),
+                    today=today,
                 )
                 entry_cards.append(entry_card)
             
-            return ft.Column(
-                entry_cards,
+            # 表示範囲外のカードは描画されないListViewで表示する
+            return ft.ListView(
+                controls=entry_cards,
                 spacing=10,
-                scroll=ft.ScrollMode.AUTO,
-                auto_scroll=False,
-                height=400
+                height=400,
             )
         
         except Exception as e:
             logger.error(f"最近の日記エントリーの取得中にエラーが発生しました: {e}")
             return ft.Text("エントリーの読み込み中にエラーが発生しました")
     
+    def _build_date_display(self, today):
+        """
+        今日の日付と曜日の表示を構築します。
+        
+        Args:
+            today (datetime.date): 今日の日付
+            
+        Returns:
+            ft.Container: 日付と曜日の表示のコンテナ
+        """
+        return ft.Container(
+            content=ft.Column([
+                ft.Text(
+                    f"{today.year}年{today.month}月{today.day}日",
+                    size=28,
+                    weight=ft.FontWeight.BOLD,
+                ),
+                ft.Text(
+                    self.weekdays_ja[today.weekday()],
+                    size=18,
+                    weight=ft.FontWeight.W_300,
+                    italic=True,
+                )
+            ]),
+            margin=ft.margin.only(bottom=20)
+        )
+    
     def _build_month_calendar(self, year, month):
         """
         月間カレンダーを構築します。
@@ -215,92 +274,43 @@ class HomeView:
         Returns:
             ft.Container: カレンダーのコンテナ
         """
-        # 指定された月の最初の日と最後の日
-        first_day = datetime.datetime(year, month, 1)
-        last_day = first_day + relativedelta(months=1, days=-1)
-        
-        # 週の始まりを月曜日とし、最初の日の曜日に合わせて空白を入れる
-        weekday = first_day.weekday()  # 0: 月曜日, 6: 日曜日
-        
-        # 曜日のヘッダー
-        weekday_header = ft.Row([
-            ft.Container(
-                ft.Text(day, size=12, weight=ft.FontWeight.BOLD, text_align=ft.TextAlign.CENTER),
-                width=30,
-                height=30,
-                alignment=ft.alignment.center,
-            )
-            for day in ["月", "火", "水", "木", "金", "土", "日"]
-        ], alignment=ft.MainAxisAlignment.SPACE_BETWEEN)
-        
-        # 日付のグリッド
+        # 日付のグリッド（セルの配置と色はキャッシュした表から作る）
+        weekday, day_cells = self._get_month_table(year, month)
         days = []
         
-        # 空白のセルを追加
-        for _ in range(weekday):
-            days.append(
-                ft.Container(
-                    width=30,
-                    height=30,
-                )
-            )
+        # 週の始まりを月曜日とし、最初の日の曜日に合わせて空白のセルを追加
+        days.extend(self._blank_cell() for _ in range(weekday))
         
-        # 実際の日付を追加
-        entries_by_day = {}
-        try:
-            # この月の日記エントリーを取得し、日付ごとにグループ化
-            month_entries = self.diary_manager.get_entries_by_date(year, month)
-            for entry in month_entries:
-                day = entry.created_at.day
-                if day not in entries_by_day:
-                    entries_by_day[day] = []
-                entries_by_day[day].append(entry)
-        except Exception as e:
-            logger.error(f"月間エントリーの取得中にエラーが発生しました: {e}")
-        
-        # 日付セルを作成
-        today = datetime.datetime.now().date()
-        for day in range(1, last_day.day + 1):
-            # 日付が今日かどうかをチェック
-            is_today = (year == today.year and month == today.month and day == today.day)
-            
-            # エントリーがあるかチェック
-            has_entries = day in entries_by_day
-            
-            # 色の設定
-            bg_color = None
-            if is_today:
-                bg_color = ft.colors.PRIMARY_CONTAINER
-            elif has_entries:
-                bg_color = ft.colors.SECONDARY_CONTAINER
-            
+        # 日付セルを作成（ループ内で使うクラスとメソッドはローカル変数に束縛する）
+        container, text, partial = ft.Container, ft.Text, functools.partial
+        on_day_click = self._view_day_entries
+        for day, bg_color in day_cells:
             days.append(
-                ft.Container(
-                    content=ft.Text(str(day), size=12, text_align=ft.TextAlign.CENTER),
+                container(
+                    content=text(str(day), size=12, text_align=_TEXT_ALIGN_CENTER),
                     width=30,
                     height=30,
                     border_radius=15,
                     bgcolor=bg_color,
-                    alignment=ft.alignment.center,
-                    on_click=lambda e, d=day: self._view_day_entries(year, month, d),
+                    alignment=_ALIGN_CENTER,
+                    on_click=partial(on_day_click, year, month, day),
                 )
             )
         
-        # 週ごとに行を作成
-        rows = []
-        for i in range(0, len(days), 7):
-            week = days[i:i+7]
-            rows.append(
-                ft.Row(
-                    week,
-                    alignment=ft.MainAxisAlignment.SPACE_BETWEEN,
-                )
+        # 週ごとに行を作成（最終週の不足分は空白のセルで埋める）
+        cells = iter(days)
+        rows = [
+            ft.Row(
+                [cell if cell is not None else self._blank_cell() for cell in week],
+                alignment=ft.MainAxisAlignment.SPACE_BETWEEN,
             )
+            for week in zip_longest(*[cells] * 7)
+        ]
         
         # カレンダー全体を返す
         return ft.Container(
             content=ft.Column(
-                [weekday_header] + rows,
+                [self._weekday_header] + rows,
                 spacing=5,
             ),
             padding=10,
@@ -308,7 +318,66 @@ class HomeView:
             border_radius=10,
         )
     
-    def _view_day_entries(self, year, month, day):
+    def _blank_cell(self):
+        """
+        ミニカレンダーの空白のセルを作成します。
+        
+        Returns:
+            ft.Container: 空白のセル
+        """
+        return ft.Container(width=30, height=30)
+    
+    def _get_month_table(self, year, month):
+        """
+        月間カレンダーの配置と各日の背景色を取得します。
+        日記データが更新されるか日付が変わるまではキャッシュした結果を返します。
+        
+        Args:
+            year (int): 年
+            month (int): 月
+            
+        Returns:
+            tuple: (最初の日の曜日, ((日, 背景色), ...))
+        """
+        today = datetime.date.today()
+        version = self.diary_manager.version
+        
+        # データが更新された場合はキャッシュを破棄する
+        if self._month_table_version != version:
+            self._month_table_cache.clear()
+            self._month_table_version = version
+        
+        key = (year, month, today)
+        table = self._month_table_cache.get(key)
+        if table is not None:
+            return table
+        
+        # 指定された月の最初の日の曜日（0: 月曜日, 6: 日曜日）と日数
+        weekday, last_day = calendar.monthrange(year, month)
+        
+        entry_days = frozenset()
+        try:
+            # この月で日記エントリーがある日を取得（エントリー本体は不要）
+            entry_days = self.diary_manager.get_entry_days_for_month(year, month)
+        except Exception as e:
+            logger.error(f"月間エントリーの取得中にエラーが発生しました: {e}")
+        
+        today_day = today.day if (year == today.year and month == today.month) else None
+        day_cells = []
+        for day in range(1, last_day + 1):
+            # 色の設定（今日を優先し、次にエントリーのある日）
+            bg_color = None
+            if day == today_day:
+                bg_color = _COLOR_TODAY
+            elif day in entry_days:
+                bg_color = _COLOR_ENTRY_DAY
+            day_cells.append((day, bg_color))
+        
+        table = (weekday, tuple(day_cells))
+        self._month_table_cache[key] = table
+        return table
+    
+    def _view_day_entries(self, year, month, day, e=None):
         """
         指定された日の日記エントリーを表示するためのイベントハンドラ。
         
@@ -316,6 +385,7 @@ class HomeView:
             year (int): 年
             month (int): 月
             day (int): 日
+            e: イベントデータ（未使用）
         """
         # ここでは日付を選択した後の処理を実装
         # カレンダービューに移動して選択した日付の表示など
@@ -325,12 +395,13 @@ class HomeView:
         self.app.selected_date = datetime.datetime(year, month, day)
         self.app.navigate("calendar")
     
-    def _open_entry(self, entry_id):
+    def _open_entry(self, entry_id, e=None):
         """
         指定されたIDの日記エントリーを開くためのイベントハンドラ。
         
         Args:
             entry_id (str): 開く日記エントリーのID
+            e: イベントデータ（未使用）
         """
         # エントリーIDをアプリの状態に保存してエディタービューに移動
         self.app.current_entry_id = entry_id
@@ -346,16 +417,24 @@ class HomeView:
         logger.info(f"気分が選択されました: {mood}")
         
         # 今日のエントリーがあるか確認し、なければ新規作成
-        today = datetime.datetime.now().date()
-        today_entries = self.diary_manager.get_entries_by_date(
-            today.year, today.month, today.day
-        )
+        today_entries = self._get_today_entries()
         
         if today_entries:
             # 今日のエントリーが存在する場合は最初のエントリーの気分を更新
             entry = today_entries[0]
             entry.update(mood=mood)
-            self.diary_manager.save_entry(entry)
+            if self.diary_manager.save_entry(entry) is None:
+                # 保存されていない気分がキャッシュに残らないよう破棄する
+                self._today_entries_cache = None
+                self.app.page.show_snack_bar(
+                    ft.SnackBar(ft.Text("エラー: 気分を保存できませんでした"))
+                )
+                return
+            
+            # 更新はキャッシュ中の同じオブジェクトに反映済みのため、この保存だけでバージョンが進んだ場合はキャッシュを引き継ぐ
+            cache = self._today_entries_cache
+            if cache is not None and cache[1] + 1 == self.diary_manager.version:
+                self._today_entries_cache = (cache[0], self.diary_manager.version, cache[2])
             
             # 成功メッセージを表示
             self.app.page.show_snack_bar(
@@ -366,6 +445,24 @@ class HomeView:
             self.app.current_mood = mood
             self.app.navigate("editor")
     
+    def _get_today_entries(self):
+        """
+        今日の日記エントリーを取得します。
+        日付が変わるか日記データが更新されるまではキャッシュした結果を返します。
+        
+        Returns:
+            list: 今日のDiaryEntryオブジェクトのリスト
+        """
+        today = datetime.date.today()
+        version = self.diary_manager.version
+        cache = self._today_entries_cache
+        if cache is not None and cache[0] == today and cache[1] == version:
+            return cache[2]
+        
+        entries = self.diary_manager.get_entries_by_date(today.year, today.month, today.day)
+        self._today_entries_cache = (today, version, entries)
+        return entries
+    
     def _on_prompt_selected(self, prompt):
         """
         プロンプトが選択されたときのイベントハンドラ。
@@ -13,20 +13,225 @@
 
 import flet as ft
 import logging
-import json
 import os
 from pathlib import Path
 import datetime
+import time
 import shutil
+import asyncio
+import threading
+import zipfile
+import zlib
+import functools
 
 logger = logging.getLogger(__name__)
 
+# アプリのデータ保存先（ホームディレクトリの解決は起動時に一度だけ行う）
+_DIARIO_DIR = Path.home() / ".diario"
+
+# バックアップファイルの保存先
+_BACKUP_DIR = _DIARIO_DIR / "backup"
+
+# 日記データのディレクトリ
+_DATA_DIR = _DIARIO_DIR / "data"
+
+# 復元時に既存ファイルのCRCを計算する際の読み込み単位
+_CRC_CHUNK_SIZE = 1 << 20
+
+# ハードリンクせずに必ず展開するファイルの接尾辞（SQLiteのデータベースとWAL・共有メモリファイル）
+_NO_LINK_SUFFIXES = (".sqlite", "-wal", "-shm")
+
+def _list_backups():
+    """
+    バックアップファイルの一覧を新しい順に取得します。
+    ディレクトリの更新日時が変わっていなければ前回の走査結果を返します。
+    
+    Returns:
+        tuple: (ファイルパス, 表示用の日時文字列) のタプル
+    """
+    try:
+        mtime_ns = os.stat(_BACKUP_DIR).st_mtime_ns
+    except FileNotFoundError:
+        return ()
+    
+    return _scan_backups(mtime_ns)
+
+@functools.lru_cache(maxsize=1)
+def _scan_backups(mtime_ns):
+    """
+    バックアップディレクトリを走査し、バックアップファイルの一覧を新しい順に作成します。
+    ディレクトリの走査は1回で行い、更新日時は走査時の情報から取得します。
+    
+    Args:
+        mtime_ns (int): バックアップディレクトリの更新日時（キャッシュのキー）
+        
+    Returns:
+        tuple: (ファイルパス, 表示用の日時文字列) のタプル
+    """
+    try:
+        with os.scandir(_BACKUP_DIR) as it:
+            backups = [
+                (entry.stat().st_mtime, entry.path)
+                for entry in it
+                if entry.name.endswith(".zip") and entry.is_file()
+            ]
+    except FileNotFoundError:
+        return ()
+    
+    backups.sort(reverse=True)
+    return tuple(
+        (path, _format_backup_time(time.localtime(mtime)))
+        for mtime, path in backups
+    )
+
+def _format_backup_time(t):
+    """
+    バックアップの日時を表示用の文字列に変換します。
+    datetimeオブジェクトは作らず、time.localtimeの結果から直接組み立てます。
+    
+    Args:
+        t (time.struct_time): ローカル時刻
+        
+    Returns:
+        str: 「YYYY年MM月DD日 HH:MM」形式の文字列
+    """
+    return f"{t.tm_year}年{t.tm_mon:02d}月{t.tm_mday:02d}日 {t.tm_hour:02d}:{t.tm_min:02d}"
+
+def _write_backup_archive(backup_file, diary_manager):
+    """
+    日記データのディレクトリをZIPファイルに書き出します。
+    アーカイブ内のパスは「data/...」とし、復元時にデータディレクトリの親へ展開できるようにします。
+    データベースは開いたまま、その時点の内容を複製したものを格納します。
+    
+    Args:
+        backup_file (Path): 作成するZIPファイルのパス
+        diary_manager (DiaryEntryManager): データベースを複製する日記マネージャー
+    """
+    base_dir = _DATA_DIR.parent
+    db_file = diary_manager.db_file
+    # 使用中のデータベース本体とWAL・共有メモリファイルは直接読まず、複製したものを格納する
+    live_db_files = {db_file.name, f"{db_file.name}-wal", f"{db_file.name}-shm"}
+    db_snapshot = backup_file.with_name(backup_file.name + ".sqlite.tmp")
+    
+    try:
+        diary_manager.copy_database(db_snapshot)
+        
+        # 圧縮率よりも速度を優先し、最速の圧縮レベルにする
+        with zipfile.ZipFile(backup_file, "w", zipfile.ZIP_DEFLATED, compresslevel=1, allowZip64=True) as zf:
+            for root, dirs, files in os.walk(_DATA_DIR):
+                # ディレクトリ自体も登録して、空のディレクトリも復元されるようにする
+                zf.write(root, os.path.relpath(root, base_dir))
+                for name in files:
+                    if Path(root) == db_file.parent and name in live_db_files:
+                        continue
+                    path = os.path.join(root, name)
+                    zf.write(path, os.path.relpath(path, base_dir))
+            zf.write(db_snapshot, os.path.relpath(db_file, base_dir))
+    finally:
+        db_snapshot.unlink(missing_ok=True)
+
+def _stash_data_dir():
+    """
+    復元に失敗した場合に備えて、現在のデータディレクトリを一時ディレクトリに移動します。
+    同じファイルシステム内の名前の変更なので、データ量によらずすぐに終わります。
+    
+    Returns:
+        Path: 一時バックアップのディレクトリ
+    """
+    temp_backup = _DATA_DIR.parent / "data_temp_backup"
+    if temp_backup.exists():
+        shutil.rmtree(temp_backup)
+    if _DATA_DIR.exists():
+        os.replace(_DATA_DIR, temp_backup)
+    return temp_backup
+
+def _file_crc32(path):
+    """
+    ファイルのCRC32を計算します。
+    
+    Args:
+        path (Path): 対象のファイル
+        
+    Returns:
+        int: CRC32の値
+    """
+    crc = 0
+    with open(path, "rb") as f:
+        while chunk := f.read(_CRC_CHUNK_SIZE):
+            crc = zlib.crc32(chunk, crc)
+    return crc
+
+def _link_unchanged_file(info, temp_backup):
+    """
+    ZIP内のファイルと同じ内容のファイルが一時バックアップにあれば、展開せずにハードリンクで配置します。
+    一時バックアップ側のファイルはそのまま残るため、失敗時の巻き戻しには影響しません。
+    
+    Args:
+        info (zipfile.ZipInfo): ZIP内のファイルの情報
+        temp_backup (Path): 一時バックアップのディレクトリ
+        
+    Returns:
+        bool: リンクで配置できた場合はTrue（Falseの場合は通常どおり展開する）
+    """
+    try:
+        # ZIP内のパスは「data/...」。それ以外や親ディレクトリを含むパスは通常の展開に任せる
+        rel = Path(info.filename).relative_to(_DATA_DIR.name)
+        if ".." in rel.parts:
+            return False
+        
+        # データベースは同じinodeを共有すると復元後の書き込みが両方に反映されるため、常に展開する
+        if rel.name.endswith(_NO_LINK_SUFFIXES):
+            return False
+        
+        # サイズが違えば内容も違うため、CRCの計算は同じサイズの場合のみ行う
+        src = temp_backup / rel
+        if src.stat().st_size != info.file_size or _file_crc32(src) != info.CRC:
+            return False
+        
+        dest = _DATA_DIR / rel
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        os.link(src, dest)
+    except (OSError, ValueError):
+        return False
+    return True
+
+def _replace_data_dir(selected_backup, temp_backup):
+    """
+    バックアップの内容をデータディレクトリに展開します。
+    失敗した場合は一時バックアップを元の場所に戻してから例外を送出します。
+    
+    Args:
+        selected_backup (Path): 復元するバックアップファイル
+        temp_backup (Path): 一時バックアップのディレクトリ
+    """
+    try:
+        # バックアップを展開（一時バックアップと同じ内容のファイルは展開せずにリンクする）
+        with zipfile.ZipFile(selected_backup, 'r') as zip_ref:
+            for info in zip_ref.infolist():
+                if not info.is_dir() and _link_unchanged_file(info, temp_backup):
+                    continue
+                zip_ref.extract(info, _DATA_DIR.parent)
+        
+        # 一時バックアップを削除
+        if temp_backup.exists():
+            shutil.rmtree(temp_backup)
+    except Exception:
+        # エラーが発生した場合、展開途中のデータを消して一時バックアップを戻す
+        if temp_backup.exists():
+            if _DATA_DIR.exists():
+                shutil.rmtree(_DATA_DIR)
+            os.replace(temp_backup, _DATA_DIR)
+        raise
+
 class SettingsView:
     """
     アプリケーションの設定画面を構築するクラス。
     ユーザーがアプリの設定を変更するためのインターフェースを提供します。
     """
     
+    # バックアップディレクトリを作成済みかどうか
+    _backup_dir_ready = False
+    
     def __init__(self, app):
         """
         SettingsViewクラスのコンストラクタ。
@@ -46,6 +251,20 @@ class SettingsView:
         self.current_password_field = None
         self.new_password_field = None
         self.confirm_password_field = None
+        self.password_button = None
+        
+        # 最終バックアップ日時の表示と自動バックアップ頻度の選択の参照
+        self.backup_info = None
+        self.backup_frequency_dropdown = None
+        
+        # 最終バックアップ日時の表示文字列（一度調べた結果をバックアップ作成まで再利用する）
+        self._last_backup_label = None
+        
+        # アプリバーのテーマ切り替えボタン（初回のテーマ変更時に取得する）
+        self._theme_action = None
+        
+        # 再起動後にホーム画面へ戻るためのタイマー
+        self._restart_timer = None
     
     def build(self):
         """
@@ -54,6 +273,16 @@ class SettingsView:
         Returns:
             ft.Container: 設定画面のUIコンテナ
         """
+        # 各タブの中身を構築するメソッド（最初のタブ以外は選択されたときに初めて構築する）
+        self._tab_builders = (
+            self._build_appearance_settings,
+            self._build_privacy_settings,
+            self._build_backup_settings,
+            self._build_about_section,
+        )
+        self._tab_built = [False] * len(self._tab_builders)
+        self._tab_built[0] = True
+        
         # 設定カテゴリのタブ
         tabs = ft.Tabs(
             selected_index=0,
@@ -67,20 +296,21 @@ class SettingsView:
                 ft.Tab(
                     text="プライバシー",
                     icon=ft.icons.SECURITY,
-                    content=self._build_privacy_settings(),
+                    content=ft.Container(),
                 ),
                 ft.Tab(
                     text="バックアップ",
                     icon=ft.icons.BACKUP,
-                    content=self._build_backup_settings(),
+                    content=ft.Container(),
                 ),
                 ft.Tab(
                     text="このアプリについて",
                     icon=ft.icons.INFO,
-                    content=self._build_about_section(),
+                    content=ft.Container(),
                 ),
             ],
             expand=1,
+            on_change=self._on_tab_change,
         )
         
         # 戻るボタン
@@ -103,6 +333,22 @@ class SettingsView:
             expand=True,
         )
     
+    def _on_tab_change(self, e):
+        """
+        タブが切り替えられたときのイベントハンドラ。
+        まだ構築していないタブの中身をこのときに構築します。
+        
+        Args:
+            e: イベントデータ
+        """
+        index = e.control.selected_index
+        if self._tab_built[index]:
+            return
+        
+        e.control.tabs[index].content = self._tab_builders[index]()
+        self._tab_built[index] = True
+        e.control.update()
+    
     def _build_appearance_settings(self):
         """
         外観設定のUIを構築します。
@@ -198,7 +444,7 @@ class SettingsView:
         )
         
         # パスワード変更ボタン
-        password_button = ft.ElevatedButton(
+        self.password_button = ft.ElevatedButton(
             "パスワードを設定",
             visible=password_switch.value,
             on_click=self._on_password_change,
@@ -215,7 +461,7 @@ class SettingsView:
                 self.current_password_field,
                 self.new_password_field,
                 self.confirm_password_field,
-                password_button,
+                self.password_button,
                 
                 ft.Container(height=30),  # スペーサー
                 
@@ -234,19 +480,12 @@ class SettingsView:
         Returns:
             ft.Container: バックアップ設定のUIコンテナ
         """
-        # 最終バックアップ日時の取得
-        backup_info = ft.Text("最終バックアップ: なし", italic=True)
-        
-        # バックアップディレクトリをチェック
-        backup_dir = Path.home() / ".diario" / "backup"
-        if backup_dir.exists():
-            # 最新のバックアップファイルを探す
-            backup_files = list(backup_dir.glob("*.zip"))
-            if backup_files:
-                # 最新のバックアップファイルの情報を表示
-                latest_backup = max(backup_files, key=lambda x: x.stat().st_mtime)
-                backup_time = datetime.datetime.fromtimestamp(latest_backup.stat().st_mtime)
-                backup_info.value = f"最終バックアップ: {backup_time.strftime('%Y年%m月%d日 %H:%M')}"
+        # 最終バックアップ日時の取得（未取得の場合のみ最新のバックアップファイルを探す）
+        if self._last_backup_label is None:
+            backups = _list_backups()
+            self._last_backup_label = f"最終バックアップ: {backups[0][1]}" if backups else "最終バックアップ: なし"
+        backup_info = ft.Text(self._last_backup_label, italic=True)
+        self.backup_info = backup_info
         
         # バックアップボタン
         backup_button = ft.ElevatedButton(
@@ -266,6 +505,7 @@ class SettingsView:
         auto_backup_switch = ft.Switch(
             label="自動バックアップ",
             value=False,
+            on_change=self._on_auto_backup_change,
         )
         
         # バックアップ頻度の選択
@@ -279,13 +519,7 @@ class SettingsView:
             value="weekly",
             disabled=not auto_backup_switch.value,
         )
-        
-        # 自動バックアップの切り替え時の処理
-        def on_auto_backup_change(e):
-            backup_frequency.disabled = not e.control.value
-            backup_frequency.update()
-        
-        auto_backup_switch.on_change = on_auto_backup_change
+        self.backup_frequency_dropdown = backup_frequency
         
         # 設定セクション
         return ft.Container(
@@ -360,12 +594,8 @@ class SettingsView:
         Returns:
             str: テーマモードを表す文字列
         """
-        mode_map = {
-            ft.ThemeMode.LIGHT: "light",
-            ft.ThemeMode.DARK: "dark",
-            ft.ThemeMode.SYSTEM: "system"
-        }
-        return mode_map.get(mode, "system")
+        # 対応表はテーマ管理側のものを使う
+        return self.theme_manager._theme_mode_to_string(mode)
     
     def _string_to_theme_mode(self, mode_str):
         """
@@ -377,12 +607,7 @@ class SettingsView:
         Returns:
             ft.ThemeMode: 変換されたテーマモード
         """
-        mode_map = {
-            "light": ft.ThemeMode.LIGHT,
-            "dark": ft.ThemeMode.DARK,
-            "system": ft.ThemeMode.SYSTEM
-        }
-        return mode_map.get(mode_str, ft.ThemeMode.SYSTEM)
+        return self.theme_manager._string_to_theme_mode(mode_str)
     
     def _on_theme_change(self, e):
         """
@@ -400,7 +625,9 @@ class SettingsView:
         self.app.page.theme_mode = theme_mode
         
         # アイコンの更新
-        self.app.page.appbar.actions[0].icon = (
+        if self._theme_action is None:
+            self._theme_action = self.app.page.appbar.actions[0]
+        self._theme_action.icon = (
             ft.icons.WB_SUNNY_OUTLINED 
             if theme_mode == ft.ThemeMode.LIGHT 
             else ft.icons.NIGHTLIGHT_ROUND
@@ -410,6 +637,17 @@ class SettingsView:
         self.app.page.update()
         logger.info(f"テーマモードを変更しました: {selected_value}")
     
+    def _on_auto_backup_change(self, e):
+        """
+        自動バックアップのスイッチが切り替えられたときのイベントハンドラ。
+        
+        Args:
+            e: イベントデータ
+        """
+        if self.backup_frequency_dropdown:
+            self.backup_frequency_dropdown.disabled = not e.control.value
+            self.backup_frequency_dropdown.update()
+    
     def _on_font_size_change(self, e):
         """
         フォントサイズが変更されたときのイベントハンドラ。
@@ -436,21 +674,12 @@ class SettingsView:
         self.new_password_field.visible = is_enabled
         self.confirm_password_field.visible = is_enabled
         
-        # パスワードフィールドの親をたどってボタンを見つける
-        password_button = None
-        for control in e.control.page.controls[0].content.controls[2].tabs[1].content.content.controls:
-            if isinstance(control, ft.ElevatedButton):
-                password_button = control
-                break
+        # 構築時に保持したボタンの表示を切り替え
+        if self.password_button:
+            self.password_button.visible = is_enabled
         
-        if password_button:
-            password_button.visible = is_enabled
-            password_button.update()
-        
-        # フィールドを更新
-        self.current_password_field.update()
-        self.new_password_field.update()
-        self.confirm_password_field.update()
+        # 変更したコントロールをまとめて一度だけ送信する
+        self.app.page.update()
         
         logger.info(f"パスワード保護: {is_enabled}")
     
@@ -491,7 +720,7 @@ class SettingsView:
             
             if self.has_password:
                 # パスワード変更
-                if self.diary_manager.password == current_password:
+                if self.diary_manager.verify_password(current_password):
                     success = self.diary_manager.change_password(new_password)
                 else:
                     self.app.page.show_snack_bar(
@@ -499,30 +728,20 @@ class SettingsView:
                     )
                     return
             else:
-                # 新規パスワード設定
-                self.diary_manager.password = new_password
-                self.diary_manager._init_encryption()
-                # すべてのエントリーを再保存
-                all_entries = self.diary_manager.get_all_entries()
-                for entry in all_entries:
-                    self.diary_manager.save_entry(entry)
-                success = True
+                # 新規パスワード設定（すべてのエントリーを暗号化して1回のコミットで一括保存）
+                success = self.diary_manager.change_password(new_password)
             
             if success:
                 self.has_password = True
-                self.app.page.show_snack_bar(
-                    ft.SnackBar(ft.Text("パスワードを設定しました"))
-                )
                 
                 # フィールドをクリア
                 self.current_password_field.value = ""
                 self.new_password_field.value = ""
                 self.confirm_password_field.value = ""
                 
-                # UIを更新
-                self.current_password_field.update()
-                self.new_password_field.update()
-                self.confirm_password_field.update()
+                # メッセージとフィールドの変更をまとめて一度だけ送信する
+                self.app.page.snack_bar = ft.SnackBar(ft.Text("パスワードを設定しました"), open=True)
+                self.app.page.update()
             else:
                 self.app.page.show_snack_bar(
                     ft.SnackBar(ft.Text("パスワードの設定に失敗しました"))
@@ -542,17 +761,16 @@ class SettingsView:
             e: イベントデータ
         """
         try:
-            # バックアップディレクトリの作成
-            backup_dir = Path.home() / ".diario" / "backup"
-            backup_dir.mkdir(parents=True, exist_ok=True)
+            # バックアップディレクトリの作成（初回のみ）
+            backup_dir = _BACKUP_DIR
+            if not SettingsView._backup_dir_ready:
+                backup_dir.mkdir(parents=True, exist_ok=True)
+                SettingsView._backup_dir_ready = True
             
             # バックアップファイル名の生成
             now = datetime.datetime.now()
             backup_file = backup_dir / f"diario_backup_{now.strftime('%Y%m%d_%H%M%S')}.zip"
             
-            # データディレクトリをZIPにアーカイブ
-            data_dir = Path.home() / ".diario" / "data"
-            
             # ダイアログを表示
             def close_backup_dialog(e):
                 dialog.open = False
@@ -564,12 +782,14 @@ class SettingsView:
                 )
                 
                 # バックアップ情報を更新
-                backup_info = e.control.page.controls[0].content.controls[2].tabs[2].content.content.controls[2]
-                backup_info.value = f"最終バックアップ: {now.strftime('%Y年%m月%d日 %H:%M')}"
-                backup_info.update()
+                self._last_backup_label = f"最終バックアップ: {now.strftime('%Y年%m月%d日 %H:%M')}"
+                if self.backup_info:
+                    self.backup_info.value = self._last_backup_label
+                    self.backup_info.update()
             
-            # バックアップ処理のダイアログ
+            # バックアップ処理のダイアログ（完了するまで閉じられないようにする）
             dialog = ft.AlertDialog(
+                modal=True,
                 title=ft.Text("バックアップ中..."),
                 content=ft.Column([
                     ft.ProgressRing(),
@@ -582,24 +802,8 @@ class SettingsView:
             dialog.open = True
             self.app.page.update()
             
-            # バックアップ処理（実際のアプリではもっと高度な実装が必要）
-            shutil.make_archive(
-                str(backup_file).replace(".zip", ""),
-                'zip',
-                data_dir.parent,
-                data_dir.name
-            )
-            
-            # 完了ダイアログを表示
-            dialog.title = ft.Text("バックアップ完了")
-            dialog.content = ft.Column([
-                ft.Icon(ft.icons.CHECK_CIRCLE, color=ft.colors.GREEN, size=50),
-                ft.Text("バックアップが正常に作成されました。"),
-                ft.TextButton("閉じる", on_click=close_backup_dialog),
-            ], horizontal_alignment=ft.CrossAxisAlignment.CENTER)
-            self.app.page.update()
-            
-            logger.info(f"バックアップを作成しました: {backup_file}")
+            # バックアップ処理はワーカースレッドで行い、その間も画面が応答するようにする
+            self.app.page.run_task(self._run_backup, dialog, backup_file, close_backup_dialog)
             
         except Exception as ex:
             logger.error(f"バックアップ作成中にエラーが発生しました: {ex}")
@@ -607,6 +811,42 @@ class SettingsView:
                 ft.SnackBar(ft.Text(f"エラー: バックアップの作成に失敗しました"))
             )
     
+    async def _run_backup(self, dialog, backup_file, on_close):
+        """
+        バックアップファイルの作成をワーカースレッドで実行し、結果をダイアログに表示します。
+        
+        Args:
+            dialog (ft.AlertDialog): 進捗を表示しているバックアップダイアログ
+            backup_file (Path): 作成するZIPファイルのパス
+            on_close: 完了ダイアログの「閉じる」ボタンのイベントハンドラ
+        """
+        try:
+            # データベースは閉じずに複製し、ファイルを順に読みながらZIPに書き込む
+            await asyncio.to_thread(_write_backup_archive, backup_file, self.diary_manager)
+        except Exception as ex:
+            logger.error(f"バックアップ作成中にエラーが発生しました: {ex}")
+            dialog.open = False
+            self.app.page.snack_bar = ft.SnackBar(
+                ft.Text("エラー: バックアップの作成に失敗しました"), open=True
+            )
+            self.app.page.update()
+            return
+        finally:
+            # バックアップ一覧のキャッシュを破棄（ディレクトリの更新日時の精度が粗い場合に備える）
+            _scan_backups.cache_clear()
+            self._last_backup_label = None
+        
+        # 完了ダイアログを表示
+        dialog.title = ft.Text("バックアップ完了")
+        dialog.content = ft.Column([
+            ft.Icon(ft.icons.CHECK_CIRCLE, color=ft.colors.GREEN, size=50),
+            ft.Text("バックアップが正常に作成されました。"),
+            ft.TextButton("閉じる", on_click=on_close),
+        ], horizontal_alignment=ft.CrossAxisAlignment.CENTER)
+        self.app.page.update()
+        
+        logger.info(f"バックアップを作成しました: {backup_file}")
+    
     def _on_restore(self, e):
         """
         復元ボタンがクリックされたときのイベントハンドラ。
@@ -614,31 +854,23 @@ class SettingsView:
         Args:
             e: イベントデータ
         """
-        # バックアップフォルダをチェック
-        backup_dir = Path.home() / ".diario" / "backup"
-        if not backup_dir.exists() or not list(backup_dir.glob("*.zip")):
+        # バックアップファイルのリストを取得（新しい順）
+        backups = _list_backups()
+        if not backups:
             self.app.page.show_snack_bar(
                 ft.SnackBar(ft.Text("復元可能なバックアップがありません"))
             )
             return
         
         try:
-            # バックアップファイルのリストを取得
-            backup_files = list(backup_dir.glob("*.zip"))
-            backup_files.sort(key=lambda x: x.stat().st_mtime, reverse=True)
-            
             # ドロップダウンのオプションを作成
-            backup_options = []
-            for file in backup_files:
-                backup_time = datetime.datetime.fromtimestamp(file.stat().st_mtime)
-                option_text = f"{backup_time.strftime('%Y年%m月%d日 %H:%M')}"
-                backup_options.append(ft.dropdown.Option(str(file), option_text))
+            backup_options = [ft.dropdown.Option(path, label) for path, label in backups]
             
             # バックアップ選択ドロップダウン
             backup_dropdown = ft.Dropdown(
                 label="復元するバックアップを選択",
                 options=backup_options,
-                value=str(backup_files[0]),
+                value=backups[0][0],
                 width=400,
             )
             
@@ -647,8 +879,9 @@ class SettingsView:
                 dialog.open = False
                 self.app.page.update()
                 
-                # 復元処理のダイアログを表示
+                # 復元処理のダイアログを表示（データベースを閉じている間は操作できないようにする）
                 restore_dialog = ft.AlertDialog(
+                    modal=True,
                     title=ft.Text("復元中..."),
                     content=ft.Column([
                         ft.ProgressRing(),
@@ -660,77 +893,11 @@ class SettingsView:
                 restore_dialog.open = True
                 self.app.page.update()
                 
-                try:
-                    # 選択されたバックアップファイル
-                    selected_backup = Path(backup_dropdown.value)
-                    
-                    # データディレクトリ
-                    data_dir = Path.home() / ".diario" / "data"
-                    
-                    # 既存のデータを一時バックアップ
-                    temp_backup = data_dir.parent / "data_temp_backup"
-                    if temp_backup.exists():
-                        shutil.rmtree(temp_backup)
-                    if data_dir.exists():
-                        shutil.copytree(data_dir, temp_backup)
-                    
-                    try:
-                        # 既存のデータディレクトリをクリア
-                        if data_dir.exists():
-                            shutil.rmtree(data_dir)
-                        
-                        # バックアップを展開
-                        import zipfile
-                        with zipfile.ZipFile(selected_backup, 'r') as zip_ref:
-                            zip_ref.extractall(data_dir.parent)
-                        
-                        # 一時バックアップを削除
-                        if temp_backup.exists():
-                            shutil.rmtree(temp_backup)
-                        
-                        # 完了ダイアログを更新
-                        restore_dialog.title = ft.Text("復元完了")
-                        restore_dialog.content = ft.Column([
-                            ft.Icon(ft.icons.CHECK_CIRCLE, color=ft.colors.GREEN, size=50),
-                            ft.Text("データが正常に復元されました。"),
-                            ft.Text("変更を適用するにはアプリを再起動してください。"),
-                            ft.TextButton("閉じる", on_click=lambda e: self._close_restore_dialog(e, restore_dialog)),
-                        ], horizontal_alignment=ft.CrossAxisAlignment.CENTER)
-                        self.app.page.update()
-                        
-                        logger.info(f"バックアップから復元しました: {selected_backup}")
-                        
-                    except Exception as ex:
-                        # エラーが発生した場合、一時バックアップから復元
-                        if temp_backup.exists():
-                            if data_dir.exists():
-                                shutil.rmtree(data_dir)
-                            shutil.copytree(temp_backup, data_dir)
-                            shutil.rmtree(temp_backup)
-                        
-                        # エラーダイアログを表示
-                        restore_dialog.title = ft.Text("復元エラー")
-                        restore_dialog.content = ft.Column([
-                            ft.Icon(ft.icons.ERROR, color=ft.colors.RED, size=50),
-                            ft.Text("データの復元中にエラーが発生しました。"),
-                            ft.Text("元のデータは保持されています。"),
-                            ft.TextButton("閉じる", on_click=lambda e: self._close_restore_dialog(e, restore_dialog)),
-                        ], horizontal_alignment=ft.CrossAxisAlignment.CENTER)
-                        self.app.page.update()
-                        
-                        logger.error(f"復元中にエラーが発生しました: {ex}")
+                # 選択されたバックアップファイル
+                selected_backup = Path(backup_dropdown.value)
                 
-                except Exception as ex:
-                    # その他のエラー
-                    restore_dialog.title = ft.Text("エラー")
-                    restore_dialog.content = ft.Column([
-                        ft.Icon(ft.icons.ERROR, color=ft.colors.RED, size=50),
-                        ft.Text(f"エラーが発生しました: {str(ex)}"),
-                        ft.TextButton("閉じる", on_click=lambda e: self._close_restore_dialog(e, restore_dialog)),
-                    ], horizontal_alignment=ft.CrossAxisAlignment.CENTER)
-                    self.app.page.update()
-                    
-                    logger.error(f"復元処理でエラーが発生しました: {ex}")
+                # ファイル操作はワーカースレッドで行い、その間も画面が応答するようにする
+                self.app.page.run_task(self._run_restore, restore_dialog, selected_backup)
             
             # 確認ダイアログのキャンセルボタンの処理
             def cancel_restore(e):
@@ -763,6 +930,70 @@ class SettingsView:
                 ft.SnackBar(ft.Text(f"エラー: {str(ex)}"))
             )
     
+    async def _run_restore(self, restore_dialog, selected_backup):
+        """
+        バックアップからの復元をワーカースレッドで実行し、結果をダイアログに表示します。
+        
+        Args:
+            restore_dialog (ft.AlertDialog): 進捗を表示している復元ダイアログ
+            selected_backup (Path): 復元するバックアップファイル
+        """
+        close_button = ft.TextButton("閉じる", on_click=lambda e: self._close_restore_dialog(e, restore_dialog))
+        
+        # データベースを閉じてから、データディレクトリのファイルを移動・展開する
+        self.diary_manager.close()
+        try:
+            try:
+                # 既存のデータを一時バックアップ
+                temp_backup = await asyncio.to_thread(_stash_data_dir)
+            
+                try:
+                    # データディレクトリをバックアップの内容で置き換える
+                    await asyncio.to_thread(_replace_data_dir, selected_backup, temp_backup)
+            
+                    # 完了ダイアログを更新
+                    restore_dialog.title = ft.Text("復元完了")
+                    restore_dialog.content = ft.Column([
+                        ft.Icon(ft.icons.CHECK_CIRCLE, color=ft.colors.GREEN, size=50),
+                        ft.Text("データが正常に復元されました。"),
+                        ft.Text("復元したデータを読み込みました。"),
+                        close_button,
+                    ], horizontal_alignment=ft.CrossAxisAlignment.CENTER)
+                    self.app.page.update()
+            
+                    logger.info(f"バックアップから復元しました: {selected_backup}")
+            
+                except Exception as ex:
+                    # エラーダイアログを表示（元のデータは_replace_data_dirで戻し済み）
+                    restore_dialog.title = ft.Text("復元エラー")
+                    restore_dialog.content = ft.Column([
+                        ft.Icon(ft.icons.ERROR, color=ft.colors.RED, size=50),
+                        ft.Text("データの復元中にエラーが発生しました。"),
+                        ft.Text("元のデータは保持されています。"),
+                        close_button,
+                    ], horizontal_alignment=ft.CrossAxisAlignment.CENTER)
+                    self.app.page.update()
+            
+                    logger.error(f"復元中にエラーが発生しました: {ex}")
+            
+            except Exception as ex:
+                # その他のエラー
+                restore_dialog.title = ft.Text("エラー")
+                restore_dialog.content = ft.Column([
+                    ft.Icon(ft.icons.ERROR, color=ft.colors.RED, size=50),
+                    ft.Text(f"エラーが発生しました: {str(ex)}"),
+                    close_button,
+                ], horizontal_alignment=ft.CrossAxisAlignment.CENTER)
+                self.app.page.update()
+            
+                logger.error(f"復元処理でエラーが発生しました: {ex}")
+        finally:
+            # 復元の成否にかかわらず、データベースを開き直して画面のキャッシュを作り直させる
+            try:
+                self.diary_manager.reopen()
+            except Exception as ex:
+                logger.error(f"復元後のデータベースの再読み込みに失敗しました: {ex}")
+    
     def _close_restore_dialog(self, e, dialog):
         """
         復元完了ダイアログを閉じる処理。
@@ -806,8 +1037,12 @@ class SettingsView:
         Args:
             e: イベントデータ
         """
-        # 現実のアプリでは再起動処理を実装
-        # ここではホーム画面に戻るだけ
+        # プロセスは再起動せず、データベースを開き直してからホーム画面に戻る
+        try:
+            self.diary_manager.reopen()
+        except Exception as ex:
+            logger.error(f"データの再読み込みに失敗しました: {ex}")
+        
         self.app.page.show_snack_bar(
             ft.SnackBar(ft.Text("アプリを再起動します..."))
         )
@@ -826,5 +1061,9 @@ class SettingsView:
         self.app.page.update()
         
         # 遅延処理（実際のアプリでは適切な再起動処理を実装）
-        import threading
-        threading.Timer(1.0, navigate_home).start() 
\ No newline at end of file
+        # 待機中のタイマーがあれば取り消し、重ねて実行されないようにする
+        if self._restart_timer is not None:
+            self._restart_timer.cancel()
+        self._restart_timer = threading.Timer(1.0, navigate_home)
+        self._restart_timer.daemon = True
+        self._restart_timer.start() 
\ No newline at end of file